@@ -12,7 +12,27 @@ except PackageNotFoundError:
 
 __author__ = "Daniel Scholl"
 
-from agent.agent import Agent
-from agent.config import AgentSettings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent.agent import Agent
+    from agent.config import AgentSettings
 
 __all__ = ["Agent", "AgentSettings", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy exports so `import agent` stays cheap.
+
+    Agent pulls in agent_framework and every provider SDK; deferring it keeps
+    CLI paths like `agent --version` from paying that import cost.
+    """
+    if name == "Agent":
+        from agent.agent import Agent
+
+        return Agent
+    if name == "AgentSettings":
+        from agent.config import AgentSettings
+
+        return AgentSettings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,216 @@
 """Core Agent class with multi-provider LLM support."""
 
+import asyncio
+import contextlib
 import logging
 import os
 import re
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from importlib import resources
 from pathlib import Path
 from typing import Any, cast
 
+from agent.cache import ResponseCache, response_cache_key
 from agent.config import load_config
 from agent.config.schema import AgentSettings
+from agent.hashing import cache_key
+from agent.prompt_prefix import PromptPrefix
 from agent.tools.filesystem import FileSystemTools
 from agent.tools.hello import HelloTools
 from agent.tools.toolset import AgentToolset
 
 logger = logging.getLogger(__name__)
 
+# Process-level chat client cache keyed by provider settings. Rebuilding an Agent with
+# the same provider configuration reuses the existing client (SDK import, HTTP client
+# and connection pool) instead of constructing a new one.
+_chat_client_cache: dict[tuple[str, str], Any] = {}
+
+# Foundry clients own an async Azure credential that is closed together with the
+# client, so they are never shared between Agent instances.
+_UNCACHED_PROVIDERS = {"foundry"}
+
+# Streaming: chunks are buffered in a bounded queue and handed to the consumer in
+# batches, so a fast stream costs one consumer wake-up per batch, not per token.
+STREAM_QUEUE_SIZE = 64
+STREAM_MAX_BATCH = 16
+_STREAM_END = object()
+
+
+def _chat_client_cache_key(settings: AgentSettings) -> tuple[str, str]:
+    """Build cache key for the chat client of the active provider.
+
+    The key hashes the full provider configuration so API keys are not retained
+    in plaintext as dictionary keys.
+
+    Args:
+        settings: Agent settings with the active provider
+
+    Returns:
+        Tuple of (provider name, provider configuration digest)
+    """
+    provider = settings.llm_provider
+    provider_config = getattr(settings.providers, provider, None)
+    fingerprint = provider_config.model_dump_json() if provider_config is not None else ""
+    return provider, cache_key(fingerprint).hex()
+
+
+def clear_chat_client_cache() -> None:
+    """Drop all cached chat clients.
+
+    Call after closing a cached client so later Agent instances build a new one.
+    """
+    _chat_client_cache.clear()
+
+
+def _openai_chat_client(settings: AgentSettings) -> Any:
+    """Create OpenAI chat client on the shared HTTP connection pool."""
+    from agent_framework.openai import OpenAIChatClient
+
+    # Without a configured key, let the framework resolve it (env/.env) and
+    # raise its own initialization error if missing
+    if not settings.openai_api_key:
+        return OpenAIChatClient(model_id=settings.openai_model)
+
+    from openai import AsyncOpenAI
+
+    from agent.utils.http import get_shared_http_client
+
+    return OpenAIChatClient(
+        model_id=settings.openai_model,
+        async_client=AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=get_shared_http_client(),
+        ),
+    )
+
+
+def _anthropic_chat_client(settings: AgentSettings) -> Any:
+    """Create Anthropic chat client with prompt caching on the shared HTTP pool."""
+    from agent.providers.anthropic import CachingAnthropicClient
+
+    if not settings.anthropic_api_key:
+        return CachingAnthropicClient(model_id=settings.anthropic_model)
+
+    from anthropic import AsyncAnthropic
+
+    from agent.utils.http import get_shared_http_client
+
+    return CachingAnthropicClient(
+        model_id=settings.anthropic_model,
+        anthropic_client=AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=get_shared_http_client(),
+        ),
+    )
+
+
+def _azure_chat_client(settings: AgentSettings) -> Any:
+    """Create Azure OpenAI chat (or responses) client with API key or Azure CLI auth."""
+    from agent_framework.azure import AzureOpenAIChatClient, AzureOpenAIResponsesClient
+    from azure.identity import AzureCliCredential, DefaultAzureCredential
+
+    # gpt-5-codex requires the responses endpoint, use AzureOpenAIResponsesClient
+    # gpt-5-mini and others use chat completions endpoint, use AzureOpenAIChatClient
+    deployment_name = settings.azure_openai_deployment or ""
+    use_responses_client = "codex" in deployment_name.lower()
+    client_class = AzureOpenAIResponsesClient if use_responses_client else AzureOpenAIChatClient
+
+    # Use API key if provided, otherwise use Azure CLI credential
+    if settings.azure_openai_api_key:
+        return client_class(
+            endpoint=settings.azure_openai_endpoint,
+            deployment_name=settings.azure_openai_deployment,
+            api_version=settings.azure_openai_api_version,
+            api_key=settings.azure_openai_api_key,
+        )
+
+    # Try AzureCliCredential first, fall back to DefaultAzureCredential
+    credential: AzureCliCredential | DefaultAzureCredential
+    try:
+        credential = AzureCliCredential()
+        return client_class(
+            endpoint=settings.azure_openai_endpoint,
+            deployment_name=settings.azure_openai_deployment,
+            api_version=settings.azure_openai_api_version,
+            credential=credential,
+        )
+    except Exception:
+        credential = DefaultAzureCredential()
+        return client_class(
+            endpoint=settings.azure_openai_endpoint,
+            deployment_name=settings.azure_openai_deployment,
+            api_version=settings.azure_openai_api_version,
+            credential=credential,
+        )
+
+
+def _foundry_chat_client(settings: AgentSettings) -> Any:
+    """Create Azure AI Foundry agent client with Azure CLI auth."""
+    from agent_framework.azure import AzureAIAgentClient
+    from azure.identity.aio import AzureCliCredential as AsyncAzureCliCredential
+
+    return AzureAIAgentClient(
+        project_endpoint=settings.azure_project_endpoint,
+        model_deployment_name=settings.azure_model_deployment,
+        async_credential=AsyncAzureCliCredential(),
+    )
+
+
+def _gemini_chat_client(settings: AgentSettings) -> Any:
+    """Create Google Gemini chat client."""
+    from agent.providers.gemini import GeminiChatClient
+
+    return GeminiChatClient(
+        model_id=settings.gemini_model,
+        api_key=settings.gemini_api_key,
+        project_id=settings.gemini_project_id,
+        location=settings.gemini_location,
+        use_vertexai=settings.gemini_use_vertexai,
+    )
+
+
+def _github_chat_client(settings: AgentSettings) -> Any:
+    """Create GitHub Models chat client."""
+    from agent.providers.github import GitHubChatClient
+
+    return GitHubChatClient(
+        model_id=settings.github_model,
+        token=settings.github_token,
+        endpoint=settings.github_endpoint,
+        org=settings.github_org,
+    )
+
+
+def _local_chat_client(settings: AgentSettings) -> Any:
+    """Create chat client for local Docker models (OpenAI-compatible endpoint)."""
+    from agent_framework.openai import OpenAIChatClient
+    from openai import AsyncOpenAI
+
+    from agent.utils.http import get_shared_http_client
+
+    return OpenAIChatClient(
+        model_id=settings.local_model,
+        async_client=AsyncOpenAI(
+            base_url=settings.local_base_url,
+            api_key="not-needed",  # Docker doesn't require authentication
+            http_client=get_shared_http_client(),
+        ),
+    )
+
+
+# Chat client factory per provider. Provider SDKs are imported inside each factory
+# so only the active provider's SDK is loaded.
+_CHAT_CLIENT_FACTORIES: dict[str, Callable[[AgentSettings], Any]] = {
+    "openai": _openai_chat_client,
+    "anthropic": _anthropic_chat_client,
+    "azure": _azure_chat_client,
+    "foundry": _foundry_chat_client,
+    "gemini": _gemini_chat_client,
+    "github": _github_chat_client,
+    "local": _local_chat_client,
+}
+
 
 class Agent:
     """Agent with multi-provider LLM support and extensible tools.
@@ -149,10 +344,40 @@ class Agent:
             middleware = create_middleware()
         self.middleware = middleware
 
+        # Optional response cache for repeated stateless prompts. Memory injects
+        # stored context into every run, so responses are not reusable with it.
+        self.response_cache: ResponseCache | None = None
+        if self.settings.agent.response_cache_enabled and self.memory_manager is None:
+            self.response_cache = ResponseCache(
+                path=self.settings.agent_data_dir / "response_cache.sqlite",
+                max_entries=self.settings.agent.response_cache_max_entries,
+            )
+
         # Create agent
         self.agent = self._create_agent()
 
     def _create_chat_client(self) -> Any:
+        """Get chat client for the configured provider, reusing cached clients.
+
+        Returns:
+            Configured chat client for the selected provider
+
+        Raises:
+            ValueError: If provider is unknown or not supported
+        """
+        if self.settings.llm_provider in _UNCACHED_PROVIDERS:
+            return self._build_chat_client()
+
+        key = _chat_client_cache_key(self.settings)
+        client = _chat_client_cache.get(key)
+        if client is None:
+            client = self._build_chat_client()
+            _chat_client_cache[key] = client
+        else:
+            logger.debug(f"Reusing cached chat client for provider: {key[0]}")
+        return client
+
+    def _build_chat_client(self) -> Any:
         """Create chat client based on configuration.
 
         Supports:
@@ -170,100 +395,13 @@ class Agent:
         Raises:
             ValueError: If provider is unknown or not supported
         """
-        if self.settings.llm_provider == "openai":
-            from agent_framework.openai import OpenAIChatClient
-
-            return OpenAIChatClient(
-                model_id=self.settings.openai_model,
-                api_key=self.settings.openai_api_key,
-            )
-        elif self.settings.llm_provider == "anthropic":
-            from agent_framework.anthropic import AnthropicClient
-
-            return AnthropicClient(
-                model_id=self.settings.anthropic_model,
-                api_key=self.settings.anthropic_api_key,
-            )
-        elif self.settings.llm_provider == "azure":
-            from agent_framework.azure import AzureOpenAIChatClient, AzureOpenAIResponsesClient
-            from azure.identity import AzureCliCredential, DefaultAzureCredential
-
-            # gpt-5-codex requires the responses endpoint, use AzureOpenAIResponsesClient
-            # gpt-5-mini and others use chat completions endpoint, use AzureOpenAIChatClient
-            deployment_name = self.settings.azure_openai_deployment or ""
-            use_responses_client = "codex" in deployment_name.lower()
-            client_class = (
-                AzureOpenAIResponsesClient if use_responses_client else AzureOpenAIChatClient
-            )
-
-            # Use API key if provided, otherwise use Azure CLI credential
-            if self.settings.azure_openai_api_key:
-                return client_class(
-                    endpoint=self.settings.azure_openai_endpoint,
-                    deployment_name=self.settings.azure_openai_deployment,
-                    api_version=self.settings.azure_openai_api_version,
-                    api_key=self.settings.azure_openai_api_key,
-                )
-            else:
-                # Try AzureCliCredential first, fall back to DefaultAzureCredential
-                credential: AzureCliCredential | DefaultAzureCredential
-                try:
-                    credential = AzureCliCredential()
-                    return client_class(
-                        endpoint=self.settings.azure_openai_endpoint,
-                        deployment_name=self.settings.azure_openai_deployment,
-                        api_version=self.settings.azure_openai_api_version,
-                        credential=credential,
-                    )
-                except Exception:
-                    credential = DefaultAzureCredential()
-                    return client_class(
-                        endpoint=self.settings.azure_openai_endpoint,
-                        deployment_name=self.settings.azure_openai_deployment,
-                        api_version=self.settings.azure_openai_api_version,
-                        credential=credential,
-                    )
-        elif self.settings.llm_provider == "foundry":
-            from agent_framework.azure import AzureAIAgentClient
-            from azure.identity.aio import AzureCliCredential as AsyncAzureCliCredential
-
-            return AzureAIAgentClient(
-                project_endpoint=self.settings.azure_project_endpoint,
-                model_deployment_name=self.settings.azure_model_deployment,
-                async_credential=AsyncAzureCliCredential(),
-            )
-        elif self.settings.llm_provider == "gemini":
-            from agent.providers.gemini import GeminiChatClient
-
-            return GeminiChatClient(
-                model_id=self.settings.gemini_model,
-                api_key=self.settings.gemini_api_key,
-                project_id=self.settings.gemini_project_id,
-                location=self.settings.gemini_location,
-                use_vertexai=self.settings.gemini_use_vertexai,
-            )
-        elif self.settings.llm_provider == "github":
-            from agent.providers.github import GitHubChatClient
-
-            return GitHubChatClient(
-                model_id=self.settings.github_model,
-                token=self.settings.github_token,
-                endpoint=self.settings.github_endpoint,
-                org=self.settings.github_org,
-            )
-        elif self.settings.llm_provider == "local":
-            from agent_framework.openai import OpenAIChatClient
-
-            return OpenAIChatClient(
-                model_id=self.settings.local_model,
-                base_url=self.settings.local_base_url,
-                api_key="not-needed",  # Docker doesn't require authentication
-            )
-        else:
+        factory = _CHAT_CLIENT_FACTORIES.get(self.settings.llm_provider)
+        if factory is None:
             raise ValueError(
                 f"Unknown provider: {self.settings.llm_provider}. "
-                f"Supported: openai, anthropic, azure, foundry, gemini, github, local"
+                f"Supported: {', '.join(_CHAT_CLIENT_FACTORIES)}"
             )
+        return factory(self.settings)
 
     def _load_system_prompt(self) -> str:
         """Load system prompt with three-tier fallback and placeholder replacement.
@@ -367,6 +505,7 @@ Be helpful, concise, and clear in your responses."""
             Configured agent instance ready to handle requests
         """
         instructions = self._load_system_prompt()
+        self.instructions = instructions
 
         # Create context providers for dynamic injection
         context_providers: list[Any] = []
@@ -405,8 +544,38 @@ Be helpful, concise, and clear in your responses."""
             tools=self.tools,
             middleware=self.middleware,  # Must be list, not dict
             context_providers=context_providers if context_providers else None,
+            additional_chat_options=self._prompt_cache_options(instructions),
         )
 
+    def _prompt_cache_options(self, instructions: str) -> dict[str, Any] | None:
+        """Build provider chat options that let the system prompt prefix be cached.
+
+        The instructions are identical for every request from this agent, so the
+        provider can reuse its processed prefix instead of re-reading it each turn.
+
+        Args:
+            instructions: System prompt the agent is created with
+
+        Returns:
+            Provider-specific chat options, or None if the provider needs none
+        """
+        if self.settings.llm_provider == "openai":
+            # OpenAI caches prefixes automatically; a stable key routes requests that
+            # share the prefix to the same cache.
+            return {"prompt_cache_key": f"agent-{cache_key(instructions).hex()}"}
+
+        if self.settings.llm_provider == "anthropic":
+            from agent.providers.anthropic import (
+                CACHED_INSTRUCTIONS_OPTION,
+                CachingAnthropicClient,
+            )
+
+            # Only our client understands (and strips) this option
+            if isinstance(self.chat_client, CachingAnthropicClient):
+                return {CACHED_INSTRUCTIONS_OPTION: instructions}
+
+        return None
+
     def get_new_thread(self) -> Any:
         """Create a new conversation thread.
 
@@ -446,9 +615,117 @@ Be helpful, concise, and clear in your responses."""
         """
         if thread:
             result = await self.agent.run(prompt, thread=thread)
-        else:
-            result = await self.agent.run(prompt)
+            return self._response_text(result)
+
+        # Stateless runs are cacheable: without memory (see __init__) the response
+        # depends on the prompt, the prompt prefix (system prompt and tool schemas)
+        # and the model. Threaded runs also depend on history.
+        response_key = None
+        if self.response_cache is not None:
+            model = f"{self.settings.llm_provider}/{self.settings.get_model_display_name()}"
+            prefix_id = PromptPrefix.for_agent(self.agent).prefix_id
+            response_key = response_cache_key(prompt, prefix_id, model)
+            cached = self.response_cache.get(response_key)
+            if cached is not None:
+                logger.debug("Response cache hit")
+                return cached
+
+        result = await self.agent.run(prompt)
+        response = self._response_text(result)
+
+        # Answers built from tool results depend on external state (files, scripts)
+        if self.response_cache is not None and response_key is not None:
+            if not self._called_tools(result):
+                self.response_cache.set(response_key, response)
+        return response
+
+    async def run_many(
+        self,
+        prompts: list[str],
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Run independent prompts concurrently.
+
+        Each prompt is a stateless run (no shared thread). At most max_concurrency
+        requests are in flight; the limit shrinks further when the provider reports
+        a low remaining request budget in its rate-limit headers.
+
+        Args:
+            prompts: User prompts
+            max_concurrency: Maximum number of concurrent requests
+            return_exceptions: Return exceptions in place of responses instead of
+                raising the first one (as in asyncio.gather)
 
+        Returns:
+            Responses in the same order as prompts
+
+        Example:
+            >>> responses = await agent.run_many(["Say hello", "Say goodbye"], max_concurrency=2)
+        """
+        from agent.utils.http import get_rate_limit_remaining
+
+        limit = max(1, max_concurrency)
+        in_flight = 0
+        slot_freed = asyncio.Condition()
+
+        def has_capacity() -> bool:
+            remaining = get_rate_limit_remaining()
+            allowed = limit if remaining is None else max(1, min(limit, remaining))
+            return in_flight < allowed
+
+        async def run_one(prompt: str) -> str:
+            nonlocal in_flight
+            async with slot_freed:
+                await slot_freed.wait_for(has_capacity)
+                in_flight += 1
+            try:
+                return await self.run(prompt)
+            finally:
+                async with slot_freed:
+                    in_flight -= 1
+                    slot_freed.notify_all()
+
+        return await asyncio.gather(
+            *(run_one(prompt) for prompt in prompts), return_exceptions=return_exceptions
+        )
+
+    @staticmethod
+    def _called_tools(result: Any) -> bool:
+        """Check whether a provider run result includes tool calls.
+
+        Args:
+            result: Value returned by the framework agent's run()
+
+        Returns:
+            True if any response message contains a function call
+        """
+        from agent_framework import FunctionCallContent
+
+        return any(
+            isinstance(content, FunctionCallContent)
+            for message in getattr(result, "messages", None) or []
+            for content in getattr(message, "contents", None) or []
+        )
+
+    def close(self) -> None:
+        """Release resources held by the agent (the response cache connection).
+
+        The chat client is shared through the client cache and stays open.
+        """
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+    @staticmethod
+    def _response_text(result: Any) -> str:
+        """Extract response text from a provider run result.
+
+        Args:
+            result: Value returned by the framework agent's run()
+
+        Returns:
+            Response text
+        """
         # Handle different provider return types
         # OpenAI returns str, Anthropic returns AgentRunResponse with .text
         if isinstance(result, str):
@@ -466,7 +743,8 @@ Be helpful, concise, and clear in your responses."""
             thread: Optional thread for conversation context
 
         Yields:
-            Response chunks as they become available
+            Response text as it becomes available; chunks that arrive faster than
+            they are consumed are joined (up to STREAM_MAX_BATCH per yield)
 
         Example:
             >>> agent = Agent(config)
@@ -484,12 +762,64 @@ Be helpful, concise, and clear in your responses."""
         else:
             stream = self.agent.run_stream(prompt)
 
-        async for chunk in stream:
-            # Handle different provider chunk types
-            # OpenAI returns str, Anthropic returns AgentRunResponseUpdate with .text
-            if isinstance(chunk, str):
-                yield chunk
-            elif hasattr(chunk, "text"):
-                yield chunk.text
-            else:
-                yield str(chunk)
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+        async def produce() -> None:
+            cancelled = False
+            try:
+                async for chunk in stream:
+                    await queue.put(self._chunk_text(chunk))
+            except asyncio.CancelledError:
+                # The consumer stopped early; nobody will read the end marker
+                cancelled = True
+                raise
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                if not cancelled:
+                    await queue.put(_STREAM_END)
+
+        producer = asyncio.create_task(produce())
+        try:
+            done = False
+            while not done:
+                # Wait for one chunk, then take whatever else is already buffered
+                parts: list[str] = []
+                item = await queue.get()
+                while True:
+                    if item is _STREAM_END:
+                        done = True
+                        break
+                    parts.append(item)
+                    if len(parts) >= STREAM_MAX_BATCH or queue.empty():
+                        break
+                    item = queue.get_nowait()
+                if parts:
+                    yield "".join(parts)
+
+            # Re-raise any error from the underlying stream
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Extract text from a streamed chunk.
+
+        OpenAI returns str, Anthropic returns AgentRunResponseUpdate with .text.
+
+        Args:
+            chunk: Chunk from the framework agent stream
+
+        Returns:
+            Chunk text
+        """
+        if isinstance(chunk, str):
+            return chunk
+        if hasattr(chunk, "text"):
+            return str(chunk.text or "")
+        return str(chunk)
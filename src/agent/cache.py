@@ -0,0 +1,165 @@
+"""Response cache for repeated stateless prompts.
+
+Scripted `agent -p` loops often send the exact same prompt to the same model many
+times. When enabled, Agent.run consults this cache before calling the LLM and
+returns a stored response on an exact match, skipping the network round-trip.
+The cache is not used when memory is enabled or for runs with a thread, and
+responses that called tools are not stored, since those depend on more than
+the request.
+
+Entries live in an in-memory LRU and, when a path is given, in a SQLite file so
+separate CLI processes can reuse each other's responses.
+"""
+
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from agent.hashing import cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def response_cache_key(prompt: str, prefix: str, model: str) -> bytes:
+    """Build cache key for a prompt/prompt prefix/model combination.
+
+    Args:
+        prompt: User prompt
+        prefix: Identifier of the static prompt prefix (system prompt and tool
+            schemas), e.g. PromptPrefix.prefix_id
+        model: Provider and model identifier
+
+    Returns:
+        16-byte digest identifying the request
+    """
+    return cache_key(prompt, prefix, key=model)
+
+
+class ResponseCache:
+    """Exact-match LRU cache of agent responses with optional SQLite persistence.
+
+    Example:
+        >>> cache = ResponseCache(Path("~/.agent/response_cache.sqlite").expanduser())
+        >>> key = response_cache_key("Say hello", prefix.prefix_id, "openai/gpt-5-mini")
+        >>> cache.get(key) is None
+        True
+        >>> cache.set(key, "Hello!")
+        >>> cache.get(key)
+        'Hello!'
+    """
+
+    def __init__(self, path: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize response cache.
+
+        Args:
+            path: Optional SQLite file for cross-process reuse (in-memory only if None)
+            max_entries: Maximum number of entries kept in memory and on disk
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(path)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key BLOB PRIMARY KEY, response TEXT NOT NULL, last_used REAL NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache persistence disabled ({path}): {e}")
+                self._db = None
+
+    def get(self, key: bytes) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from response_cache_key()
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+            return response
+
+        if self._db is None:
+            return None
+
+        try:
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        response = str(row[0])
+        self._remember(key, response)
+        return response
+
+    def set(self, key: bytes, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Key from response_cache_key()
+            response: Agent response text
+        """
+        self._remember(key, response)
+
+        if self._db is None:
+            return
+
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, last_used) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            # Evict least recently used rows beyond the limit
+            self._db.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        if self._db is not None:
+            try:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        """Number of entries held in memory."""
+        return len(self._entries)
+
+    def _remember(self, key: bytes, response: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
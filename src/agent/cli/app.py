@@ -4,21 +4,13 @@ import asyncio
 import logging
 import os
 import platform
+from pathlib import Path
 
 import typer
 
 from agent import __version__
-from agent.cli.commands import (
-    handle_memory_command,
-    handle_telemetry_command,
-)
-from agent.cli.constants import ExitCodes
-from agent.cli.execution import run_single_prompt
-from agent.cli.health import run_health_check
-from agent.cli.interactive import run_chat_mode
-from agent.cli.session import get_last_session
+from agent.cli.constants import DEFAULT_BATCH_CONCURRENCY, DEFAULT_BATCH_TIMEOUT, ExitCodes
 from agent.cli.utils import get_console
-from agent.config import load_config
 
 app = typer.Typer(help="Agent - Conversational Assistant")
 
@@ -43,6 +35,19 @@ def main(
         False, "--verbose", help="Show detailed execution tree (single prompt mode only)"
     ),
     resume: bool = typer.Option(False, "--continue", help="Resume last saved session"),
+    batch_api: bool = typer.Option(
+        False,
+        "--batch-api/--no-batch-api",
+        help=(
+            "Send -p @file.jsonl through the provider Batch API: cheaper but can take "
+            "hours, no tools (openai/anthropic only)"
+        ),
+    ),
+    batch_timeout: float = typer.Option(
+        DEFAULT_BATCH_TIMEOUT,
+        "--batch-timeout",
+        help="Seconds to wait for a --batch-api batch before giving up",
+    ),
     provider: str = typer.Option(
         None,
         "--provider",
@@ -61,6 +66,8 @@ def main(
         agent --tools                               # Show tool configuration
         agent -p "Say hello to Alice"               # Single query (clean output)
         agent -p "Say hello" --verbose              # Single query with execution details
+        agent -p @prompts.jsonl                     # Batch of queries (JSON lines out)
+        agent batch -f prompts.txt -c 10            # Concurrent queries through the agent
         agent --provider openai                     # Use OpenAI provider
         agent --provider local --model ai/qwen3     # Use local provider with qwen3
         agent --continue                            # Resume last session
@@ -81,7 +88,11 @@ def main(
         console.print(f"Agent version {__version__}")
         return
 
+    # Command handlers are imported lazily: they pull in agent_framework and the
+    # provider SDKs, which fast paths like --version should not pay for.
     if check:
+        from agent.cli.health import run_health_check
+
         run_health_check(console)
         return
 
@@ -101,13 +112,31 @@ def main(
         asyncio.run(_run_memory_cli(memory))
         return
 
-    if prompt:
+    if prompt and prompt.startswith("@") and Path(prompt[1:]).is_file():
+        # Batch mode: one prompt per line of a JSONL file, results as JSON lines
+        # (a prompt like "@alice ..." that names no file is sent as a prompt)
+        from agent.cli.batch import run_batch_file
+
+        asyncio.run(
+            run_batch_file(
+                Path(prompt[1:]),
+                use_batch_api=batch_api,
+                console=console,
+                batch_timeout=batch_timeout,
+            )
+        )
+    elif prompt:
         # Single-prompt mode: default to quiet (clean output for scripting)
         # Unless --verbose is specified for detailed execution tree
+        from agent.cli.execution import run_single_prompt
+
         quiet_mode = not verbose  # Quiet by default unless verbose requested
         asyncio.run(run_single_prompt(prompt, verbose=verbose, quiet=quiet_mode, console=console))
     else:
         # Interactive chat mode
+        from agent.cli.interactive import run_chat_mode
+        from agent.cli.session import get_last_session
+
         # Handle --continue flag: resume last session
         resume_session = None
         if resume:
@@ -124,6 +153,8 @@ async def _run_telemetry_cli(action: str) -> None:
     Args:
         action: Telemetry action (start, stop, status, url)
     """
+    from agent.cli.commands import handle_telemetry_command
+
     await handle_telemetry_command(f"/telemetry {action}", console)
 
 
@@ -133,93 +164,126 @@ async def _run_memory_cli(action: str) -> None:
     Args:
         action: Memory action (start, stop, status, url)
     """
+    from agent.cli.commands import handle_memory_command
+
     await handle_memory_command(f"/memory {action}", console)
 
 
 def show_configuration() -> None:
     """Show current configuration and system information."""
+    from agent.config import load_config
+
     console.print()
 
     try:
         config = load_config()
 
+        # Collect lines and render them in a single print
+        lines: list[str] = []
+
         # System Information
-        console.print("[bold]System:[/bold]")
-        console.print(f" • Python: [cyan]{platform.python_version()}[/cyan]")
-        console.print(f" • Platform: [cyan]{platform.platform()}[/cyan]")
+        lines.append("[bold]System:[/bold]")
+        lines.append(f" • Python: [cyan]{platform.python_version()}[/cyan]")
+        lines.append(f" • Platform: [cyan]{platform.platform()}[/cyan]")
 
         # Agent Settings
-        console.print("\n[bold]Agent Settings:[/bold]")
-        console.print(f" • Data Directory: {config.agent_data_dir}")
+        lines.append("\n[bold]Agent Settings:[/bold]")
+        lines.append(f" • Data Directory: {config.agent_data_dir}")
         if config.agent_session_dir:
-            console.print(f" • Session Directory: {config.agent_session_dir}")
+            lines.append(f" • Session Directory: {config.agent_session_dir}")
 
         # Get log level (support both AGENT_LOG_LEVEL and LOG_LEVEL)
         log_level = os.getenv("AGENT_LOG_LEVEL") or os.getenv("LOG_LEVEL") or "INFO"
-        console.print(f" • Log Level: [magenta]{log_level.upper()}[/magenta]")
+        lines.append(f" • Log Level: [magenta]{log_level.upper()}[/magenta]")
 
         # System prompt source (purple value)
         if config.system_prompt_file:
-            console.print(f" • System Prompt: [magenta]{config.system_prompt_file}[/magenta]")
+            lines.append(f" • System Prompt: [magenta]{config.system_prompt_file}[/magenta]")
         else:
             user_default = config.agent_data_dir / "system.md" if config.agent_data_dir else None
             if user_default and user_default.exists():
-                console.print(f" • System Prompt: [magenta]{user_default}[/magenta]")
+                lines.append(f" • System Prompt: [magenta]{user_default}[/magenta]")
             else:
-                console.print(" • System Prompt: [magenta]Agent Default[/magenta]")
+                lines.append(" • System Prompt: [magenta]Agent Default[/magenta]")
 
         # LLM Providers (show all)
-        console.print("\n[bold]LLM Providers:[/bold]")
+        lines.append("\n[bold]LLM Providers:[/bold]")
 
         # Active provider indicator
-        console.print(
+        lines.append(
             f" • Active: [cyan]{config.llm_provider}[/cyan] ({config.get_model_display_name()})"
         )
-        console.print()
+        lines.append("")
 
         # OpenAI
         if config.openai_api_key:
             masked_key = f"****{config.openai_api_key[-6:]}"
-            console.print(f" • [cyan]OpenAI[/cyan] ({config.openai_model})")
-            console.print(f"   API Key: {masked_key}")
+            lines.append(f" • [cyan]OpenAI[/cyan] ({config.openai_model})")
+            lines.append(f"   API Key: {masked_key}")
         else:
-            console.print(" • [dim]OpenAI - Not configured[/dim]")
+            lines.append(" • [dim]OpenAI - Not configured[/dim]")
 
         # Anthropic
         if config.anthropic_api_key:
             masked_key = f"****{config.anthropic_api_key[-6:]}"
-            console.print(f" • [cyan]Anthropic[/cyan] ({config.anthropic_model})")
-            console.print(f"   API Key: {masked_key}")
+            lines.append(f" • [cyan]Anthropic[/cyan] ({config.anthropic_model})")
+            lines.append(f"   API Key: {masked_key}")
         else:
-            console.print(" • [dim]Anthropic - Not configured[/dim]")
+            lines.append(" • [dim]Anthropic - Not configured[/dim]")
 
         # Azure OpenAI
         if config.azure_openai_endpoint and config.azure_openai_deployment:
-            console.print(f" • [cyan]Azure OpenAI[/cyan] ({config.azure_openai_deployment})")
-            console.print(f"   Endpoint: {config.azure_openai_endpoint}")
+            lines.append(f" • [cyan]Azure OpenAI[/cyan] ({config.azure_openai_deployment})")
+            lines.append(f"   Endpoint: {config.azure_openai_endpoint}")
             if config.azure_openai_api_key:
                 masked_key = f"****{config.azure_openai_api_key[-6:]}"
-                console.print(f"   API Key: {masked_key}")
+                lines.append(f"   API Key: {masked_key}")
             else:
-                console.print("   Auth: Azure CLI")
+                lines.append("   Auth: Azure CLI")
         else:
-            console.print(" • [dim]Azure OpenAI - Not configured[/dim]")
+            lines.append(" • [dim]Azure OpenAI - Not configured[/dim]")
 
         # Azure AI Foundry
         if config.azure_project_endpoint and config.azure_model_deployment:
-            console.print(f" • [cyan]Azure AI Foundry[/cyan] ({config.azure_model_deployment})")
-            console.print(f"   Endpoint: {config.azure_project_endpoint}")
-            console.print("   Auth: Azure CLI")
+            lines.append(f" • [cyan]Azure AI Foundry[/cyan] ({config.azure_model_deployment})")
+            lines.append(f"   Endpoint: {config.azure_project_endpoint}")
+            lines.append("   Auth: Azure CLI")
         else:
-            console.print(" • [dim]Azure AI Foundry - Not configured[/dim]")
+            lines.append(" • [dim]Azure AI Foundry - Not configured[/dim]")
 
-        console.print()
+        lines.append("")
+        console.print("\n".join(lines))
 
     except Exception as e:
         console.print(f"[red]Error loading configuration:[/red] {e}")
         raise typer.Exit(ExitCodes.GENERAL_ERROR)
 
 
+@app.command("batch")
+def batch_command(
+    file: Path = typer.Option(
+        ..., "-f", "--file", help="Prompts file (.jsonl, or one prompt per line)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY, "-c", "--concurrency", help="Maximum concurrent requests"
+    ),
+) -> None:
+    """Run many prompts concurrently through the agent (tools available).
+
+    Prints one JSON result per line. Concurrency shrinks automatically when the
+    provider reports a low remaining request budget.
+
+    Examples:
+        agent batch -f prompts.txt
+        agent batch -f prompts.jsonl -c 4
+    """
+    from agent.cli.batch import run_batch_file
+
+    asyncio.run(
+        run_batch_file(file, use_batch_api=False, max_concurrency=concurrency, console=console)
+    )
+
+
 # Config command group - add with rich_help_panel to keep main command at root level
 # Note: Typer doesn't support default commands with subcommands elegantly
 # The pattern used here: main() is the primary command, config is a command group
@@ -0,0 +1,443 @@
+"""Batch prompt execution for Agent CLI.
+
+This module handles `agent -p @prompts.jsonl` and `agent batch`:
+- Loading prompts from a JSONL or plain text file
+- Running them as concurrent Agent.run calls
+- Optionally (--batch-api) submitting them through the OpenAI or Anthropic
+  Batch API (discounted, asynchronous, can take hours), falling back to
+  concurrent calls for other providers or when the Batch API is unavailable
+- Writing one JSON result per line for scripting
+
+Provider batch requests contain the system prompt and user prompt only; tools
+are not available to them. Use the concurrent path (the default) for prompts
+that need tools.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TypeVar
+
+import typer
+from rich.console import Console
+
+from agent.agent import Agent
+from agent.cli.constants import DEFAULT_BATCH_CONCURRENCY, DEFAULT_BATCH_TIMEOUT, ExitCodes
+from agent.cli.session import setup_session_logging
+from agent.cli.utils import get_console
+from agent.config import load_config_with_env
+
+logger = logging.getLogger(__name__)
+
+# Batch API polling backoff (seconds)
+BATCH_POLL_INITIAL_DELAY = 2.0
+BATCH_POLL_MAX_DELAY = 60.0
+
+# Anthropic requires max_tokens on every request
+ANTHROPIC_BATCH_MAX_TOKENS = 4096
+
+T = TypeVar("T")
+
+# Batch status lines go to stderr so stdout stays one JSON result per line
+status_console = Console(stderr=True)
+
+
+@dataclass
+class BatchItem:
+    """A single prompt in a batch and its outcome."""
+
+    custom_id: str
+    prompt: str
+    response: str | None = None
+    error: str | None = None
+
+    def to_json(self) -> str:
+        """Serialize result as a single JSON line."""
+        return json.dumps(
+            {
+                "id": self.custom_id,
+                "prompt": self.prompt,
+                "response": self.response,
+                "error": self.error,
+            },
+            ensure_ascii=False,
+        )
+
+
+def load_batch_prompts(path: Path) -> list[BatchItem]:
+    """Load prompts from a JSONL or plain text file.
+
+    In .jsonl/.json files each non-empty line is either a JSON string (the prompt)
+    or an object with a "prompt" key and an optional "id" key. In any other file
+    each non-empty line is a prompt.
+
+    Args:
+        path: Path to prompts file
+
+    Returns:
+        List of batch items in file order
+
+    Raises:
+        ValueError: If a line is not valid JSON, has no prompt, or repeats an id
+
+    Example:
+        >>> # prompts.jsonl:
+        >>> # "Say hello"
+        >>> # {"id": "bye", "prompt": "Say goodbye"}
+        >>> items = load_batch_prompts(Path("prompts.jsonl"))
+        >>> [item.custom_id for item in items]
+        ['prompt-1', 'bye']
+    """
+    items: list[BatchItem] = []
+    seen_ids: set[str] = set()
+    is_json = path.suffix.lower() in {".jsonl", ".json"}
+    with path.open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            if not is_json:
+                items.append(BatchItem(custom_id=f"prompt-{line_no}", prompt=line.rstrip("\n")))
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({e.msg})") from e
+
+            if isinstance(data, str):
+                prompt, custom_id = data, None
+            elif isinstance(data, dict) and isinstance(data.get("prompt"), str):
+                prompt, custom_id = data["prompt"], data.get("id")
+            else:
+                raise ValueError(f'{path}:{line_no}: expected a string or {{"prompt": ...}}')
+
+            custom_id = str(custom_id or f"prompt-{line_no}")
+            if custom_id in seen_ids:
+                raise ValueError(f"{path}:{line_no}: duplicate id {custom_id!r}")
+            seen_ids.add(custom_id)
+            items.append(BatchItem(custom_id=custom_id, prompt=prompt))
+
+    return items
+
+
+async def _poll_until(
+    fetch: Callable[[], Awaitable[T]],
+    is_done: Callable[[T], bool],
+    label: str,
+    describe: Callable[[T], str],
+    timeout: float = DEFAULT_BATCH_TIMEOUT,
+) -> T:
+    """Poll a batch status with exponential backoff until it is done.
+
+    Prints the batch state on each poll so long-running batches are visible.
+
+    Args:
+        fetch: Coroutine function returning the current batch object
+        is_done: Predicate telling whether the batch reached a final state
+        label: Batch description (including its id) for status messages
+        describe: Returns the batch state to display
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        Final batch object
+
+    Raises:
+        TimeoutError: If the batch is not done within timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = BATCH_POLL_INITIAL_DELAY
+    while True:
+        batch = await fetch()
+        if is_done(batch):
+            return batch
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"{label} still {describe(batch)} after {timeout:.0f}s; it keeps running "
+                "on the provider side (use --batch-timeout to wait longer)"
+            )
+        delay = min(delay, remaining)
+        status_console.print(
+            f"[dim]{label}: {describe(batch)}, next check in {delay:.0f}s (Ctrl+C to stop)[/dim]"
+        )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+
+
+async def _run_openai_batch(agent: Agent, items: list[BatchItem], timeout: float) -> None:
+    """Run items through the OpenAI Batch API, filling in responses in place.
+
+    Args:
+        agent: Agent whose settings and instructions are used
+        items: Batch items to process
+        timeout: Seconds to wait for the batch to finish
+    """
+    from openai import AsyncOpenAI
+
+    from agent.utils.http import get_shared_http_client
+
+    settings = agent.settings
+    client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=get_shared_http_client())
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": item.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.openai_model,
+                    "messages": [
+                        {"role": "system", "content": agent.instructions},
+                        {"role": "user", "content": item.prompt},
+                    ],
+                },
+            }
+        )
+        for item in items
+    ]
+    input_file = await client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted OpenAI batch {batch.id} with {len(items)} prompts")
+
+    batch = await _poll_until(
+        lambda: client.batches.retrieve(batch.id),
+        lambda b: b.status in {"completed", "failed", "expired", "cancelled"},
+        f"OpenAI batch {batch.id}",
+        lambda b: str(b.status),
+        timeout,
+    )
+    if batch.status != "completed":
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+    by_id = {item.custom_id: item for item in items}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        content = await client.files.content(file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            item = by_id.get(record.get("custom_id"))
+            if item is None:
+                continue
+            body = (record.get("response") or {}).get("body") or {}
+            if record.get("error") or "error" in body:
+                error = record.get("error") or body.get("error") or {}
+                item.error = str(error.get("message", error))
+            else:
+                item.response = body["choices"][0]["message"]["content"]
+
+
+async def _run_anthropic_batch(agent: Agent, items: list[BatchItem], timeout: float) -> None:
+    """Run items through the Anthropic Message Batches API, filling in responses in place.
+
+    Args:
+        agent: Agent whose settings and instructions are used
+        items: Batch items to process
+        timeout: Seconds to wait for the batch to finish
+    """
+    from anthropic import AsyncAnthropic
+
+    from agent.utils.http import get_shared_http_client
+
+    settings = agent.settings
+    client = AsyncAnthropic(
+        api_key=settings.anthropic_api_key, http_client=get_shared_http_client()
+    )
+
+    batch = await client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": item.custom_id,
+                "params": {
+                    "model": settings.anthropic_model,
+                    "max_tokens": ANTHROPIC_BATCH_MAX_TOKENS,
+                    "system": agent.instructions,
+                    "messages": [{"role": "user", "content": item.prompt}],
+                },
+            }
+            for item in items
+        ]
+    )
+    logger.info(f"Submitted Anthropic batch {batch.id} with {len(items)} prompts")
+
+    await _poll_until(
+        lambda: client.messages.batches.retrieve(batch.id),
+        lambda b: b.processing_status == "ended",
+        f"Anthropic batch {batch.id}",
+        lambda b: str(b.processing_status),
+        timeout,
+    )
+
+    by_id = {item.custom_id: item for item in items}
+    async for result in await client.messages.batches.results(batch.id):
+        item = by_id.get(result.custom_id)
+        if item is None:
+            continue
+        if result.result.type == "succeeded":
+            item.response = "".join(
+                block.text for block in result.result.message.content if block.type == "text"
+            )
+        elif result.result.type == "errored":
+            item.error = str(result.result.error.error.message)
+        else:
+            item.error = f"Request {result.result.type}"
+
+
+async def _run_concurrent(agent: Agent, items: list[BatchItem], max_concurrency: int) -> None:
+    """Run items through Agent.run_many, filling in responses in place.
+
+    Args:
+        agent: Agent used for every prompt (stateless runs, no shared thread)
+        items: Batch items to process
+        max_concurrency: Maximum number of in-flight requests
+    """
+    results = await agent.run_many(
+        [item.prompt for item in items],
+        max_concurrency=max_concurrency,
+        return_exceptions=True,
+    )
+    for item, result in zip(items, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Batch prompt {item.custom_id} failed: {result}")
+            item.error = str(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            item.response = result
+
+
+# Providers with a Batch API, keyed by provider name
+_PROVIDER_BATCH_RUNNERS: dict[str, Callable[[Agent, list[BatchItem], float], Awaitable[None]]] = {
+    "openai": _run_openai_batch,
+    "anthropic": _run_anthropic_batch,
+}
+
+
+async def run_batch_prompts(
+    agent: Agent,
+    items: list[BatchItem],
+    use_batch_api: bool = False,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
+) -> list[BatchItem]:
+    """Run a batch of prompts concurrently, or through the provider's Batch API.
+
+    Args:
+        agent: Configured agent instance
+        items: Batch items to process
+        use_batch_api: Use the provider Batch API when available
+        max_concurrency: Concurrency limit for Agent.run calls
+        batch_timeout: Seconds to wait for a provider batch; on timeout the
+            items are marked as errors (the batch is not re-run concurrently)
+
+    Returns:
+        The same items with response or error filled in
+
+    Example:
+        >>> items = [BatchItem("a", "Say hello"), BatchItem("b", "Say goodbye")]
+        >>> await run_batch_prompts(agent, items, use_batch_api=False)
+    """
+    if not items:
+        return items
+
+    runner = _PROVIDER_BATCH_RUNNERS.get(agent.settings.llm_provider)
+    if use_batch_api and runner is not None:
+        try:
+            await runner(agent, items, batch_timeout)
+        except TimeoutError as e:
+            # The batch may still complete; running the prompts again would pay twice
+            for item in items:
+                if item.response is None and item.error is None:
+                    item.error = str(e)
+            return items
+        except Exception as e:
+            logger.warning(f"Batch API unavailable, running prompts concurrently: {e}")
+            for item in items:
+                item.response = item.error = None
+        else:
+            for item in items:
+                if item.response is None and item.error is None:
+                    item.error = "No result returned by batch"
+            return items
+
+    await _run_concurrent(agent, items, max_concurrency)
+    return items
+
+
+async def run_batch_file(
+    path: Path,
+    use_batch_api: bool = False,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    console: Console | None = None,
+    batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
+) -> None:
+    """Run all prompts in a file and print one JSON result per line.
+
+    Args:
+        path: Path to prompts file (see load_batch_prompts)
+        use_batch_api: Use the provider Batch API when available
+        max_concurrency: Concurrency limit when prompts run through the agent
+        console: Rich console for output (creates default if None)
+        batch_timeout: Seconds to wait for a provider batch to finish
+
+    Raises:
+        typer.Exit: On configuration errors, unreadable input, or failed prompts
+    """
+    if console is None:
+        console = get_console()
+
+    try:
+        items = load_batch_prompts(path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(ExitCodes.GENERAL_ERROR)
+
+    try:
+        config = load_config_with_env()
+    except ValueError as e:
+        console.print(f"\n[red]Configuration error:[/red] {e}\n")
+        raise typer.Exit(ExitCodes.GENERAL_ERROR)
+    errors = config.validate_enabled_providers()
+    if errors:
+        for error in errors:
+            console.print(f"[red]Error:[/red] {error}")
+        raise typer.Exit(ExitCodes.CONFIG_ERROR)
+
+    setup_session_logging(datetime.now().strftime("%Y-%m-%d-%H-%M-%S"), config)
+
+    agent = Agent(settings=config)
+    try:
+        await run_batch_prompts(
+            agent,
+            items,
+            use_batch_api=use_batch_api,
+            max_concurrency=max_concurrency,
+            batch_timeout=batch_timeout,
+        )
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]Interrupted by user[/yellow]")
+        raise typer.Exit(ExitCodes.INTERRUPTED)
+    finally:
+        agent.close()
+        from agent.utils.http import close_shared_http_client
+
+        await close_shared_http_client()
+
+    for item in items:
+        console.print(item.to_json(), markup=False, highlight=False, soft_wrap=True)
+
+    if any(item.error for item in items):
+        raise typer.Exit(ExitCodes.GENERAL_ERROR)
@@ -6,12 +6,13 @@ import time
 from typing import Any
 
 from prompt_toolkit import PromptSession
-from rich.console import Console
+from rich.console import Console, Group
+from rich.text import Text
 
 from agent.agent import Agent
 from agent.cli.session import pick_session, restore_session_context
 from agent.persistence import ThreadPersistence
-from agent.utils.terminal import TIMEOUT_EXIT_CODE, clear_screen, execute_shell_command
+from agent.utils.terminal import TIMEOUT_EXIT_CODE, clear_screen, run_shell_command
 
 
 async def handle_shell_command(command: str, console: Console) -> None:
@@ -30,8 +31,8 @@ async def handle_shell_command(command: str, console: Console) -> None:
     # Show what we're executing
     console.print(f"\n[dim]$ {command}[/dim]")
 
-    # Execute the command
-    exit_code, stdout, stderr = execute_shell_command(command)
+    # Execute the command (shared shell: cd/export persist between commands)
+    exit_code, stdout, stderr = run_shell_command(command)
 
     # Display output
     if stdout:
@@ -224,29 +225,41 @@ async def handle_purge_command(
         console.print("\n[yellow]Cancelled[/yellow]")
 
 
+# Interactive help, parsed from markup once at import and printed in a single call
+_HELP_RENDERABLE = Group(
+    *(
+        Text.from_markup(line)
+        for line in (
+            "",
+            "[bold]Available Commands:[/bold]",
+            "  [cyan]/clear[/cyan]      - Clear screen and start new conversation",
+            "  [cyan]/continue[/cyan]   - Resume a previous session",
+            "  [cyan]/purge[/cyan]      - Delete all agent data (sessions, logs, memory)",
+            "  [cyan]/memory[/cyan]     - Manage memory configuration (mem0)",
+            "  [cyan]/telemetry[/cyan]  - Manage local observability dashboard",
+            "  [cyan]/help[/cyan]       - Show this help message",
+            "  [cyan]exit[/cyan]        - Exit interactive mode",
+            "",
+            "[bold]Shell Commands:[/bold]",
+            "  [cyan]!<command>[/cyan]  - Execute shell command",
+            "",
+            "[bold]Keyboard Shortcuts:[/bold]",
+            "  [cyan]ESC[/cyan]         - Clear current prompt",
+            "  [cyan]Ctrl+D[/cyan]      - Exit interactive mode",
+            "  [cyan]Ctrl+C[/cyan]      - Interrupt current operation",
+            "",
+        )
+    )
+)
+
+
 def show_help(console: Console) -> None:
     """Show help message in interactive mode.
 
     Args:
         console: Console for output
     """
-    console.print("\n[bold]Available Commands:[/bold]")
-    console.print("  [cyan]/clear[/cyan]      - Clear screen and start new conversation")
-    console.print("  [cyan]/continue[/cyan]   - Resume a previous session")
-    console.print("  [cyan]/purge[/cyan]      - Delete all agent data (sessions, logs, memory)")
-    console.print("  [cyan]/memory[/cyan]     - Manage memory configuration (mem0)")
-    console.print("  [cyan]/telemetry[/cyan]  - Manage local observability dashboard")
-    console.print("  [cyan]/help[/cyan]       - Show this help message")
-    console.print("  [cyan]exit[/cyan]        - Exit interactive mode")
-    console.print()
-    console.print("[bold]Shell Commands:[/bold]")
-    console.print("  [cyan]!<command>[/cyan]  - Execute shell command")
-    console.print()
-    console.print("[bold]Keyboard Shortcuts:[/bold]")
-    console.print("  [cyan]ESC[/cyan]         - Clear current prompt")
-    console.print("  [cyan]Ctrl+D[/cyan]      - Exit interactive mode")
-    console.print("  [cyan]Ctrl+C[/cyan]      - Interrupt current operation")
-    console.print()
+    console.print(_HELP_RENDERABLE)
 
 
 async def handle_telemetry_command(user_input: str, console: Console) -> None:
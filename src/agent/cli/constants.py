@@ -19,3 +19,10 @@ class ExitCodes:
     GENERAL_ERROR = 1
     CONFIG_ERROR = 2
     INTERRUPTED = 130
+
+
+# Default concurrent requests for batch prompt runs through the agent
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Seconds to wait for a provider Batch API batch before giving up (batches can take up to 24h)
+DEFAULT_BATCH_TIMEOUT = 3600.0
@@ -6,6 +6,7 @@ from typing import Any
 from rich.console import Console
 
 from agent.agent import Agent
+from agent.cli.utils import CoalescingWriter
 from agent.display import DisplayMode, ExecutionContext, ExecutionTreeDisplay
 
 
@@ -90,3 +91,36 @@ async def execute_quiet_mode(agent: Agent, prompt: str, thread: Any | None) -> s
         Agent response
     """
     return await agent.run(prompt, thread=thread)
+
+
+async def stream_quiet_mode(agent: Agent, prompt: str, thread: Any | None, console: Console) -> str:
+    """Execute agent in quiet mode, writing the response as it streams.
+
+    Chunks are written as plain text to the console's file (no Rich markup
+    parsing), so output starts with the first token and is safe to pipe.
+
+    Args:
+        agent: Agent instance
+        prompt: User prompt
+        thread: Optional conversation thread
+        console: Console whose file receives the output
+
+    Returns:
+        Full agent response
+    """
+    writer = CoalescingWriter(console.file)
+
+    if getattr(agent, "response_cache", None) is not None:
+        # Cached responses are only served by run(); nothing to stream
+        response = await agent.run(prompt, thread=thread)
+        writer.write(response)
+    else:
+        parts: list[str] = []
+        async for chunk in agent.run_stream(prompt, thread=thread):
+            parts.append(chunk)
+            writer.write(chunk)
+        response = "".join(parts)
+
+    writer.write("\n")
+    writer.flush()
+    return response
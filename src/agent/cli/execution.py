@@ -23,8 +23,8 @@ from agent.agent import Agent
 from agent.cli.constants import ExitCodes
 from agent.cli.display import (
     create_execution_context,
-    execute_quiet_mode,
     execute_with_visualization,
+    stream_quiet_mode,
 )
 from agent.cli.session import setup_session_logging
 from agent.cli.utils import (
@@ -51,7 +51,7 @@ async def _execute_query(
         console: Console for output
 
     Returns:
-        Response string from agent execution
+        Response string to display, or None if it was already streamed to output
     """
     if not quiet:
         display_mode = DisplayMode.VERBOSE if verbose else DisplayMode.MINIMAL
@@ -61,7 +61,9 @@ async def _execute_query(
             console.print("\n[yellow]Interrupted by user[/yellow]\n")
             raise typer.Exit(ExitCodes.INTERRUPTED)
     else:
-        return await execute_quiet_mode(agent, prompt, None)
+        # Quiet mode streams straight to output as chunks arrive
+        await stream_quiet_mode(agent, prompt, None, console)
+        return None
 
 
 async def run_single_prompt(
@@ -213,3 +215,8 @@ async def run_single_prompt(
         # Restore connection string if we hid it
         if "saved_connection_string" in locals() and saved_connection_string:
             os.environ["APPLICATIONINSIGHTS_CONNECTION_STRING"] = saved_connection_string
+        if "agent" in locals():
+            agent.close()
+            from agent.utils.http import close_shared_http_client
+
+            await close_shared_http_client()
@@ -15,6 +15,7 @@ Extracted from cli/app.py to improve maintainability.
 
 import logging
 import os
+import shutil
 import subprocess
 import sys
 from datetime import datetime
@@ -28,7 +29,7 @@ from rich.console import Console
 from rich.prompt import Confirm
 
 from agent import __version__
-from agent.agent import Agent
+from agent.agent import Agent, clear_chat_client_cache
 from agent.cli.commands import (
     handle_clear_command,
     handle_continue_command,
@@ -45,6 +46,7 @@ from agent.cli.display import (
     execute_with_visualization,
 )
 from agent.cli.session import (
+    Conversation,
     auto_save_session,
     restore_session_context,
     setup_session_logging,
@@ -171,29 +173,57 @@ def _get_status_bar_text(console: Console) -> str:
     return f"{' ' * padding}{status}"
 
 
-def _ensure_history_size_limit(history_file: Path, max_lines: int = 10000) -> None:
+def _ensure_history_size_limit(
+    history_file: Path, max_lines: int = 10000, block_size: int = 64 * 1024
+) -> None:
     """Rotate history file if too large to prevent slow startup.
 
-    Note: Reads entire file into memory for simplicity. For 10K lines (~500KB)
-    this is negligible (~20ms). Could be optimized with tail/seek for huge files
-    but current approach is simple and sufficient.
+    Scans backwards from the end of the file in fixed-size blocks, counting
+    newlines, so only the retained tail is read no matter how large the file
+    has grown. The trimmed copy is swapped in atomically.
 
     Args:
         history_file: Path to history file
         max_lines: Maximum lines to keep (default: 10000)
+        block_size: Bytes read per backward step
     """
-    if not history_file.exists():
-        return
-
     try:
-        with open(history_file) as f:
-            lines = f.readlines()
-
-        if len(lines) > max_lines:
-            # Keep last max_lines entries
-            logger.info(f"Rotating history file: {len(lines)} lines -> {max_lines} lines")
-            with open(history_file, "w") as f:
-                f.writelines(lines[-max_lines:])
+        with open(history_file, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            # A trailing newline terminates the last line rather than starting a new one
+            if end:
+                f.seek(end - 1)
+                if f.read(1) == b"\n":
+                    pos = end - 1
+
+            newlines = 0
+            cut: int | None = None
+            while pos > 0 and cut is None:
+                read_size = min(block_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                block = f.read(read_size)
+                count = block.count(b"\n")
+                if newlines + count >= max_lines:
+                    # Locate the newline that precedes the oldest line to keep
+                    idx = len(block)
+                    for _ in range(max_lines - newlines):
+                        idx = block.rindex(b"\n", 0, idx)
+                    cut = pos + idx + 1
+                newlines += count
+
+            if cut is None:
+                return
+
+            logger.info(f"Rotating history file: keeping last {max_lines} lines")
+            tmp_file = history_file.with_name(history_file.name + ".tmp")
+            f.seek(cut)
+            with open(tmp_file, "wb") as out:
+                shutil.copyfileobj(f, out)
+        os.replace(tmp_file, history_file)
+    except FileNotFoundError:
+        return
     except Exception as e:
         logger.warning(f"Failed to rotate history file: {e}")
 
@@ -347,9 +377,8 @@ async def run_chat_mode(
         agent = None
         thread = None
         message_count = 0
-        conversation_messages: list[dict] = (
-            []
-        )  # Track messages for providers without thread support
+        # Track messages for providers without thread support
+        conversation_messages = Conversation()
 
         # If resuming session, we need agent immediately to restore context
         if resume_session:
@@ -452,6 +481,12 @@ async def run_chat_mode(
                                     logger.debug(f"[PERF] httpx cleanup: {e}")
                     except Exception as e:
                         logger.warning(f"[PERF] Chat client close failed: {e}")
+                    finally:
+                        # Closed clients must not be handed to later Agent instances
+                        clear_chat_client_cache()
+                        from agent.utils.http import close_shared_http_client
+
+                        await close_shared_http_client()
 
                     logger.info(
                         f"[PERF] Exit cleanup completed: {(time.perf_counter() - exit_start)*1000:.1f}ms"
@@ -471,6 +506,7 @@ async def run_chat_mode(
                             f"[PERF] Agent lazy init for /clear: {(time.perf_counter() - init_start)*1000:.1f}ms"
                         )
                     thread, message_count = await handle_clear_command(agent, console)
+                    conversation_messages.clear()
                     continue
                 elif cmd in Commands.CONTINUE:
                     # Create agent if needed (lazy init)
@@ -486,6 +522,7 @@ async def run_chat_mode(
                     if result_thread is not None:
                         thread = result_thread
                         message_count = result_count
+                        conversation_messages.clear()
                     continue
                 elif cmd in Commands.PURGE:
                     await handle_purge_command(persistence, session, console)
@@ -572,6 +609,12 @@ async def run_chat_mode(
                                 logger.debug(f"[PERF] httpx cleanup: {e}")
                 except Exception as e:
                     logger.warning(f"[PERF] Chat client close failed: {e}")
+                finally:
+                    # Closed clients must not be handed to later Agent instances
+                    clear_chat_client_cache()
+                    from agent.utils.http import close_shared_http_client
+
+                    await close_shared_http_client()
 
                 logger.info(
                     f"[PERF] Exit cleanup completed: {(time.perf_counter() - exit_start)*1000:.1f}ms"
@@ -625,6 +668,8 @@ async def run_chat_mode(
         # Restore connection string if we hid it
         if "saved_connection_string" in locals() and saved_connection_string:
             os.environ["APPLICATIONINSIGHTS_CONNECTION_STRING"] = saved_connection_string
+        if "agent" in locals() and agent is not None:
+            agent.close()
         # Log when function actually exits
         logger.info(
             f"[PERF] run_chat_mode() exiting after {(time.perf_counter() - perf_start)*1000:.1f}ms total"
@@ -2,7 +2,11 @@
 
 import logging
 import os
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +19,61 @@ from agent.persistence import ThreadPersistence
 
 logger = logging.getLogger(__name__)
 
+# Most recent sessions shown by the /continue picker
+SESSION_PICKER_LIMIT = 50
+
+
+@dataclass
+class Conversation:
+    """Conversation transcript tracked for providers without thread support.
+
+    Stored as parallel arrays (role codes and contents) rather than one dict per
+    message, so each turn only appends primitives. Converted to the persisted
+    message-dict format once, when the session is saved.
+
+    Example:
+        >>> conversation = Conversation()
+        >>> conversation.append("user", "Hello")
+        >>> conversation.to_messages()
+        [{'role': 'user', 'content': 'Hello'}]
+    """
+
+    ROLES = ("user", "assistant")
+
+    roles: array = field(default_factory=lambda: array("b"))
+    contents: list[str] = field(default_factory=list)
+
+    def append(self, role: str, content: str) -> None:
+        """Append a message.
+
+        Args:
+            role: Message role ("user" or "assistant")
+            content: Message text
+        """
+        self.roles.append(self.ROLES.index(role))
+        self.contents.append(content)
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        del self.roles[:]
+        self.contents.clear()
+
+    def to_messages(self) -> list[dict]:
+        """Convert to the message-dict list used by ThreadPersistence.
+
+        Returns:
+            List of {"role": ..., "content": ...} dicts in conversation order
+        """
+        roles = self.ROLES
+        return [
+            {"role": roles[code], "content": content}
+            for code, content in zip(self.roles, self.contents, strict=True)
+        ]
+
+    def __len__(self) -> int:
+        """Number of messages."""
+        return len(self.contents)
+
 
 def setup_session_logging(
     session_name: str | None = None, config: AgentSettings | None = None
@@ -114,7 +173,7 @@ async def auto_save_session(
     thread: Any,
     message_count: int,
     quiet: bool,
-    messages: list[dict] | None = None,
+    messages: Conversation | None = None,
     console: Console | None = None,
     session_name: str | None = None,
     agent: Agent | None = None,
@@ -127,7 +186,7 @@ async def auto_save_session(
         thread: Conversation thread (can be None for some providers)
         message_count: Number of messages in session
         quiet: Whether to suppress output
-        messages: Optional list of tracked messages for providers without thread support
+        messages: Optional tracked conversation for providers without thread support
         console: Console for output (optional)
         session_name: Optional session name (if not provided, generates timestamp)
         agent: Optional Agent instance for memory saving
@@ -153,7 +212,7 @@ async def auto_save_session(
                 thread,
                 session_name,
                 description="Auto-saved session",
-                messages=messages,
+                messages=messages.to_messages() if messages else None,
             )
 
             # Save memory state if agent has memory enabled and using in-memory backend
@@ -207,17 +266,68 @@ async def auto_save_session(
                 console.print(f"\n[yellow]Failed to auto-save session: {e}[/yellow]")
 
 
-def track_conversation(messages: list[dict], user_input: str, response: Any) -> None:
+# Response text extractor per response type, resolved on first use
+_text_extractors: dict[type, Callable[[Any], str]] = {str: str}
+
+
+def _instance_text(response: Any) -> str:
+    """Extract text from a response whose type does not declare .text."""
+    return response.text if hasattr(response, "text") else str(response)
+
+
+def _response_text(response: Any) -> str:
+    """Extract response text, dispatching on the response type.
+
+    Types that declare a .text attribute (AgentRunResponse) read it directly;
+    other types fall back to a per-instance check.
+
+    Args:
+        response: Agent response (str or object with .text attribute)
+
+    Returns:
+        Response text
+    """
+    response_type = type(response)
+    extractor = _text_extractors.get(response_type)
+    if extractor is None:
+        extractor = attrgetter("text") if hasattr(response_type, "text") else _instance_text
+        _text_extractors[response_type] = extractor
+    return extractor(response)
+
+
+def track_conversation(messages: Conversation, user_input: str, response: Any) -> None:
     """Track conversation messages for persistence.
 
     Args:
-        messages: List to append messages to
+        messages: Conversation to append messages to
         user_input: User's input message
         response: Agent's response (str or object with .text attribute)
     """
-    messages.append({"role": "user", "content": user_input})
-    response_text = response.text if hasattr(response, "text") else str(response)
-    messages.append({"role": "assistant", "content": response_text})
+    messages.append("user", user_input)
+    messages.append("assistant", _response_text(response))
+
+
+def _format_time_ago(created: str, now: datetime) -> str:
+    """Format an ISO timestamp relative to now (e.g. "3d ago").
+
+    Args:
+        created: ISO 8601 creation timestamp
+        now: Reference time, computed once per listing
+
+    Returns:
+        Relative time string, or "unknown" if the timestamp cannot be parsed
+    """
+    try:
+        delta = now - datetime.fromisoformat(created)
+    except (TypeError, ValueError):
+        return "unknown"
+
+    if delta.days > 0:
+        return f"{delta.days}d ago"
+    elif delta.seconds > 3600:
+        return f"{delta.seconds // 3600}h ago"
+    else:
+        return f"{delta.seconds // 60}m ago"
 
 
 async def pick_session(
@@ -235,35 +345,24 @@ async def pick_session(
     Returns:
         Tuple of (session_name, thread, context_summary) or (None, None, None) if cancelled
     """
-    sessions = persistence.list_sessions()
+    sessions = persistence.list_sessions(limit=SESSION_PICKER_LIMIT)
     if not sessions:
         console.print("\n[yellow]No saved sessions available[/yellow]\n")
         return None, None, None
 
-    # Show session picker
-    console.print("\n[bold]Available Sessions:[/bold]")
+    # Show session picker (rendered as one block: one Rich render for all rows)
+    now = datetime.now()
+    lines = ["\n[bold]Available Sessions:[/bold]"]
     for i, sess in enumerate(sessions, 1):
-        created = sess.get("created_at", "")
-        # Calculate time ago
-        try:
-            created_dt = datetime.fromisoformat(created)
-            now = datetime.now()
-            delta = now - created_dt
-            if delta.days > 0:
-                time_ago = f"{delta.days}d ago"
-            elif delta.seconds > 3600:
-                time_ago = f"{delta.seconds // 3600}h ago"
-            else:
-                time_ago = f"{delta.seconds // 60}m ago"
-        except Exception:
-            time_ago = "unknown"
+        time_ago = _format_time_ago(sess.get("created_at", ""), now)
 
         # Get first message preview
         first_msg = sess.get("first_message", "")
         if len(first_msg) > 50:
             first_msg = first_msg[:47] + "..."
 
-        console.print(f"  {i}. [cyan]{sess['name']}[/cyan] [dim]({time_ago})[/dim] \"{first_msg}\"")
+        lines.append(f"  {i}. [cyan]{sess['name']}[/cyan] [dim]({time_ago})[/dim] \"{first_msg}\"")
+    console.print("\n".join(lines))
 
     # Get user selection
     try:
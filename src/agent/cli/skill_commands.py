@@ -1,33 +1,53 @@
 """CLI commands for managing agent skills."""
 
 import logging
+import os
+from functools import lru_cache
 from importlib import resources
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.prompt import Confirm, Prompt
 
 from agent.cli.utils import get_console
-from agent.config import (
-    load_config,
-    save_config,
-)
-from agent.config.schema import PluginSkillSource
-from agent.skills.manager import SkillManager
-from agent.skills.manifest import SkillManifest
-from agent.skills.registry import SkillRegistry
+from agent.config import edit_config, load_config
+from agent.config.schema import AgentSettings, PluginSkillSource
 from agent.skills.security import normalize_skill_name
 
+if TYPE_CHECKING:
+    from agent.skills.manifest import SkillManifest
+
 console = get_console()
 logger = logging.getLogger(__name__)
 
 
-def _get_toolset_tools(manifest: SkillManifest, skill_path: Path) -> list[tuple[str, int]]:
+def _index_settings(
+    settings: AgentSettings,
+) -> tuple[dict[str, PluginSkillSource], set[str], set[str]]:
+    """Index skill settings by canonical name.
+
+    Args:
+        settings: Loaded agent settings
+
+    Returns:
+        Tuple of (plugins by canonical name, disabled bundled names, enabled bundled names)
+    """
+    plugins_by_canonical = settings.skills.plugins_by_canonical()
+    disabled_bundled = {normalize_skill_name(s) for s in settings.skills.disabled_bundled}
+    enabled_bundled = {normalize_skill_name(s) for s in settings.skills.enabled_bundled}
+    return plugins_by_canonical, disabled_bundled, enabled_bundled
+
+
+def _get_toolset_tools(
+    manifest: "SkillManifest", skill_path: Path, settings: AgentSettings | None = None
+) -> list[tuple[str, int]]:
     """Extract tools from skill's toolsets with their token counts.
 
     Args:
         manifest: Parsed skill manifest
         skill_path: Path to skill directory
+        settings: Settings for toolset instantiation (loaded once if None)
 
     Returns:
         List of (tool_name, token_count) tuples
@@ -68,9 +88,10 @@ def _get_toolset_tools(manifest: SkillManifest, skill_path: Path) -> list[tuple[
                 # Get toolset class and instantiate
                 toolset_class = getattr(module, class_name, None)
                 if toolset_class:
-                    # Create minimal config for toolset instantiation
-                    config = load_config()
-                    toolset_instance = toolset_class(config)
+                    # Load config once for all toolsets of this skill
+                    if settings is None:
+                        settings = load_config()
+                    toolset_instance = toolset_class(settings)
 
                     # Get tools from toolset
                     tools = toolset_instance.get_tools()
@@ -90,11 +111,13 @@ def _get_toolset_tools(manifest: SkillManifest, skill_path: Path) -> list[tuple[
     return tools_info
 
 
+@lru_cache(maxsize=1)
 def _get_repo_paths() -> tuple[Path, str]:
     """Get repository root and bundled skills directory paths.
 
     Uses importlib.resources to find bundled skills in package.
-    Falls back to file-based detection for development.
+    Falls back to file-based detection for development. The package location
+    does not change within a process, so the result is cached.
 
     Returns:
         tuple: (repo_root, bundled_dir) where bundled_dir is a string path
@@ -129,6 +152,8 @@ class _MockConfig:
 
 def manage_skills() -> None:
     """Unified skill management interface (enable/disable/remove/update)."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold]Manage Skills[/bold]\n")
 
     try:
@@ -150,8 +175,7 @@ def manage_skills() -> None:
             loader = SkillLoader(_MockConfig())
             bundled_skills = loader.scan_skill_directory(bundled_path)
 
-            disabled_bundled = {normalize_skill_name(s) for s in settings.skills.disabled_bundled}
-            enabled_bundled = {normalize_skill_name(s) for s in settings.skills.enabled_bundled}
+            _, disabled_bundled, enabled_bundled = _index_settings(settings)
 
             for skill_dir in bundled_skills:
                 skill_name = skill_dir.name
@@ -196,13 +220,16 @@ def manage_skills() -> None:
             return
 
         # Display skills with status
-        console.print("[bold]Installed Skills:[/bold]\n")
-        for i, skill in enumerate(all_skills, 1):
-            status_icon = "[green]◉[/green]" if skill["enabled"] else "[dim]○[/dim]"
-            type_label = f"[dim]({skill['type']})[/dim]"
-            console.print(f"{i}. {status_icon} {skill['name']} {type_label} · {skill['source']}")
+        with console:
+            console.print("[bold]Installed Skills:[/bold]\n")
+            for i, skill in enumerate(all_skills, 1):
+                status_icon = "[green]◉[/green]" if skill["enabled"] else "[dim]○[/dim]"
+                type_label = f"[dim]({skill['type']})[/dim]"
+                console.print(
+                    f"{i}. {status_icon} {skill['name']} {type_label} · {skill['source']}"
+                )
 
-        console.print(f"{len(all_skills) + 1}. Back")
+            console.print(f"{len(all_skills) + 1}. Back")
 
         choice = Prompt.ask("\nSelect skill to manage", default=str(len(all_skills) + 1))
 
@@ -288,27 +315,32 @@ def show_skills() -> None:
             # Auto-detect
             _, bundled_dir = _get_repo_paths()
 
-        # Scan bundled skills
+        from agent.skills.loader import SkillLoader
+
+        # Stream bundled skills: each one is printed as the directory walk finds it
         bundled_path = Path(bundled_dir)
-        bundled_skills = []
-        if bundled_path.exists():
-            from agent.skills.loader import SkillLoader
+        bundled_skills = SkillLoader(_MockConfig()).iter_skill_directory(bundled_path)
+        first_bundled = next(bundled_skills, None)
+
+        # Nothing to list: skip manifest parsing and token counting imports entirely
+        if first_bundled is None and not settings.skills.plugins:
+            console.print("[dim]No skills found[/dim]")
+            console.print("[dim]Run 'agent skill install <git-url>' to install skills[/dim]\n")
+            return
+
+        if first_bundled is None:
+            console.print("[bold]Bundled:[/bold] [dim]None found[/dim]")
+        else:
             from agent.skills.manifest import parse_skill_manifest
             from agent.utils.tokens import count_tokens
 
-            loader = SkillLoader(_MockConfig())
-            bundled_skills = loader.scan_skill_directory(bundled_path)
-
-        # Display bundled skills
-        if bundled_skills:
             console.print("[bold]Bundled:[/bold]")
-            disabled_bundled = {normalize_skill_name(s) for s in settings.skills.disabled_bundled}
-            enabled_bundled = {normalize_skill_name(s) for s in settings.skills.enabled_bundled}
-
-            for skill_dir in bundled_skills:
-                from agent.skills.manifest import parse_skill_manifest
-                from agent.utils.tokens import count_tokens
+            _, disabled_bundled, enabled_bundled = _index_settings(settings)
+            # Skills are direct children of bundled_path, so their location relative
+            # to its parent is just "<bundled dir name>/<skill name>"
+            location_prefix = bundled_path.name + os.sep
 
+            for skill_dir in chain((first_bundled,), bundled_skills):
                 skill_name = skill_dir.name
                 canonical = normalize_skill_name(skill_name)
 
@@ -332,26 +364,26 @@ def show_skills() -> None:
                     enabled = True  # Fallback to enabled if can't parse
 
                 status_icon = "[green]◉[/green]" if enabled else "[dim]○[/dim]"
-                location = str(skill_dir.relative_to(bundled_path.parent))
+                location = location_prefix + skill_name
 
-                console.print(
-                    f"  {status_icon} {skill_name} [dim]({location})[/dim] · [dim]{token_count} tokens[/dim]"
-                )
+                # One write per skill (row plus its tools)
+                with console:
+                    console.print(
+                        f"  {status_icon} {skill_name} [dim]({location})[/dim] · [dim]{token_count} tokens[/dim]"
+                    )
 
-                # Display tools if skill has toolsets
-                try:
-                    tools_info = _get_toolset_tools(manifest, skill_dir)
-                    if tools_info:
-                        console.print("    [dim]Tools:[/dim]")
-                        for tool_name, tool_tokens in tools_info:
-                            console.print(
-                                f"      [dim]• {tool_name}[/dim] · [dim]{tool_tokens} tokens[/dim]"
-                            )
-                except Exception:
-                    # Silently skip if tool extraction fails
-                    pass
-        else:
-            console.print("[bold]Bundled:[/bold] [dim]None found[/dim]")
+                    # Display tools if skill has toolsets
+                    try:
+                        tools_info = _get_toolset_tools(manifest, skill_dir, settings)
+                        if tools_info:
+                            console.print("    [dim]Tools:[/dim]")
+                            for tool_name, tool_tokens in tools_info:
+                                console.print(
+                                    f"      [dim]• {tool_name}[/dim] · [dim]{tool_tokens} tokens[/dim]"
+                                )
+                    except Exception:
+                        # Silently skip if tool extraction fails
+                        pass
 
         # Display plugin skills
         console.print()  # Blank line before plugins section
@@ -359,6 +391,8 @@ def show_skills() -> None:
             console.print("[bold]Plugins:[/bold]")
 
             # Load registry to get commit SHA info
+            from agent.skills.registry import SkillRegistry
+
             registry = SkillRegistry()
             from agent.skills.manifest import parse_skill_manifest
             from agent.utils.tokens import count_tokens
@@ -371,6 +405,7 @@ def show_skills() -> None:
                 canonical_name = normalize_skill_name(plugin.name)
                 commit_short = "unknown"
                 token_count = 0
+                plugin_manifest: SkillManifest | None = None
 
                 try:
                     entry = registry.get(canonical_name)
@@ -378,9 +413,11 @@ def show_skills() -> None:
 
                     # Calculate token count from installed skill
                     if entry.installed_path and Path(entry.installed_path).exists():
-                        manifest = parse_skill_manifest(Path(entry.installed_path))
+                        plugin_manifest = parse_skill_manifest(Path(entry.installed_path))
                         token_count = (
-                            count_tokens(manifest.instructions) if manifest.instructions else 0
+                            count_tokens(plugin_manifest.instructions)
+                            if plugin_manifest.instructions
+                            else 0
                         )
                 except Exception:
                     # Registry entry not found or error reading manifest
@@ -388,25 +425,26 @@ def show_skills() -> None:
 
                 source_info = f"{git_url_short}, {plugin.branch}@{commit_short}"
 
-                console.print(
-                    f"  {status_icon} {plugin.name} [dim]({source_info})[/dim] · [dim]{token_count} tokens[/dim]"
-                )
+                # One write per skill (row plus its tools)
+                with console:
+                    console.print(
+                        f"  {status_icon} {plugin.name} [dim]({source_info})[/dim] · [dim]{token_count} tokens[/dim]"
+                    )
 
-                # Display tools if skill has toolsets
-                try:
-                    if entry.installed_path and Path(entry.installed_path).exists():
-                        skill_path = Path(entry.installed_path)
-                        manifest = parse_skill_manifest(skill_path)
-                        tools_info = _get_toolset_tools(manifest, skill_path)
-                        if tools_info:
-                            console.print("    [dim]Tools:[/dim]")
-                            for tool_name, tool_tokens in tools_info:
-                                console.print(
-                                    f"      [dim]• {tool_name}[/dim] · [dim]{tool_tokens} tokens[/dim]"
-                                )
-                except Exception:
-                    # Silently skip if tool extraction fails
-                    pass
+                    # Display tools if skill has toolsets (manifest parsed above)
+                    try:
+                        if plugin_manifest is not None:
+                            skill_path = Path(entry.installed_path)
+                            tools_info = _get_toolset_tools(plugin_manifest, skill_path, settings)
+                            if tools_info:
+                                console.print("    [dim]Tools:[/dim]")
+                                for tool_name, tool_tokens in tools_info:
+                                    console.print(
+                                        f"      [dim]• {tool_name}[/dim] · [dim]{tool_tokens} tokens[/dim]"
+                                    )
+                    except Exception:
+                        # Silently skip if tool extraction fails
+                        pass
         else:
             console.print("[bold]Plugins:[/bold] [dim]None installed[/dim]")
 
@@ -429,6 +467,10 @@ def install_skill(
         name: Optional skill name override for single-skill repos (default: inferred from SKILL.md)
         branch: Git branch to use (default: main)
     """
+    from rich.prompt import Prompt
+
+    from agent.skills.manager import SkillManager
+
     # Prompt for git_url if not provided
     if git_url is None:
         console.print()
@@ -440,64 +482,57 @@ def install_skill(
     console.print(f"\n[bold]Installing skill(s) from:[/bold] {git_url}\n")
 
     try:
-        # Load config
-        settings = load_config()
-
-        # Use skill manager to install
-        manager = SkillManager()
-
-        console.print("Cloning repository...")
-        installed_entries = manager.install(
-            git_url=git_url, skill_name=name, branch=branch, trusted=True
-        )
+        with edit_config() as settings:
+            # Use skill manager to install
+            manager = SkillManager()
 
-        # Display installed skills
-        if len(installed_entries) == 1:
-            entry = installed_entries[0]
-            console.print(f"[green]✓[/green] Installed skill: {entry.name}")
-            console.print(f"[dim]Location: {entry.installed_path}[/dim]\n")
-        else:
-            console.print(f"[green]✓[/green] Installed {len(installed_entries)} skills:\n")
-            for entry in installed_entries:
-                console.print(f"  [cyan]◉[/cyan] {entry.name}")
-                console.print(f"    [dim]{entry.installed_path}[/dim]")
-            console.print()
-
-        # Add each skill to config.skills.plugins
-        for entry in installed_entries:
-            canonical_name = entry.name_canonical
-
-            # Check if already exists in config
-            existing = next(
-                (
-                    p
-                    for p in settings.skills.plugins
-                    if normalize_skill_name(p.name) == canonical_name
-                ),
-                None,
+            console.print("Cloning repository...")
+            installed_entries = manager.install(
+                git_url=git_url, skill_name=name, branch=branch, trusted=True
             )
 
-            if existing:
-                console.print(
-                    f"[yellow]Skill '{entry.name}' already in config, updating...[/yellow]"
-                )
-                existing.git_url = git_url
-                existing.branch = branch
-                existing.installed_path = str(entry.installed_path)
-                existing.enabled = True
+            # Display installed skills
+            if len(installed_entries) == 1:
+                entry = installed_entries[0]
+                console.print(f"[green]✓[/green] Installed skill: {entry.name}")
+                console.print(f"[dim]Location: {entry.installed_path}[/dim]\n")
             else:
-                # Add new plugin
-                plugin = PluginSkillSource(
-                    name=canonical_name,
-                    git_url=git_url,
-                    branch=branch,
-                    enabled=True,
-                    installed_path=str(entry.installed_path),
-                )
-                settings.skills.plugins.append(plugin)
+                # Monorepo listing goes out as a single write
+                with console:
+                    console.print(f"[green]✓[/green] Installed {len(installed_entries)} skills:\n")
+                    for entry in installed_entries:
+                        console.print(f"  [cyan]◉[/cyan] {entry.name}")
+                        console.print(f"    [dim]{entry.installed_path}[/dim]")
+                    console.print()
+
+            # Add each skill to config.skills.plugins
+            plugins_by_canonical, _, _ = _index_settings(settings)
+            for entry in installed_entries:
+                canonical_name = entry.name_canonical
+
+                # Check if already exists in config
+                existing = plugins_by_canonical.get(canonical_name)
+
+                if existing:
+                    console.print(
+                        f"[yellow]Skill '{entry.name}' already in config, updating...[/yellow]"
+                    )
+                    existing.git_url = git_url
+                    existing.branch = branch
+                    existing.installed_path = str(entry.installed_path)
+                    existing.enabled = True
+                else:
+                    # Add new plugin
+                    plugin = PluginSkillSource(
+                        name=canonical_name,
+                        git_url=git_url,
+                        branch=branch,
+                        enabled=True,
+                        installed_path=str(entry.installed_path),
+                    )
+                    settings.skills.plugins.append(plugin)
+                    plugins_by_canonical[canonical_name] = plugin
 
-        # Save config
-        save_config(settings)
         console.print("[green]✓[/green] Configuration updated\n")
 
         if len(installed_entries) == 1:
@@ -520,6 +555,8 @@ def update_skill(name: str) -> None:
     Args:
         name: Skill name to update
     """
+    from agent.skills.manager import SkillManager
+
     console.print(f"\n[bold]Updating skill:[/bold] {name}\n")
 
     try:
@@ -528,10 +565,8 @@ def update_skill(name: str) -> None:
         canonical_name = normalize_skill_name(name)
 
         # Find plugin in config
-        plugin: PluginSkillSource | None = next(
-            (p for p in settings.skills.plugins if normalize_skill_name(p.name) == canonical_name),
-            None,
-        )
+        plugins_by_canonical, _, _ = _index_settings(settings)
+        plugin: PluginSkillSource | None = plugins_by_canonical.get(canonical_name)
 
         if not plugin:
             console.print(f"[red]Error: Skill '{name}' not found in plugin list[/red]")
@@ -561,76 +596,77 @@ def remove_skill(name: str | None = None, keep_files: bool = False, yes: bool =
         keep_files: If True, keep files but remove from config only
         yes: If True, skip confirmation prompt
     """
-    try:
-        # Load config
-        settings = load_config()
+    from rich.prompt import Confirm, Prompt
 
-        # If no name provided, show picker
-        if name is None:
-            if not settings.skills.plugins:
-                console.print("\n[yellow]No plugin skills installed[/yellow]")
-                console.print("[dim]Run 'agent skill install <git-url>' to install skills[/dim]\n")
-                return
+    from agent.skills.manager import SkillManager
+
+    try:
+        with edit_config() as settings:
+            # If no name provided, show picker
+            if name is None:
+                if not settings.skills.plugins:
+                    console.print("\n[yellow]No plugin skills installed[/yellow]")
+                    console.print(
+                        "[dim]Run 'agent skill install <git-url>' to install skills[/dim]\n"
+                    )
+                    return
 
-            console.print("\n[bold]Select skill to remove:[/bold]\n")
-            for i, p in enumerate(settings.skills.plugins, 1):
-                status = "[green]enabled[/green]" if p.enabled else "[red]disabled[/red]"
-                console.print(f"{i}. {p.name} · {status}")
+                with console:
+                    console.print("\n[bold]Select skill to remove:[/bold]\n")
+                    for i, p in enumerate(settings.skills.plugins, 1):
+                        status = "[green]enabled[/green]" if p.enabled else "[red]disabled[/red]"
+                        console.print(f"{i}. {p.name} · {status}")
 
-            console.print(f"{len(settings.skills.plugins) + 1}. Cancel")
+                    console.print(f"{len(settings.skills.plugins) + 1}. Cancel")
 
-            choice = Prompt.ask(
-                "\nChoose skill number", default=str(len(settings.skills.plugins) + 1)
-            )
+                choice = Prompt.ask(
+                    "\nChoose skill number", default=str(len(settings.skills.plugins) + 1)
+                )
 
-            try:
-                choice_num = int(choice)
-                if choice_num == len(settings.skills.plugins) + 1:
-                    console.print("Cancelled\n")
-                    return
-                if choice_num < 1 or choice_num > len(settings.skills.plugins):
+                try:
+                    choice_num = int(choice)
+                    if choice_num == len(settings.skills.plugins) + 1:
+                        console.print("Cancelled\n")
+                        return
+                    if choice_num < 1 or choice_num > len(settings.skills.plugins):
+                        console.print(f"[red]Invalid choice: {choice}[/red]\n")
+                        raise typer.Exit(1)
+
+                    name = settings.skills.plugins[choice_num - 1].name
+                except ValueError:
                     console.print(f"[red]Invalid choice: {choice}[/red]\n")
                     raise typer.Exit(1)
 
-                name = settings.skills.plugins[choice_num - 1].name
-            except ValueError:
-                console.print(f"[red]Invalid choice: {choice}[/red]\n")
-                raise typer.Exit(1)
+            console.print(f"\n[bold]Removing skill:[/bold] {name}\n")
 
-        console.print(f"\n[bold]Removing skill:[/bold] {name}\n")
+            canonical_name = normalize_skill_name(name)
 
-        canonical_name = normalize_skill_name(name)
+            # Find plugin in config
+            plugins_by_canonical, _, _ = _index_settings(settings)
+            plugin: PluginSkillSource | None = plugins_by_canonical.get(canonical_name)
 
-        # Find plugin in config
-        plugin: PluginSkillSource | None = next(
-            (p for p in settings.skills.plugins if normalize_skill_name(p.name) == canonical_name),
-            None,
-        )
-
-        if not plugin:
-            console.print(f"[red]Error: Skill '{name}' not found in plugin list[/red]")
-            console.print("[dim]Run 'agent skill show' to see installed skills[/dim]")
-            raise typer.Exit(1)
+            if not plugin:
+                console.print(f"[red]Error: Skill '{name}' not found in plugin list[/red]")
+                console.print("[dim]Run 'agent skill show' to see installed skills[/dim]")
+                raise typer.Exit(1)
 
-        # Confirm removal (unless --yes flag is set)
-        if not yes and not Confirm.ask(f"Remove skill '{name}' from configuration?"):
-            console.print("Cancelled")
-            return
+            # Confirm removal (unless --yes flag is set)
+            if not yes and not Confirm.ask(f"Remove skill '{name}' from configuration?"):
+                console.print("Cancelled")
+                return
 
-        if not keep_files:
-            # Use skill manager to delete files
-            manager = SkillManager()
-            console.print("Deleting skill files...")
-            manager.remove(canonical_name)
-            console.print("[green]✓[/green] Deleted skill files")
+            if not keep_files:
+                # Use skill manager to delete files
+                manager = SkillManager()
+                console.print("Deleting skill files...")
+                manager.remove(canonical_name)
+                console.print("[green]✓[/green] Deleted skill files")
 
-        # Remove from config
-        settings.skills.plugins = [
-            p for p in settings.skills.plugins if normalize_skill_name(p.name) != canonical_name
-        ]
+            # Remove from config
+            settings.skills.plugins = [
+                p for p in settings.skills.plugins if normalize_skill_name(p.name) != canonical_name
+            ]
 
-        # Save config
-        save_config(settings)
         console.print(f"[green]✓[/green] Removed '{name}' from configuration\n")
 
     except Exception as e:
@@ -647,129 +683,124 @@ def enable_skill(name: str | None = None) -> None:
     Args:
         name: Skill name to enable (shows picker if None)
     """
-    try:
-        # Load config
-        settings = load_config()
-
-        # If no name provided, show picker of disabled skills
-        if name is None:
-            # Get bundled skills directory to scan for disabled bundled skills
-            bundled_dir = settings.skills.bundled_dir
-            if bundled_dir is None:
-                _, bundled_dir = _get_repo_paths()
-
-            # Scan for bundled skills
-            bundled_path = Path(bundled_dir)
-            disabled_skills = []
-
-            if bundled_path.exists():
-                from agent.skills.loader import SkillLoader
+    from rich.prompt import Prompt
 
-                loader = SkillLoader(_MockConfig())
-                bundled_skills = loader.scan_skill_directory(bundled_path)
+    try:
+        with edit_config() as settings:
+            plugins_by_canonical, disabled_bundled, enabled_bundled = _index_settings(settings)
+
+            # If no name provided, show picker of disabled skills
+            if name is None:
+                # Get bundled skills directory to scan for disabled bundled skills
+                bundled_dir = settings.skills.bundled_dir
+                if bundled_dir is None:
+                    _, bundled_dir = _get_repo_paths()
+
+                # Scan for bundled skills
+                bundled_path = Path(bundled_dir)
+                disabled_skills = []
+
+                if bundled_path.exists():
+                    from agent.skills.loader import SkillLoader
+
+                    loader = SkillLoader(_MockConfig())
+                    bundled_skills = loader.scan_skill_directory(bundled_path)
+
+                    for skill_dir in bundled_skills:
+                        skill_name = skill_dir.name
+                        canonical = normalize_skill_name(skill_name)
+                        if canonical in disabled_bundled:
+                            disabled_skills.append((skill_name, "bundled"))
+
+                # Add disabled plugin skills
+                for p in settings.skills.plugins:
+                    if not p.enabled:
+                        disabled_skills.append((p.name, "plugin"))
+
+                if not disabled_skills:
+                    console.print("\n[yellow]All skills are already enabled[/yellow]")
+                    console.print("[dim]Run 'agent skill show' to see all skills[/dim]\n")
+                    return
 
-                disabled_bundled = {
-                    normalize_skill_name(s) for s in settings.skills.disabled_bundled
-                }
+                with console:
+                    console.print("\n[bold]Select skill to enable:[/bold]\n")
+                    for i, (skill_name, skill_type) in enumerate(disabled_skills, 1):
+                        console.print(f"{i}. {skill_name} [dim]({skill_type})[/dim]")
 
-                for skill_dir in bundled_skills:
-                    skill_name = skill_dir.name
-                    canonical = normalize_skill_name(skill_name)
-                    if canonical in disabled_bundled:
-                        disabled_skills.append((skill_name, "bundled"))
+                    console.print(f"{len(disabled_skills) + 1}. Cancel")
 
-            # Add disabled plugin skills
-            for p in settings.skills.plugins:
-                if not p.enabled:
-                    disabled_skills.append((p.name, "plugin"))
+                choice = Prompt.ask("\nChoose skill number", default=str(len(disabled_skills) + 1))
 
-            if not disabled_skills:
-                console.print("\n[yellow]All skills are already enabled[/yellow]")
-                console.print("[dim]Run 'agent skill show' to see all skills[/dim]\n")
-                return
+                try:
+                    choice_num = int(choice)
+                    if choice_num == len(disabled_skills) + 1:
+                        console.print("Cancelled\n")
+                        return
+                    if choice_num < 1 or choice_num > len(disabled_skills):
+                        console.print(f"[red]Invalid choice: {choice}[/red]\n")
+                        raise typer.Exit(1)
+
+                    name = disabled_skills[choice_num - 1][0]
+                except ValueError:
+                    console.print(f"[red]Invalid choice: {choice}[/red]\n")
+                    raise typer.Exit(1)
 
-            console.print("\n[bold]Select skill to enable:[/bold]\n")
-            for i, (skill_name, skill_type) in enumerate(disabled_skills, 1):
-                console.print(f"{i}. {skill_name} [dim]({skill_type})[/dim]")
+            console.print(f"\n[bold]Enabling skill:[/bold] {name}\n")
 
-            console.print(f"{len(disabled_skills) + 1}. Cancel")
+            canonical_name = normalize_skill_name(name)
+            skill_kind: str | None = None
 
-            choice = Prompt.ask("\nChoose skill number", default=str(len(disabled_skills) + 1))
+            # Check if it's a plugin
+            plugin = plugins_by_canonical.get(canonical_name)
 
-            try:
-                choice_num = int(choice)
-                if choice_num == len(disabled_skills) + 1:
-                    console.print("Cancelled\n")
+            if plugin:
+                # Enable plugin
+                if plugin.enabled:
+                    console.print(f"[yellow]Skill '{name}' is already enabled[/yellow]")
                     return
-                if choice_num < 1 or choice_num > len(disabled_skills):
-                    console.print(f"[red]Invalid choice: {choice}[/red]\n")
-                    raise typer.Exit(1)
 
-                name = disabled_skills[choice_num - 1][0]
-            except ValueError:
-                console.print(f"[red]Invalid choice: {choice}[/red]\n")
-                raise typer.Exit(1)
+                plugin.enabled = True
+                skill_kind = "plugin"
+            else:
+                # Bundled skill - check manifest for default_enabled
+                bundled_dir = settings.skills.bundled_dir
+                if bundled_dir is None:
+                    _, bundled_dir = _get_repo_paths()
 
-        console.print(f"\n[bold]Enabling skill:[/bold] {name}\n")
+                # Find and parse manifest to check default_enabled
+                bundled_path = Path(bundled_dir)
+                from agent.skills.loader import SkillLoader
+                from agent.skills.manifest import parse_skill_manifest
 
-        canonical_name = normalize_skill_name(name)
+                loader = SkillLoader(_MockConfig())
+                skill_dirs = loader.scan_skill_directory(bundled_path)
+                found_skill_dir = next(
+                    (d for d in skill_dirs if normalize_skill_name(d.name) == canonical_name), None
+                )
 
-        # Check if it's a plugin
-        plugin = next(
-            (p for p in settings.skills.plugins if normalize_skill_name(p.name) == canonical_name),
-            None,
-        )
+                if found_skill_dir is not None:
+                    manifest = parse_skill_manifest(found_skill_dir)
 
-        if plugin:
-            # Enable plugin
-            if plugin.enabled:
-                console.print(f"[yellow]Skill '{name}' is already enabled[/yellow]")
-                return
+                    # Remove from disabled_bundled (if present)
+                    if canonical_name in disabled_bundled:
+                        settings.skills.disabled_bundled = [
+                            s
+                            for s in settings.skills.disabled_bundled
+                            if normalize_skill_name(s) != canonical_name
+                        ]
 
-            plugin.enabled = True
-            save_config(settings)
-            console.print(f"[green]✓[/green] Enabled plugin skill: {name}")
-            console.print("Restart agent to load skill.")
-        else:
-            # Bundled skill - check manifest for default_enabled
-            bundled_dir = settings.skills.bundled_dir
-            if bundled_dir is None:
-                _, bundled_dir = _get_repo_paths()
+                    # If skill defaults to disabled, add to enabled_bundled
+                    if not manifest.default_enabled:
+                        if canonical_name not in enabled_bundled:
+                            settings.skills.enabled_bundled.append(canonical_name)
 
-            # Find and parse manifest to check default_enabled
-            bundled_path = Path(bundled_dir)
-            from agent.skills.loader import SkillLoader
-            from agent.skills.manifest import parse_skill_manifest
-
-            loader = SkillLoader(_MockConfig())
-            skill_dirs = loader.scan_skill_directory(bundled_path)
-            found_skill_dir = next(
-                (d for d in skill_dirs if normalize_skill_name(d.name) == canonical_name), None
-            )
-
-            if found_skill_dir is not None:
-                manifest = parse_skill_manifest(found_skill_dir)
-
-                # Remove from disabled_bundled (if present)
-                settings.skills.disabled_bundled = [
-                    s
-                    for s in settings.skills.disabled_bundled
-                    if normalize_skill_name(s) != canonical_name
-                ]
-
-                # If skill defaults to disabled, add to enabled_bundled
-                if not manifest.default_enabled:
-                    if canonical_name not in [
-                        normalize_skill_name(s) for s in settings.skills.enabled_bundled
-                    ]:
-                        settings.skills.enabled_bundled.append(canonical_name)
-
-                save_config(settings)
-                console.print(f"[green]✓[/green] Enabled bundled skill: {name}")
-                console.print("Restart agent to load skill.")
-            else:
-                console.print(f"[red]Bundled skill '{name}' not found[/red]")
+                    skill_kind = "bundled"
+                else:
+                    console.print(f"[red]Bundled skill '{name}' not found[/red]")
 
+        if skill_kind is not None:
+            console.print(f"[green]✓[/green] Enabled {skill_kind} skill: {name}")
+            console.print("Restart agent to load skill.")
         console.print()
 
     except Exception as e:
@@ -786,126 +817,122 @@ def disable_skill(name: str | None = None) -> None:
     Args:
         name: Skill name to disable (shows picker if None)
     """
-    try:
-        # Load config
-        settings = load_config()
+    from rich.prompt import Prompt
 
-        # If no name provided, show picker of enabled skills
-        if name is None:
-            # Get bundled skills directory
-            bundled_dir = settings.skills.bundled_dir
-            if bundled_dir is None:
-                _, bundled_dir = _get_repo_paths()
-
-            # Scan for enabled bundled skills
-            bundled_path = Path(bundled_dir)
-            enabled_skills = []
-
-            if bundled_path.exists():
-                from agent.skills.loader import SkillLoader
-
-                loader = SkillLoader(_MockConfig())
-                bundled_skills = loader.scan_skill_directory(bundled_path)
+    try:
+        with edit_config() as settings:
+            plugins_by_canonical, disabled_bundled, enabled_bundled = _index_settings(settings)
+
+            # If no name provided, show picker of enabled skills
+            if name is None:
+                # Get bundled skills directory
+                bundled_dir = settings.skills.bundled_dir
+                if bundled_dir is None:
+                    _, bundled_dir = _get_repo_paths()
+
+                # Scan for enabled bundled skills
+                bundled_path = Path(bundled_dir)
+                enabled_skills = []
+
+                if bundled_path.exists():
+                    from agent.skills.loader import SkillLoader
+
+                    loader = SkillLoader(_MockConfig())
+                    bundled_skills = loader.scan_skill_directory(bundled_path)
+
+                    for skill_dir in bundled_skills:
+                        skill_name = skill_dir.name
+                        canonical = normalize_skill_name(skill_name)
+                        if canonical not in disabled_bundled:
+                            enabled_skills.append((skill_name, "bundled"))
+
+                # Add enabled plugin skills
+                for p in settings.skills.plugins:
+                    if p.enabled:
+                        enabled_skills.append((p.name, "plugin"))
+
+                if not enabled_skills:
+                    console.print("\n[yellow]No skills are currently enabled[/yellow]\n")
+                    return
 
-                disabled_bundled = {
-                    normalize_skill_name(s) for s in settings.skills.disabled_bundled
-                }
+                with console:
+                    console.print("\n[bold]Select skill to disable:[/bold]\n")
+                    for i, (skill_name, skill_type) in enumerate(enabled_skills, 1):
+                        console.print(f"{i}. {skill_name} [dim]({skill_type})[/dim]")
 
-                for skill_dir in bundled_skills:
-                    skill_name = skill_dir.name
-                    canonical = normalize_skill_name(skill_name)
-                    if canonical not in disabled_bundled:
-                        enabled_skills.append((skill_name, "bundled"))
+                    console.print(f"{len(enabled_skills) + 1}. Cancel")
 
-            # Add enabled plugin skills
-            for p in settings.skills.plugins:
-                if p.enabled:
-                    enabled_skills.append((p.name, "plugin"))
+                choice = Prompt.ask("\nChoose skill number", default=str(len(enabled_skills) + 1))
 
-            if not enabled_skills:
-                console.print("\n[yellow]No skills are currently enabled[/yellow]\n")
-                return
+                try:
+                    choice_num = int(choice)
+                    if choice_num == len(enabled_skills) + 1:
+                        console.print("Cancelled\n")
+                        return
+                    if choice_num < 1 or choice_num > len(enabled_skills):
+                        console.print(f"[red]Invalid choice: {choice}[/red]\n")
+                        raise typer.Exit(1)
+
+                    name = enabled_skills[choice_num - 1][0]
+                except ValueError:
+                    console.print(f"[red]Invalid choice: {choice}[/red]\n")
+                    raise typer.Exit(1)
 
-            console.print("\n[bold]Select skill to disable:[/bold]\n")
-            for i, (skill_name, skill_type) in enumerate(enabled_skills, 1):
-                console.print(f"{i}. {skill_name} [dim]({skill_type})[/dim]")
+            console.print(f"\n[bold]Disabling skill:[/bold] {name}\n")
 
-            console.print(f"{len(enabled_skills) + 1}. Cancel")
+            canonical_name = normalize_skill_name(name)
+            skill_kind: str | None = None
 
-            choice = Prompt.ask("\nChoose skill number", default=str(len(enabled_skills) + 1))
+            # Check if it's a plugin
+            plugin = plugins_by_canonical.get(canonical_name)
 
-            try:
-                choice_num = int(choice)
-                if choice_num == len(enabled_skills) + 1:
-                    console.print("Cancelled\n")
+            if plugin:
+                # Disable plugin
+                if not plugin.enabled:
+                    console.print(f"[yellow]Skill '{name}' is already disabled[/yellow]")
                     return
-                if choice_num < 1 or choice_num > len(enabled_skills):
-                    console.print(f"[red]Invalid choice: {choice}[/red]\n")
-                    raise typer.Exit(1)
-
-                name = enabled_skills[choice_num - 1][0]
-            except ValueError:
-                console.print(f"[red]Invalid choice: {choice}[/red]\n")
-                raise typer.Exit(1)
 
-        console.print(f"\n[bold]Disabling skill:[/bold] {name}\n")
-
-        canonical_name = normalize_skill_name(name)
+                plugin.enabled = False
+                skill_kind = "plugin"
+            else:
+                # Bundled skill - check manifest for default_enabled
+                bundled_dir = settings.skills.bundled_dir
+                if bundled_dir is None:
+                    _, bundled_dir = _get_repo_paths()
 
-        # Check if it's a plugin
-        plugin = next(
-            (p for p in settings.skills.plugins if normalize_skill_name(p.name) == canonical_name),
-            None,
-        )
+                # Find and parse manifest to check default_enabled
+                bundled_path = Path(bundled_dir)
+                from agent.skills.loader import SkillLoader
+                from agent.skills.manifest import parse_skill_manifest
 
-        if plugin:
-            # Disable plugin
-            if not plugin.enabled:
-                console.print(f"[yellow]Skill '{name}' is already disabled[/yellow]")
-                return
+                loader = SkillLoader(_MockConfig())
+                skill_dirs = loader.scan_skill_directory(bundled_path)
+                found_skill_dir = next(
+                    (d for d in skill_dirs if normalize_skill_name(d.name) == canonical_name), None
+                )
 
-            plugin.enabled = False
-            save_config(settings)
-            console.print(f"[green]✓[/green] Disabled plugin skill: {name}")
-        else:
-            # Bundled skill - check manifest for default_enabled
-            bundled_dir = settings.skills.bundled_dir
-            if bundled_dir is None:
-                _, bundled_dir = _get_repo_paths()
+                if found_skill_dir is not None:
+                    manifest = parse_skill_manifest(found_skill_dir)
 
-            # Find and parse manifest to check default_enabled
-            bundled_path = Path(bundled_dir)
-            from agent.skills.loader import SkillLoader
-            from agent.skills.manifest import parse_skill_manifest
+                    # Remove from enabled_bundled (if present)
+                    if canonical_name in enabled_bundled:
+                        settings.skills.enabled_bundled = [
+                            s
+                            for s in settings.skills.enabled_bundled
+                            if normalize_skill_name(s) != canonical_name
+                        ]
 
-            loader = SkillLoader(_MockConfig())
-            skill_dirs = loader.scan_skill_directory(bundled_path)
-            found_skill_dir = next(
-                (d for d in skill_dirs if normalize_skill_name(d.name) == canonical_name), None
-            )
+                    # If skill defaults to enabled, add to disabled_bundled
+                    if manifest.default_enabled:
+                        if canonical_name not in disabled_bundled:
+                            settings.skills.disabled_bundled.append(canonical_name)
 
-            if found_skill_dir is not None:
-                manifest = parse_skill_manifest(found_skill_dir)
-
-                # Remove from enabled_bundled (if present)
-                settings.skills.enabled_bundled = [
-                    s
-                    for s in settings.skills.enabled_bundled
-                    if normalize_skill_name(s) != canonical_name
-                ]
-
-                # If skill defaults to enabled, add to disabled_bundled
-                if manifest.default_enabled:
-                    if canonical_name not in [
-                        normalize_skill_name(s) for s in settings.skills.disabled_bundled
-                    ]:
-                        settings.skills.disabled_bundled.append(canonical_name)
-
-                save_config(settings)
-                console.print(f"[green]✓[/green] Disabled bundled skill: {name}")
-            else:
-                console.print(f"[red]Bundled skill '{name}' not found[/red]")
+                    skill_kind = "bundled"
+                else:
+                    console.print(f"[red]Bundled skill '{name}' not found[/red]")
 
+        if skill_kind is not None:
+            console.print(f"[green]✓[/green] Disabled {skill_kind} skill: {name}")
         console.print()
 
     except Exception as e:
@@ -4,11 +4,13 @@ import logging
 import os
 import platform
 import sys
-from typing import Any
+import time
+from typing import IO, TYPE_CHECKING, Any
 
 from rich.console import Console
 
-from agent.config.schema import AgentSettings
+if TYPE_CHECKING:
+    from agent.config.schema import AgentSettings
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,67 @@ def get_console() -> Console:
         return Console()
 
 
-def hide_connection_string_if_otel_disabled(config: AgentSettings) -> str | None:
+class CoalescingWriter:
+    """Write streamed text with coalesced flushes.
+
+    Printing each streamed chunk through Rich re-parses markup and flushes the
+    terminal per chunk. This writer buffers raw text and writes it out once enough
+    has accumulated or a short interval has passed, so fast streams stay smooth.
+
+    Example:
+        >>> writer = CoalescingWriter(sys.stdout)
+        >>> async for chunk in agent.run_stream("Say hello"):
+        ...     writer.write(chunk)
+        >>> writer.flush()
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        flush_interval: float = 0.016,
+        flush_size: int = 64,
+    ):
+        """Initialize writer.
+
+        Args:
+            stream: Text stream to write to (e.g. sys.stdout or console.file)
+            flush_interval: Seconds after which buffered text is written out
+            flush_size: Buffered characters after which text is written out
+        """
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        """Buffer text, writing it out if the size or time threshold is reached.
+
+        Args:
+            text: Text chunk to write
+        """
+        if not text:
+            return
+        self._parts.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self.flush_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered text and flush the stream."""
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        self.stream.flush()
+        self._last_flush = time.monotonic()
+
+
+def hide_connection_string_if_otel_disabled(config: "AgentSettings") -> str | None:
     """Conditionally hide Azure Application Insights connection string.
 
     The agent_framework auto-enables OpenTelemetry when it sees
@@ -82,7 +144,7 @@ def hide_connection_string_if_otel_disabled(config: AgentSettings) -> str | None
     return None
 
 
-def set_model_span_attributes(span: Any, config: AgentSettings) -> None:
+def set_model_span_attributes(span: Any, config: "AgentSettings") -> None:
     """Set OpenTelemetry span attributes based on provider and model configuration.
 
     Args:
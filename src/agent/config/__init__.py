@@ -13,6 +13,8 @@ from .editor import (
 )
 from .manager import (
     ConfigurationError,
+    clear_config_cache,
+    edit_config,
     get_config_path,
     load_config,
     load_config_with_env,
@@ -32,6 +34,8 @@ __all__ = [
     "MemoryConfig",
     # Manager
     "ConfigurationError",
+    "clear_config_cache",
+    "edit_config",
     "get_config_path",
     "load_config",
     "load_config_with_env",
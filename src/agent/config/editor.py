@@ -3,8 +3,12 @@
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+# Editors searched on PATH when EDITOR/VISUAL are unset, in order of preference
+COMMON_EDITORS = ("code", "vim", "nano", "vi")
+
 
 class EditorError(Exception):
     """Raised when editor operations fail."""
@@ -38,11 +42,15 @@ def detect_editor() -> str | None:
         return editor
 
     # Check common editors in order of preference (cross-platform)
-    common_editors = ["code", "vim", "nano", "vi"]
-    for editor in common_editors:
-        if shutil.which(editor):
-            return editor
+    return _find_common_editor(os.environ.get("PATH"))
+
 
+@lru_cache(maxsize=1)
+def _find_common_editor(search_path: str | None) -> str | None:
+    """Find the first common editor on PATH (cached per PATH value)."""
+    for editor in COMMON_EDITORS:
+        if shutil.which(editor, path=search_path):
+            return editor
     return None
 
 
@@ -51,7 +59,8 @@ def open_in_editor(file_path: Path, wait: bool = True) -> bool:
 
     Args:
         file_path: Path to file to open
-        wait: If True, wait for editor to close before returning
+        wait: If True, wait for editor to close before returning. Terminal
+            editors (anything but VSCode) always run in the foreground.
 
     Returns:
         True if editor opened successfully, False otherwise
@@ -82,11 +91,19 @@ def open_in_editor(file_path: Path, wait: bool = True) -> bool:
     try:
         # Special handling for VSCode
         if editor == "code":
+            if not wait:
+                # Hand off to the VSCode launcher without waiting for it
+                subprocess.Popen(
+                    [editor, str(file_path)],
+                    stdin=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+                return True
+
             # VSCode: use --wait flag to wait for editor to close
-            args = [editor, "--wait" if wait else "", str(file_path)]
-            args = [arg for arg in args if arg]  # Remove empty strings
+            args = [editor, "--wait", str(file_path)]
         else:
-            # Other editors
+            # Other editors need the terminal until they exit
             args = [editor, str(file_path)]
 
         result = subprocess.run(args, check=True)
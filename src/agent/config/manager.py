@@ -2,11 +2,15 @@
 
 import json
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
 
+from agent.utils.serialization import json_loads
+
 from .schema import AgentSettings
 
 
@@ -16,6 +20,43 @@ class ConfigurationError(Exception):
     pass
 
 
+# Validated settings by config path, with the file's (mtime_ns, size) when loaded.
+# Middleware loads configuration on every agent run and tool call; re-reading and
+# re-validating an unchanged file each time is wasted work.
+_config_cache: dict[Path, tuple[tuple[int, int], AgentSettings]] = {}
+
+# .env files already loaded into os.environ, as (path, mtime_ns)
+_dotenv_loaded: set[tuple[str, int]] = set()
+
+
+def clear_config_cache() -> None:
+    """Forget cached configuration so the next load_config() reads the file."""
+    _config_cache.clear()
+    _dotenv_loaded.clear()
+
+
+def _load_dotenv_cached() -> None:
+    """Load the nearest .env file, skipping the parse if it was already loaded unchanged.
+
+    Does nothing when no .env file is found.
+    """
+    from dotenv import find_dotenv, load_dotenv
+
+    path = find_dotenv()
+    if not path:
+        return
+
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return
+    if key in _dotenv_loaded:
+        return
+
+    load_dotenv(path)
+    _dotenv_loaded.add(key)
+
+
 def get_config_path() -> Path:
     """Get the path to the configuration file.
 
@@ -40,6 +81,7 @@ def load_config(config_path: Path | None = None) -> AgentSettings:
     Note:
         This function loads configuration from file only. For environment variable
         merging, use load_config_with_env() or manually apply merge_with_env().
+        Parsed settings are cached until the file changes (see clear_config_cache()).
 
     Example:
         >>> settings = load_config()
@@ -50,15 +92,28 @@ def load_config(config_path: Path | None = None) -> AgentSettings:
         config_path = get_config_path()
 
     # Return defaults if file doesn't exist
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return AgentSettings()
+    except OSError as e:
+        raise ConfigurationError(f"Failed to load configuration from {config_path}: {e}") from e
+
+    # Reuse settings validated from the same file version; callers get their own
+    # copy because settings objects are mutated before save_config()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = config_path.absolute()
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1].model_copy(deep=True)
 
     try:
-        with open(config_path) as f:
-            data = json.load(f)
+        data = json_loads(config_path.read_bytes())
 
         # Validate and load into Pydantic model
-        return AgentSettings(**data)
+        settings = AgentSettings(**data)
+        _config_cache[cache_key] = (signature, settings.model_copy(deep=True))
+        return settings
 
     except json.JSONDecodeError as e:
         raise ConfigurationError(f"Invalid JSON in configuration file {config_path}: {e}") from e
@@ -138,6 +193,7 @@ def save_config(settings: AgentSettings, config_path: Path | None = None) -> Non
             json_str = settings.model_dump_json_minimal()
             with open(config_path, "w") as f:
                 f.write(json_str)
+            _config_cache.pop(config_path.absolute(), None)
 
             # Set restrictive permissions on POSIX systems (user read/write only)
             if os.name != "nt":  # Not Windows
@@ -150,6 +206,94 @@ def save_config(settings: AgentSettings, config_path: Path | None = None) -> Non
         raise ConfigurationError(f"Failed to save configuration to {config_path}: {e}") from e
 
 
+@contextmanager
+def edit_config(config_path: Path | None = None) -> Iterator[AgentSettings]:
+    """Load configuration for editing and save it on exit only if it changed.
+
+    Changes are detected by comparing ``model_dump()`` before and after the block,
+    so commands that end up not modifying anything (cancelled pickers, skills that
+    are already enabled) don't rewrite the file. Nothing is saved if the block raises.
+
+    Args:
+        config_path: Optional path to config file. Defaults to ~/.agent/settings.json
+
+    Yields:
+        AgentSettings instance to mutate
+
+    Raises:
+        ConfigurationError: If loading or saving fails
+
+    Example:
+        >>> with edit_config() as settings:
+        ...     settings.providers.enabled = ["openai"]
+        # settings.json is written once, after the block
+    """
+    settings = load_config(config_path)
+    original = settings.model_dump()
+
+    yield settings
+
+    if settings.model_dump() != original:
+        save_config(settings, config_path)
+
+
+# Environment variables that override a string setting, as (variable, path to field)
+_ENV_OVERRIDES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("OPENAI_API_KEY", ("providers", "openai", "api_key")),
+    ("ANTHROPIC_API_KEY", ("providers", "anthropic", "api_key")),
+    ("AZURE_OPENAI_ENDPOINT", ("providers", "azure", "endpoint")),
+    ("AZURE_OPENAI_DEPLOYMENT_NAME", ("providers", "azure", "deployment")),
+    ("AZURE_OPENAI_API_KEY", ("providers", "azure", "api_key")),
+    ("AZURE_OPENAI_VERSION", ("providers", "azure", "api_version")),
+    ("AZURE_PROJECT_ENDPOINT", ("providers", "foundry", "project_endpoint")),
+    ("AZURE_MODEL_DEPLOYMENT", ("providers", "foundry", "model_deployment")),
+    ("GEMINI_API_KEY", ("providers", "gemini", "api_key")),
+    ("GEMINI_PROJECT_ID", ("providers", "gemini", "project_id")),
+    ("GEMINI_LOCATION", ("providers", "gemini", "location")),
+    ("LOCAL_BASE_URL", ("providers", "local", "base_url")),
+    ("LOCAL_MODEL", ("providers", "local", "model")),
+    ("AGENT_DATA_DIR", ("agent", "data_dir")),
+    ("OTLP_ENDPOINT", ("telemetry", "otlp_endpoint")),
+    (
+        "APPLICATIONINSIGHTS_CONNECTION_STRING",
+        ("telemetry", "applicationinsights_connection_string"),
+    ),
+    ("MEMORY_TYPE", ("memory", "type")),
+    ("MEM0_STORAGE_PATH", ("memory", "mem0", "storage_path")),
+    ("MEM0_API_KEY", ("memory", "mem0", "api_key")),
+    ("MEM0_ORG_ID", ("memory", "mem0", "org_id")),
+    ("MEM0_USER_ID", ("memory", "mem0", "user_id")),
+    ("MEM0_PROJECT_ID", ("memory", "mem0", "project_id")),
+)
+
+# Boolean settings overridden by environment flags ("true", case-insensitive)
+_ENV_FLAG_OVERRIDES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("GEMINI_USE_VERTEXAI", ("providers", "gemini", "use_vertexai")),
+    ("AGENT_RESPONSE_CACHE", ("agent", "response_cache_enabled")),
+    ("ENABLE_OTEL", ("telemetry", "enabled")),
+    ("ENABLE_SENSITIVE_DATA", ("telemetry", "enable_sensitive_data")),
+    ("MEMORY_ENABLED", ("memory", "enabled")),
+)
+
+# Providers whose model AGENT_MODEL overrides when selected via LLM_PROVIDER
+_AGENT_MODEL_PROVIDERS = frozenset({"openai", "anthropic", "gemini", "local"})
+
+
+def _set_override(overrides: dict[str, Any], path: tuple[str, ...], value: Any) -> None:
+    """Set a value in a nested overrides dict, creating intermediate dicts.
+
+    Args:
+        overrides: Nested overrides being built
+        path: Keys leading to the field (e.g., ("providers", "openai", "api_key"))
+        value: Value to set
+    """
+    *parents, key = path
+    node = overrides
+    for parent in parents:
+        node = node.setdefault(parent, {})
+    node[key] = value
+
+
 def merge_with_env(settings: AgentSettings) -> dict[str, Any]:
     """Merge configuration file settings with environment variable overrides.
 
@@ -167,10 +311,11 @@ def merge_with_env(settings: AgentSettings) -> dict[str, Any]:
         >>> env_overrides = merge_with_env(settings)
         >>> # Apply overrides to settings if needed
     """
+    env = os.environ
     env_overrides: dict[str, Any] = {}
 
     # Check if LLM_PROVIDER environment variable is set
-    llm_provider = os.getenv("LLM_PROVIDER")
+    llm_provider = env.get("LLM_PROVIDER")
 
     # If LLM_PROVIDER is set and not already in enabled list, add it
     if llm_provider and llm_provider not in settings.providers.enabled:
@@ -178,151 +323,33 @@ def merge_with_env(settings: AgentSettings) -> dict[str, Any]:
         enabled_list = [llm_provider] + settings.providers.enabled
         env_overrides.setdefault("providers", {})["enabled"] = enabled_list
 
-    # OpenAI overrides
-    if os.getenv("OPENAI_API_KEY"):
-        env_overrides.setdefault("providers", {}).setdefault("openai", {})["api_key"] = os.getenv(
-            "OPENAI_API_KEY"
-        )
-    if os.getenv("AGENT_MODEL") and llm_provider == "openai":
-        env_overrides.setdefault("providers", {}).setdefault("openai", {})["model"] = os.getenv(
-            "AGENT_MODEL"
-        )
-
-    # Anthropic overrides
-    if os.getenv("ANTHROPIC_API_KEY"):
-        env_overrides.setdefault("providers", {}).setdefault("anthropic", {})["api_key"] = (
-            os.getenv("ANTHROPIC_API_KEY")
-        )
-    if os.getenv("AGENT_MODEL") and llm_provider == "anthropic":
-        env_overrides.setdefault("providers", {}).setdefault("anthropic", {})["model"] = os.getenv(
-            "AGENT_MODEL"
-        )
-
-    # Azure OpenAI overrides
-    if os.getenv("AZURE_OPENAI_ENDPOINT"):
-        env_overrides.setdefault("providers", {}).setdefault("azure", {})["endpoint"] = os.getenv(
-            "AZURE_OPENAI_ENDPOINT"
-        )
-    if os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"):
-        env_overrides.setdefault("providers", {}).setdefault("azure", {})["deployment"] = os.getenv(
-            "AZURE_OPENAI_DEPLOYMENT_NAME"
-        )
-    if os.getenv("AZURE_OPENAI_API_KEY"):
-        env_overrides.setdefault("providers", {}).setdefault("azure", {})["api_key"] = os.getenv(
-            "AZURE_OPENAI_API_KEY"
-        )
-    if os.getenv("AZURE_OPENAI_VERSION"):
-        env_overrides.setdefault("providers", {}).setdefault("azure", {})["api_version"] = (
-            os.getenv("AZURE_OPENAI_VERSION")
-        )
-
-    # Azure AI Foundry overrides
-    if os.getenv("AZURE_PROJECT_ENDPOINT"):
-        env_overrides.setdefault("providers", {}).setdefault("foundry", {})["project_endpoint"] = (
-            os.getenv("AZURE_PROJECT_ENDPOINT")
-        )
-    if os.getenv("AZURE_MODEL_DEPLOYMENT"):
-        env_overrides.setdefault("providers", {}).setdefault("foundry", {})["model_deployment"] = (
-            os.getenv("AZURE_MODEL_DEPLOYMENT")
-        )
-
-    # Gemini overrides
-    if os.getenv("GEMINI_API_KEY"):
-        env_overrides.setdefault("providers", {}).setdefault("gemini", {})["api_key"] = os.getenv(
-            "GEMINI_API_KEY"
-        )
-    if os.getenv("GEMINI_PROJECT_ID"):
-        env_overrides.setdefault("providers", {}).setdefault("gemini", {})["project_id"] = (
-            os.getenv("GEMINI_PROJECT_ID")
-        )
-    if os.getenv("GEMINI_LOCATION"):
-        env_overrides.setdefault("providers", {}).setdefault("gemini", {})["location"] = os.getenv(
-            "GEMINI_LOCATION"
-        )
-    if os.getenv("GEMINI_USE_VERTEXAI"):
-        env_overrides.setdefault("providers", {}).setdefault("gemini", {})["use_vertexai"] = (
-            os.getenv("GEMINI_USE_VERTEXAI", "false").lower() == "true"
-        )
-    if os.getenv("AGENT_MODEL") and llm_provider == "gemini":
-        env_overrides.setdefault("providers", {}).setdefault("gemini", {})["model"] = os.getenv(
-            "AGENT_MODEL"
-        )
-
-    # Local provider overrides
-    if os.getenv("LOCAL_BASE_URL"):
-        env_overrides.setdefault("providers", {}).setdefault("local", {})["base_url"] = os.getenv(
-            "LOCAL_BASE_URL"
-        )
-    if os.getenv("LOCAL_MODEL"):
-        env_overrides.setdefault("providers", {}).setdefault("local", {})["model"] = os.getenv(
-            "LOCAL_MODEL"
-        )
-    if os.getenv("AGENT_MODEL") and llm_provider == "local":
-        env_overrides.setdefault("providers", {}).setdefault("local", {})["model"] = os.getenv(
-            "AGENT_MODEL"
-        )
-
-    # Agent config overrides
-    if os.getenv("AGENT_DATA_DIR"):
-        env_overrides.setdefault("agent", {})["data_dir"] = os.getenv("AGENT_DATA_DIR")
+    # Each variable is read once; unset and empty values leave the file setting alone
+    for var_name, path in _ENV_OVERRIDES:
+        value = env.get(var_name)
+        if value:
+            _set_override(env_overrides, path, value)
+
+    for var_name, path in _ENV_FLAG_OVERRIDES:
+        value = env.get(var_name)
+        if value:
+            _set_override(env_overrides, path, value.lower() == "true")
+
+    # AGENT_MODEL overrides the model of the provider selected by LLM_PROVIDER
+    agent_model = env.get("AGENT_MODEL")
+    if agent_model and llm_provider in _AGENT_MODEL_PROVIDERS:
+        _set_override(env_overrides, ("providers", llm_provider, "model"), agent_model)
 
     # Note: AGENT_SKILLS environment variable removed
     # Skills now configured via settings.skills (plugins, disabled_bundled)
 
-    # Telemetry overrides
-    if os.getenv("ENABLE_OTEL"):
-        env_overrides.setdefault("telemetry", {})["enabled"] = (
-            os.getenv("ENABLE_OTEL", "false").lower() == "true"
-        )
-    if os.getenv("ENABLE_SENSITIVE_DATA"):
-        env_overrides.setdefault("telemetry", {})["enable_sensitive_data"] = (
-            os.getenv("ENABLE_SENSITIVE_DATA", "false").lower() == "true"
-        )
-    if os.getenv("OTLP_ENDPOINT"):
-        env_overrides.setdefault("telemetry", {})["otlp_endpoint"] = os.getenv("OTLP_ENDPOINT")
-    if os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING"):
-        env_overrides.setdefault("telemetry", {})["applicationinsights_connection_string"] = (
-            os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
-        )
-
-    # Memory overrides
-    if os.getenv("MEMORY_ENABLED"):
-        env_overrides.setdefault("memory", {})["enabled"] = (
-            os.getenv("MEMORY_ENABLED", "true").lower() == "true"
-        )
-    if os.getenv("MEMORY_TYPE"):
-        env_overrides.setdefault("memory", {})["type"] = os.getenv("MEMORY_TYPE")
-    if os.getenv("MEMORY_HISTORY_LIMIT"):
+    history_limit = env.get("MEMORY_HISTORY_LIMIT")
+    if history_limit:
         try:
-            env_overrides.setdefault("memory", {})["history_limit"] = int(
-                os.getenv("MEMORY_HISTORY_LIMIT", "20")
-            )
+            env_overrides.setdefault("memory", {})["history_limit"] = int(history_limit)
         except ValueError:
             # Invalid value, fallback to default
             env_overrides.setdefault("memory", {})["history_limit"] = 20
 
-    # Mem0 overrides
-    if os.getenv("MEM0_STORAGE_PATH"):
-        env_overrides.setdefault("memory", {}).setdefault("mem0", {})["storage_path"] = os.getenv(
-            "MEM0_STORAGE_PATH"
-        )
-    if os.getenv("MEM0_API_KEY"):
-        env_overrides.setdefault("memory", {}).setdefault("mem0", {})["api_key"] = os.getenv(
-            "MEM0_API_KEY"
-        )
-    if os.getenv("MEM0_ORG_ID"):
-        env_overrides.setdefault("memory", {}).setdefault("mem0", {})["org_id"] = os.getenv(
-            "MEM0_ORG_ID"
-        )
-    if os.getenv("MEM0_USER_ID"):
-        env_overrides.setdefault("memory", {}).setdefault("mem0", {})["user_id"] = os.getenv(
-            "MEM0_USER_ID"
-        )
-    if os.getenv("MEM0_PROJECT_ID"):
-        env_overrides.setdefault("memory", {}).setdefault("mem0", {})["project_id"] = os.getenv(
-            "MEM0_PROJECT_ID"
-        )
-
     return env_overrides
 
 
@@ -357,10 +384,8 @@ def migrate_from_env() -> AgentSettings:
         >>> settings = migrate_from_env()
         >>> save_config(settings)
     """
-    from dotenv import load_dotenv
-
     # Load .env file if it exists
-    load_dotenv()
+    _load_dotenv_cached()
 
     # Determine which provider is configured
     llm_provider = os.getenv("LLM_PROVIDER", "local")
@@ -4,10 +4,13 @@ This module provides a protocol-based approach to provider configuration,
 eliminating the 400+ lines of duplication in config_commands.py.
 
 Pattern:
-    Each provider implements ProviderSetup protocol with three methods:
+    Each provider implements ProviderSetup protocol with these methods:
     - detect_credentials() - Check environment for existing credentials
     - prompt_user() - Interactive prompts for missing credentials
-    - configure() - Main entry point that orchestrates the above
+    - configure() - Main entry point that orchestrates the above (inherited
+      from ProviderSetupBase)
+    - validate() - Report required fields missing from the saved configuration
+    - display_name() - Format the configured model for display
 
 Registry:
     PROVIDER_REGISTRY maps provider names to their setup implementations,
@@ -19,7 +22,7 @@ Example:
     >>> settings.providers.openai.update(credentials)
 """
 
-from agent.config.providers.base import ProviderSetup
+from agent.config.providers.base import ProviderSetup, ProviderSetupBase
 from agent.config.providers.registry import PROVIDER_REGISTRY, get_provider_setup
 
-__all__ = ["ProviderSetup", "PROVIDER_REGISTRY", "get_provider_setup"]
+__all__ = ["ProviderSetup", "ProviderSetupBase", "PROVIDER_REGISTRY", "get_provider_setup"]
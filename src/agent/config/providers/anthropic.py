@@ -1,14 +1,21 @@
 """Anthropic provider configuration setup."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from agent.config.providers.base import (
+    ProviderSetupBase,
+    missing_fields,
+    prompt_if_missing,
+    show_env_credential,
+)
+from agent.config.schema import AnthropicProviderConfig
 
-from agent.config.providers.base import check_env_var, prompt_if_missing
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-class AnthropicSetup:
+class AnthropicSetup(ProviderSetupBase):
     """Anthropic provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -29,7 +36,7 @@ class AnthropicSetup:
 
         return credentials
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for Anthropic credentials.
 
         Args:
@@ -39,11 +46,9 @@ class AnthropicSetup:
         Returns:
             Complete Anthropic configuration
         """
-        # Check environment and display status
-        if not detected.get("api_key"):
-            api_key = check_env_var("ANTHROPIC_API_KEY", console, "ANTHROPIC_API_KEY")
-            if api_key:
-                detected["api_key"] = api_key
+        # Display status of a key found by detect_credentials()
+        if detected.get("api_key"):
+            show_env_credential(console, "ANTHROPIC_API_KEY")
 
         # Prompt for missing values
         api_key = prompt_if_missing(
@@ -58,14 +63,26 @@ class AnthropicSetup:
             "enabled": True,
         }
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure Anthropic provider.
+    def validate(self, config: AnthropicProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: Anthropic provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return missing_fields(
+            config, "Anthropic provider", ("api_key",), "Run: agent config enable anthropic"
+        )
+
+    def display_name(self, config: AnthropicProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: Anthropic provider configuration
 
         Returns:
-            Anthropic provider configuration
+            Model name with provider prefix (e.g., "Anthropic/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"Anthropic/{config.model}"
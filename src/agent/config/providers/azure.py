@@ -1,15 +1,16 @@
 """Azure OpenAI provider configuration setup."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.prompt import Prompt
+from agent.config.providers.base import ProviderSetupBase, missing_fields, show_env_credential
+from agent.config.schema import AzureOpenAIProviderConfig
 
-from agent.config.providers.base import check_env_var
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-class AzureSetup:
+class AzureSetup(ProviderSetupBase):
     """Azure OpenAI provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -34,7 +35,7 @@ class AzureSetup:
 
         return credentials
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for Azure OpenAI credentials.
 
         Args:
@@ -44,10 +45,14 @@ class AzureSetup:
         Returns:
             Complete Azure OpenAI configuration
         """
-        # Check environment variables
-        env_endpoint = check_env_var("AZURE_OPENAI_ENDPOINT", console, "Azure OpenAI config")
-        env_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-        env_key = os.getenv("AZURE_OPENAI_API_KEY")
+        from rich.prompt import Prompt
+
+        # Use credentials found by detect_credentials()
+        env_endpoint = detected.get("endpoint")
+        env_deployment = detected.get("deployment")
+        env_key = detected.get("api_key")
+        if env_endpoint:
+            show_env_credential(console, "Azure OpenAI config")
 
         if env_endpoint and env_deployment:
             console.print(f"  [dim]Endpoint: {env_endpoint}[/dim]")
@@ -79,14 +84,26 @@ class AzureSetup:
 
         return result
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure Azure OpenAI provider.
+    def validate(self, config: AzureOpenAIProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: Azure OpenAI provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return missing_fields(
+            config, "Azure provider", ("endpoint", "deployment"), "Run: agent config enable azure"
+        )
+
+    def display_name(self, config: AzureOpenAIProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: Azure OpenAI provider configuration
 
         Returns:
-            Azure OpenAI provider configuration
+            Model name with provider prefix (e.g., "Azure OpenAI/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"Azure OpenAI/{config.deployment or 'unknown'}"
@@ -5,11 +5,11 @@ implementations must follow, enabling consistent configuration
 across different LLM providers.
 """
 
-import os
-from typing import Any, Protocol
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Protocol
 
-from rich.console import Console
-from rich.prompt import Prompt
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 class ProviderSetup(Protocol):
@@ -31,7 +31,7 @@ class ProviderSetup(Protocol):
             >>> # {'api_key': 'sk-...', 'model': 'gpt-4o'}
         """
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for missing credentials interactively.
 
         Args:
@@ -48,7 +48,7 @@ class ProviderSetup(Protocol):
             >>> # Prompts for missing fields, uses detected for present ones
         """
 
-    def configure(self, console: Console) -> dict[str, Any]:
+    def configure(self, console: "Console") -> dict[str, Any]:
         """Configure provider with environment detection + user prompts.
 
         Main entry point that orchestrates credential detection and user input.
@@ -66,24 +66,88 @@ class ProviderSetup(Protocol):
             >>> settings.providers.openai.update(config)
         """
 
+    def validate(self, config: Any) -> list[str]:
+        """Check a provider configuration has the fields this provider requires.
 
-def check_env_var(var_name: str, console: Console, display_name: str | None = None) -> str | None:
-    """Check for environment variable and display status.
+        Args:
+            config: The provider's section of AgentSettings.providers
+
+        Returns:
+            List of validation errors (empty if valid)
+
+        Example:
+            >>> setup = PROVIDER_REGISTRY["openai"]
+            >>> setup.validate(settings.providers.openai)
+            ['OpenAI provider enabled but missing api_key. Run: agent config enable openai']
+        """
+
+    def display_name(self, config: Any) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: The provider's section of AgentSettings.providers
+
+        Returns:
+            Model name with provider prefix
+
+        Example:
+            >>> setup = PROVIDER_REGISTRY["openai"]
+            >>> setup.display_name(settings.providers.openai)
+            'OpenAI/gpt-5-mini'
+        """
+
+
+class ProviderSetupBase(ABC):
+    """Shared base for ProviderSetup implementations.
+
+    Provides configure() in terms of detect_credentials() and prompt_user(),
+    so providers only implement the provider-specific steps.
+    """
+
+    @abstractmethod
+    def detect_credentials(self) -> dict[str, Any]:
+        """Detect credentials from environment variables.
+
+        Returns:
+            Dictionary of detected credentials (empty if none found)
+        """
+
+    @abstractmethod
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
+        """Prompt user for missing credentials interactively.
+
+        Args:
+            console: Rich console for formatted output
+            detected: Previously detected credentials (may be empty)
+
+        Returns:
+            Complete credentials dictionary
+        """
+
+    def configure(self, console: "Console") -> dict[str, Any]:
+        """Configure provider with environment detection + user prompts.
+
+        Args:
+            console: Rich console for formatted output
+
+        Returns:
+            Complete provider configuration dictionary
+        """
+        return self.prompt_user(console, self.detect_credentials())
+
+
+def show_env_credential(console: "Console", display_name: str) -> None:
+    """Display that a credential was found in the environment.
+
+    Use with values from detect_credentials() to avoid reading the
+    environment again.
 
     Args:
-        var_name: Environment variable name
         console: Rich console for output
-        display_name: Display name (defaults to var_name)
-
-    Returns:
-        Environment variable value if found, None otherwise
+        display_name: Name shown to the user
     """
-    value = os.getenv(var_name)
-    if value:
-        display = display_name or var_name
-        console.print(f"[green]✓[/green] Found {display} in environment")
-        console.print("  [dim]Using: [from environment][/dim]")
-    return value
+    console.print(f"[green]✓[/green] Found {display_name} in environment")
+    console.print("  [dim]Using: [from environment][/dim]")
 
 
 def prompt_if_missing(
@@ -108,7 +172,28 @@ def prompt_if_missing(
     if key in detected:
         return str(detected[key])
 
+    from rich.prompt import Prompt
+
     if default:
         return Prompt.ask(prompt_text, password=password, default=default, show_default=True)
 
     return Prompt.ask(prompt_text, password=password)
+
+
+def missing_fields(config: Any, label: str, fields: tuple[str, ...], hint: str) -> list[str]:
+    """List validation errors for required configuration fields that are not set.
+
+    Args:
+        config: Provider configuration
+        label: Provider label used in messages (e.g., "OpenAI provider")
+        fields: Required field names
+        hint: How to fix the configuration
+
+    Returns:
+        One error message per missing field
+    """
+    return [
+        f"{label} enabled but missing {field}. {hint}"
+        for field in fields
+        if not getattr(config, field)
+    ]
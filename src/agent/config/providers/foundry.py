@@ -1,13 +1,16 @@
 """Azure AI Foundry provider configuration setup."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.prompt import Prompt
+from agent.config.providers.base import ProviderSetupBase, missing_fields
+from agent.config.schema import FoundryProviderConfig
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-class FoundrySetup:
+
+class FoundrySetup(ProviderSetupBase):
     """Azure AI Foundry provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -28,7 +31,7 @@ class FoundrySetup:
 
         return credentials
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for Azure AI Foundry credentials.
 
         Args:
@@ -38,9 +41,11 @@ class FoundrySetup:
         Returns:
             Complete Azure AI Foundry configuration
         """
-        # Check environment variables
-        env_endpoint = os.getenv("AZURE_PROJECT_ENDPOINT")
-        env_deployment = os.getenv("AZURE_MODEL_DEPLOYMENT")
+        from rich.prompt import Prompt
+
+        # Use credentials found by detect_credentials()
+        env_endpoint = detected.get("project_endpoint")
+        env_deployment = detected.get("model_deployment")
 
         if env_endpoint and env_deployment:
             console.print("\n[green]✓[/green] Found Azure AI Foundry config in environment")
@@ -63,14 +68,29 @@ class FoundrySetup:
             "enabled": True,
         }
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure Azure AI Foundry provider.
+    def validate(self, config: FoundryProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: Azure AI Foundry provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return missing_fields(
+            config,
+            "Foundry provider",
+            ("project_endpoint", "model_deployment"),
+            "Run: agent config enable foundry",
+        )
+
+    def display_name(self, config: FoundryProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: Azure AI Foundry provider configuration
 
         Returns:
-            Azure AI Foundry provider configuration
+            Model name with provider prefix (e.g., "Azure AI Foundry/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"Azure AI Foundry/{config.model_deployment or 'unknown'}"
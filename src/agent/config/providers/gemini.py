@@ -1,13 +1,16 @@
 """Google Gemini provider configuration setup."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
+from agent.config.providers.base import ProviderSetupBase, missing_fields
+from agent.config.schema import GeminiProviderConfig
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-class GeminiSetup:
+
+class GeminiSetup(ProviderSetupBase):
     """Google Gemini provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -41,7 +44,7 @@ class GeminiSetup:
 
         return credentials
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for Gemini credentials.
 
         Args:
@@ -51,11 +54,13 @@ class GeminiSetup:
         Returns:
             Complete Gemini configuration
         """
-        # Check environment
-        env_use_vertex = os.getenv("GEMINI_USE_VERTEXAI", "false").lower() == "true"
-        env_key = os.getenv("GEMINI_API_KEY")
-        env_project = os.getenv("GEMINI_PROJECT_ID")
-        env_location = os.getenv("GEMINI_LOCATION")
+        from rich.prompt import Confirm, Prompt
+
+        # Use credentials found by detect_credentials()
+        env_use_vertex = detected.get("use_vertexai", False)
+        env_key = detected.get("api_key")
+        env_project = detected.get("project_id")
+        env_location = detected.get("location")
 
         if env_use_vertex and env_project:
             console.print("\n[green]✓[/green] Found Gemini Vertex AI config in environment")
@@ -108,14 +113,33 @@ class GeminiSetup:
                     "enabled": True,
                 }
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure Google Gemini provider.
+    def validate(self, config: GeminiProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: Gemini provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        if config.use_vertexai:
+            return missing_fields(
+                config,
+                "Gemini Vertex AI",
+                ("project_id", "location"),
+                "Run: agent config enable gemini",
+            )
+        return missing_fields(
+            config, "Gemini provider", ("api_key",), "Run: agent config enable gemini"
+        )
+
+    def display_name(self, config: GeminiProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: Gemini provider configuration
 
         Returns:
-            Gemini provider configuration
+            Model name with provider prefix (e.g., "Gemini/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"Gemini/{config.model}"
@@ -2,11 +2,13 @@
 
 import os
 import subprocess
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from agent.config.providers.base import ProviderSetupBase, missing_fields, prompt_if_missing
+from agent.config.schema import LocalProviderConfig
 
-from agent.config.providers.base import prompt_if_missing
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Timeout constants for Docker operations
 DOCKER_ENABLE_TIMEOUT = 30  # seconds
@@ -20,7 +22,7 @@ except ImportError:
     requests = None  # type: ignore[assignment, unused-ignore]
 
 
-class LocalSetup:
+class LocalSetup(ProviderSetupBase):
     """Local Docker provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -37,7 +39,7 @@ class LocalSetup:
 
         return credentials
 
-    def _setup_docker_model_runner(self, console: Console) -> None:
+    def _setup_docker_model_runner(self, console: "Console") -> None:
         """Set up Docker Model Runner and pull phi4 model if needed.
 
         Args:
@@ -122,7 +124,7 @@ class LocalSetup:
         except Exception as e:
             console.print(f"[yellow]⚠[/yellow] Could not check models: {e}")
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for local Docker configuration.
 
         Args:
@@ -143,14 +145,29 @@ class LocalSetup:
             "enabled": True,
         }
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure local Docker provider.
+    def validate(self, config: LocalProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: Local provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return missing_fields(
+            config,
+            "Local provider",
+            ("base_url",),
+            "Set LOCAL_BASE_URL environment variable or configure via: agent config enable local",
+        )
+
+    def display_name(self, config: LocalProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: Local provider configuration
 
         Returns:
-            Local provider configuration
+            Model name with provider prefix (e.g., "Local/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"Local/{config.model}"
@@ -1,14 +1,21 @@
 """OpenAI provider configuration setup."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
+from agent.config.providers.base import (
+    ProviderSetupBase,
+    missing_fields,
+    prompt_if_missing,
+    show_env_credential,
+)
+from agent.config.schema import OpenAIProviderConfig
 
-from agent.config.providers.base import check_env_var, prompt_if_missing
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-class OpenAISetup:
+class OpenAISetup(ProviderSetupBase):
     """OpenAI provider configuration handler."""
 
     def detect_credentials(self) -> dict[str, Any]:
@@ -29,7 +36,7 @@ class OpenAISetup:
 
         return credentials
 
-    def prompt_user(self, console: Console, detected: dict[str, Any]) -> dict[str, Any]:
+    def prompt_user(self, console: "Console", detected: dict[str, Any]) -> dict[str, Any]:
         """Prompt user for OpenAI credentials.
 
         Args:
@@ -39,11 +46,9 @@ class OpenAISetup:
         Returns:
             Complete OpenAI configuration
         """
-        # Check environment and display status
-        if not detected.get("api_key"):
-            api_key = check_env_var("OPENAI_API_KEY", console, "OPENAI_API_KEY")
-            if api_key:
-                detected["api_key"] = api_key
+        # Display status of a key found by detect_credentials()
+        if detected.get("api_key"):
+            show_env_credential(console, "OPENAI_API_KEY")
 
         # Prompt for missing values
         api_key = prompt_if_missing("api_key", detected, "Enter your OpenAI API key", password=True)
@@ -56,14 +61,26 @@ class OpenAISetup:
             "enabled": True,
         }
 
-    def configure(self, console: Console) -> dict[str, Any]:
-        """Configure OpenAI provider.
+    def validate(self, config: OpenAIProviderConfig) -> list[str]:
+        """Check the configuration has the fields this provider requires.
 
         Args:
-            console: Rich console for output
+            config: OpenAI provider configuration
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        return missing_fields(
+            config, "OpenAI provider", ("api_key",), "Run: agent config enable openai"
+        )
+
+    def display_name(self, config: OpenAIProviderConfig) -> str:
+        """Format the configured model for display.
+
+        Args:
+            config: OpenAI provider configuration
 
         Returns:
-            OpenAI provider configuration
+            Model name with provider prefix (e.g., "OpenAI/<model>")
         """
-        detected = self.detect_credentials()
-        return self.prompt_user(console, detected)
+        return f"OpenAI/{config.model}"
@@ -196,6 +196,28 @@ class SkillsConfig(BaseModel):
 
         return self
 
+    def plugins_by_canonical(self) -> dict[str, PluginSkillSource]:
+        """Index plugin sources by canonical skill name for O(1) lookups.
+
+        Built on each call rather than cached: ``plugins`` is a plain list that CLI
+        commands append to and reassign, so a cached index could silently go stale.
+        Callers doing several lookups should keep the returned dict.
+
+        Returns:
+            Mapping of canonical name to plugin (first entry wins on duplicates)
+
+        Example:
+            >>> skills = SkillsConfig(plugins=[PluginSkillSource(name="My_Skill", git_url="...")])
+            >>> skills.plugins_by_canonical()["my-skill"].name
+            'My_Skill'
+        """
+        from agent.skills.security import normalize_skill_name
+
+        index: dict[str, PluginSkillSource] = {}
+        for plugin in self.plugins:
+            index.setdefault(normalize_skill_name(plugin.name), plugin)
+        return index
+
 
 class AgentConfig(BaseModel):
     """Agent-specific configuration."""
@@ -220,6 +242,15 @@ class AgentConfig(BaseModel):
         default=1_048_576, description="Maximum content size in bytes for write operations"  # 1MB
     )
 
+    # Response cache configuration
+    response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse responses for identical stateless prompts (same prompt, system prompt, tools and model); requires memory to be disabled",
+    )
+    response_cache_max_entries: int = Field(
+        default=256, description="Maximum number of cached responses kept in memory and on disk"
+    )
+
     @field_validator("data_dir")
     @classmethod
     def expand_data_dir(cls, v: str) -> str:
@@ -362,79 +393,12 @@ class AgentSettings(BaseModel):
         """
         errors = []
 
+        from agent.config.providers import PROVIDER_REGISTRY
+
         for provider_name in self.providers.enabled:
-            provider = getattr(self.providers, provider_name)
-
-            if provider_name == "openai":
-                if not provider.api_key:
-                    errors.append(
-                        "OpenAI provider enabled but missing api_key. "
-                        "Run: agent config enable openai"
-                    )
-
-            elif provider_name == "anthropic":
-                if not provider.api_key:
-                    errors.append(
-                        "Anthropic provider enabled but missing api_key. "
-                        "Run: agent config enable anthropic"
-                    )
-
-            elif provider_name == "azure":
-                if not provider.endpoint:
-                    errors.append(
-                        "Azure provider enabled but missing endpoint. "
-                        "Run: agent config enable azure"
-                    )
-                if not provider.deployment:
-                    errors.append(
-                        "Azure provider enabled but missing deployment. "
-                        "Run: agent config enable azure"
-                    )
-
-            elif provider_name == "foundry":
-                if not provider.project_endpoint:
-                    errors.append(
-                        "Foundry provider enabled but missing project_endpoint. "
-                        "Run: agent config enable foundry"
-                    )
-                if not provider.model_deployment:
-                    errors.append(
-                        "Foundry provider enabled but missing model_deployment. "
-                        "Run: agent config enable foundry"
-                    )
-
-            elif provider_name == "gemini":
-                if provider.use_vertexai:
-                    if not provider.project_id:
-                        errors.append(
-                            "Gemini Vertex AI enabled but missing project_id. "
-                            "Run: agent config enable gemini"
-                        )
-                    if not provider.location:
-                        errors.append(
-                            "Gemini Vertex AI enabled but missing location. "
-                            "Run: agent config enable gemini"
-                        )
-                else:
-                    if not provider.api_key:
-                        errors.append(
-                            "Gemini provider enabled but missing api_key. "
-                            "Run: agent config enable gemini"
-                        )
-
-            elif provider_name == "local":
-                # Local provider requires base_url
-                if not provider.base_url:
-                    errors.append(
-                        "Local provider enabled but missing base_url. "
-                        "Set LOCAL_BASE_URL environment variable or configure via: agent config enable local"
-                    )
-
-            elif provider_name == "github":
-                # GitHub authentication is handled at runtime via get_github_token()
-                # which checks GITHUB_TOKEN env var or gh CLI
-                # Token is optional in config - validation happens at runtime
-                pass
+            setup = PROVIDER_REGISTRY.get(provider_name)
+            if setup is not None:
+                errors.extend(setup.validate(getattr(self.providers, provider_name)))
 
         return errors
 
@@ -533,27 +497,13 @@ class AgentSettings(BaseModel):
             >>> settings.get_model_display_name()
             'OpenAI/gpt-5-mini'
         """
-        provider = self.llm_provider
+        from agent.config.providers import PROVIDER_REGISTRY
 
-        # Format: Provider/model
-        if provider == "openai":
-            return f"OpenAI/{self.providers.openai.model}"
-        elif provider == "anthropic":
-            return f"Anthropic/{self.providers.anthropic.model}"
-        elif provider == "azure":
-            deployment = self.providers.azure.deployment or "unknown"
-            return f"Azure OpenAI/{deployment}"
-        elif provider == "foundry":
-            deployment = self.providers.foundry.model_deployment or "unknown"
-            return f"Azure AI Foundry/{deployment}"
-        elif provider == "gemini":
-            return f"Gemini/{self.providers.gemini.model}"
-        elif provider == "github":
-            return f"GitHub/{self.providers.github.model}"
-        elif provider == "local":
-            return f"Local/{self.providers.local.model}"
-        else:
+        provider = self.llm_provider
+        setup = PROVIDER_REGISTRY.get(provider)
+        if setup is None:
             return "unknown"
+        return setup.display_name(getattr(self.providers, provider))
 
     # Legacy compatibility aliases for smooth migration
     @property
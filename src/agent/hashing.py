@@ -0,0 +1,51 @@
+"""Deterministic hashing for cache keys.
+
+All cache lookups (response cache, provider prompt cache keys, chat client
+reuse) build their keys through cache_key() so identical inputs map to the same
+key in every process. Python's built-in hash() is salted per process and cannot
+be shared across CLI invocations.
+"""
+
+import hashlib
+from typing import Any
+
+# Digest size in bytes (128 bits: collisions are not a practical concern)
+CACHE_KEY_SIZE = 16
+
+# Inputs at least this large are hashed with SHA-256, which OpenSSL accelerates
+# with SHA extensions on modern CPUs; BLAKE2b is faster for short inputs.
+SHA256_MIN_INPUT = 4096
+
+
+def cache_key(*parts: str, key: str = "") -> bytes:
+    """Hash string parts into a fixed-size cache key.
+
+    Each part is length-prefixed so ("ab", "c") and ("a", "bc") produce
+    different keys. The optional key namespaces the digest (e.g. by model), so
+    the same prompt sent to different models never shares an entry.
+
+    Args:
+        *parts: Strings identifying the cached value
+        key: Namespace for the digest (default: none)
+
+    Returns:
+        16-byte digest
+
+    Example:
+        >>> len(cache_key("Say hello", "You are helpful.", key="openai/gpt-5-mini"))
+        16
+        >>> cache_key("ab", "c") != cache_key("a", "bc")
+        True
+    """
+    encoded = [key.encode("utf-8"), *(part.encode("utf-8") for part in parts)]
+
+    digest: Any
+    if sum(len(data) for data in encoded) >= SHA256_MIN_INPUT:
+        digest = hashlib.sha256()
+    else:
+        digest = hashlib.blake2b(digest_size=CACHE_KEY_SIZE)
+
+    for data in encoded:
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return bytes(digest.digest()[:CACHE_KEY_SIZE])
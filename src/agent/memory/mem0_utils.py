@@ -4,8 +4,11 @@ This module provides helper functions for extracting LLM configuration
 from AgentConfig and creating mem0 Memory instances.
 """
 
+import hashlib
+import json
 import logging
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +19,29 @@ logger = logging.getLogger(__name__)
 # Providers that mem0 supports
 SUPPORTED_PROVIDERS = ["openai", "anthropic", "azure", "gemini", "github"]
 
+# mem0 Memory instances by fingerprint of the config they were built from.
+# Memory.from_config opens the Chroma database (or a cloud client); agents
+# rebuilt in the same process reuse the instance instead of re-opening it.
+_memory_cache: dict[str, Any] = {}
+
+
+def clear_memory_cache() -> None:
+    """Drop cached mem0 Memory instances (e.g., between tests)."""
+    _memory_cache.clear()
+
+
+def _config_fingerprint(mem0_config: dict[str, Any]) -> str:
+    """Hash a mem0 config so cache keys don't retain API keys in plaintext.
+
+    Args:
+        mem0_config: Complete config passed to Memory.from_config
+
+    Returns:
+        Hex digest identifying the config
+    """
+    encoded = json.dumps(mem0_config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
 
 def is_provider_compatible(config: AgentSettings) -> tuple[bool, str]:
     """Check if LLM provider is compatible with mem0.
@@ -41,132 +67,169 @@ def is_provider_compatible(config: AgentSettings) -> tuple[bool, str]:
         return False, f"unknown provider '{config.llm_provider}'"
 
 
-def extract_llm_config(config: AgentSettings) -> dict[str, Any]:
-    """Extract LLM configuration from AgentConfig for mem0.
+def _openai_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Build mem0 LLM config for the OpenAI provider."""
+    # Allow model override for mem0 (e.g., if project has limited model access)
+    openai_mem0_model = os.getenv("MEM0_LLM_MODEL", config.openai_model)
 
-    Converts agent's LLM configuration to mem0-compatible format,
-    enabling mem0 to reuse the same LLM provider and model as the agent.
+    return {
+        "provider": "openai",
+        "config": {
+            "model": openai_mem0_model,
+            "api_key": config.openai_api_key,
+            "openai_base_url": "https://api.openai.com/v1",  # Force direct OpenAI API
+        },
+    }
 
-    Args:
-        config: Agent configuration with LLM settings
 
-    Returns:
-        Dict with mem0 LLM configuration
+def _anthropic_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Build mem0 LLM config for the Anthropic provider."""
+    return {
+        "provider": "anthropic",
+        "config": {
+            "model": config.anthropic_model,
+            "api_key": config.anthropic_api_key,
+        },
+    }
 
-    Example:
-        >>> config = AgentConfig(llm_provider="openai", openai_api_key="sk-...")
-        >>> llm_config = extract_llm_config(config)
-        >>> # {"provider": "openai", "config": {"model": "gpt-4o-mini", "api_key": "sk-..."}}
+
+def _azure_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Build mem0 LLM config for the Azure OpenAI provider.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set (mem0 doesn't fully support Azure OpenAI)
     """
-    # Map agent providers to mem0 providers
-    if config.llm_provider == "openai":
-        # Allow model override for mem0 (e.g., if project has limited model access)
-        openai_mem0_model = os.getenv("MEM0_LLM_MODEL", config.openai_model)
+    # Azure OpenAI in mem0 doesn't accept azure_endpoint/api_version
+    # Use minimal config with just model and api_key
+    # Note: This may not work properly - recommend using OpenAI provider instead
+
+    # Check if user has OpenAI API key available
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+
+    if openai_api_key:
+        # Use OpenAI provider for better compatibility
+        # Use MEM0_LLM_MODEL if set, otherwise try agent's OpenAI model if configured,
+        # finally fallback to gpt-4o-mini
+        azure_mem0_model_override = os.getenv("MEM0_LLM_MODEL")
+        if azure_mem0_model_override:
+            azure_mem0_model: str = azure_mem0_model_override
+        elif config.openai_api_key:
+            # Try to use agent's OpenAI model if it's configured
+            azure_mem0_model = config.openai_model
+        else:
+            # Final fallback
+            azure_mem0_model = "gpt-4o-mini"
 
+        logger.info(
+            "Using OpenAI provider for mem0 LLM (model: %s). "
+            "Azure OpenAI will still be used for agent completions.",
+            azure_mem0_model,
+        )
         return {
             "provider": "openai",
             "config": {
-                "model": openai_mem0_model,
-                "api_key": config.openai_api_key,
-                "openai_base_url": "https://api.openai.com/v1",  # Force direct OpenAI API
+                "model": azure_mem0_model,
+                "api_key": openai_api_key,
+                "openai_base_url": "https://api.openai.com/v1",
             },
         }
 
-    elif config.llm_provider == "anthropic":
-        return {
-            "provider": "anthropic",
-            "config": {
-                "model": config.anthropic_model,
-                "api_key": config.anthropic_api_key,
-            },
-        }
+    # Azure OpenAI support in mem0 is limited
+    logger.warning(
+        "Azure OpenAI provider not fully supported by mem0. "
+        "Set OPENAI_API_KEY environment variable for reliable mem0 operation. "
+        "Falling back to InMemoryStore."
+    )
+    raise ValueError(
+        "mem0 does not fully support Azure OpenAI provider. "
+        "Set OPENAI_API_KEY environment variable to use mem0 with OpenAI embeddings/LLM, "
+        "or use MEMORY_TYPE=in_memory for provider-independent memory."
+    )
+
+
+def _gemini_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Build mem0 LLM config for the Gemini provider."""
+    return {
+        "provider": "gemini",
+        "config": {
+            "model": config.gemini_model,
+            "api_key": config.gemini_api_key,
+        },
+    }
+
+
+def _github_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Build mem0 LLM config for GitHub Models (OpenAI-compatible API)."""
+    # Token may be None if using gh CLI authentication, so we need to get it
+    from agent.providers.github.auth import get_github_token
+
+    github_token = config.github_token or get_github_token()
+
+    # Construct base URL matching GitHubChatClient behavior
+    # Include /inference path and organization scope if configured
+    if config.github_org:
+        base_url = f"{config.github_endpoint}/orgs/{config.github_org}/inference"
+    else:
+        base_url = f"{config.github_endpoint}/inference"
 
-    elif config.llm_provider == "azure":
-        # Azure OpenAI in mem0 doesn't accept azure_endpoint/api_version
-        # Use minimal config with just model and api_key
-        # Note: This may not work properly - recommend using OpenAI provider instead
+    return {
+        "provider": "openai",
+        "config": {
+            "model": config.github_model,
+            "api_key": github_token,
+            "openai_base_url": base_url,
+        },
+    }
 
-        # Check if user has OpenAI API key available
-        openai_api_key = os.getenv("OPENAI_API_KEY")
 
-        if openai_api_key:
-            # Use OpenAI provider for better compatibility
-            # Use MEM0_LLM_MODEL if set, otherwise try agent's OpenAI model if configured,
-            # finally fallback to gpt-4o-mini
-            azure_mem0_model_override = os.getenv("MEM0_LLM_MODEL")
-            if azure_mem0_model_override:
-                azure_mem0_model: str = azure_mem0_model_override
-            elif config.openai_api_key:
-                # Try to use agent's OpenAI model if it's configured
-                azure_mem0_model = config.openai_model
-            else:
-                # Final fallback
-                azure_mem0_model = "gpt-4o-mini"
+# mem0 LLM config builders by agent provider (keys match SUPPORTED_PROVIDERS)
+_LLM_CONFIG_BUILDERS: dict[str, Callable[[AgentSettings], dict[str, Any]]] = {
+    "openai": _openai_llm_config,
+    "anthropic": _anthropic_llm_config,
+    "azure": _azure_llm_config,
+    "gemini": _gemini_llm_config,
+    "github": _github_llm_config,
+}
 
-            logger.info(
-                f"Using OpenAI provider for mem0 LLM (model: {azure_mem0_model}). "
-                "Azure OpenAI will still be used for agent completions."
-            )
-            return {
-                "provider": "openai",
-                "config": {
-                    "model": azure_mem0_model,
-                    "api_key": openai_api_key,
-                    "openai_base_url": "https://api.openai.com/v1",
-                },
-            }
-        else:
-            # Azure OpenAI support in mem0 is limited
-            logger.warning(
-                "Azure OpenAI provider not fully supported by mem0. "
-                "Set OPENAI_API_KEY environment variable for reliable mem0 operation. "
-                "Falling back to InMemoryStore."
-            )
-            raise ValueError(
-                "mem0 does not fully support Azure OpenAI provider. "
-                "Set OPENAI_API_KEY environment variable to use mem0 with OpenAI embeddings/LLM, "
-                "or use MEMORY_TYPE=in_memory for provider-independent memory."
-            )
 
-    elif config.llm_provider == "gemini":
-        return {
-            "provider": "gemini",
-            "config": {
-                "model": config.gemini_model,
-                "api_key": config.gemini_api_key,
-            },
-        }
+def extract_llm_config(config: AgentSettings) -> dict[str, Any]:
+    """Extract LLM configuration from AgentConfig for mem0.
 
-    elif config.llm_provider == "github":
-        # GitHub Models uses OpenAI-compatible API
-        # Token may be None if using gh CLI authentication, so we need to get it
-        from agent.providers.github.auth import get_github_token
+    Converts agent's LLM configuration to mem0-compatible format,
+    enabling mem0 to reuse the same LLM provider and model as the agent.
 
-        github_token = config.github_token or get_github_token()
+    Args:
+        config: Agent configuration with LLM settings
 
-        # Construct base URL matching GitHubChatClient behavior
-        # Include /inference path and organization scope if configured
-        if config.github_org:
-            base_url = f"{config.github_endpoint}/orgs/{config.github_org}/inference"
-        else:
-            base_url = f"{config.github_endpoint}/inference"
+    Returns:
+        Dict with mem0 LLM configuration
 
-        return {
-            "provider": "openai",
-            "config": {
-                "model": config.github_model,
-                "api_key": github_token,
-                "openai_base_url": base_url,
-            },
-        }
+    Raises:
+        ValueError: If the provider is not supported by mem0
 
-    else:
+    Example:
+        >>> config = AgentConfig(llm_provider="openai", openai_api_key="sk-...")
+        >>> llm_config = extract_llm_config(config)
+        >>> # {"provider": "openai", "config": {"model": "gpt-4o-mini", "api_key": "sk-..."}}
+    """
+    builder = _LLM_CONFIG_BUILDERS.get(config.llm_provider)
+    if builder is None:
         # Unsupported provider (local, foundry, unknown)
         raise ValueError(
             f"mem0 does not support '{config.llm_provider}' provider. "
             f"Supported providers: {', '.join(SUPPORTED_PROVIDERS)}. "
             "Use MEMORY_TYPE=in_memory for provider-independent memory."
         )
+    return builder(config)
+
+
+# Embedding model per mem0 provider
+_EMBEDDING_MODELS: dict[str, str] = {
+    "openai": "text-embedding-3-small",
+    "anthropic": "voyage-2",
+    "azure_openai": "text-embedding-3-small",
+    "gemini": "text-embedding-004",
+}
 
 
 def _create_embedder_config(llm_config: dict[str, Any]) -> dict[str, Any]:
@@ -267,17 +330,8 @@ def get_embedding_model(llm_config: dict[str, Any]) -> str:
     Returns:
         The embedding model name (without provider suffixes)
     """
-    if llm_config["provider"] == "openai":
-        return "text-embedding-3-small"
-    elif llm_config["provider"] == "anthropic":
-        return "voyage-2"
-    elif llm_config["provider"] == "azure_openai":
-        return "text-embedding-3-small"
-    elif llm_config["provider"] == "gemini":
-        return "text-embedding-004"
-    else:
-        # Default for unknown providers
-        return "text-embedding-3-small"
+    # Default for unknown providers
+    return _EMBEDDING_MODELS.get(llm_config["provider"], "text-embedding-3-small")
 
 
 def get_storage_path(config: AgentSettings) -> Path:
@@ -294,17 +348,17 @@ def get_storage_path(config: AgentSettings) -> Path:
         >>> # /Users/daniel/.agent/mem0_data/chroma_db
     """
     if config.mem0_storage_path:
-        from pathlib import Path
-
         return Path(config.mem0_storage_path)
 
-    # Default to memory_dir/chroma_db
-    if config.memory_dir:
-        return config.memory_dir / "chroma_db"
+    # Default to memory_dir/chroma_db (computed property: read it once)
+    memory_dir = config.memory_dir
+    if memory_dir:
+        return memory_dir / "chroma_db"
 
     # Fallback to agent_data_dir (should always be set, but handle None gracefully)
-    if config.agent_data_dir:
-        return config.agent_data_dir / "mem0_data" / "chroma_db"
+    agent_data_dir = config.agent_data_dir
+    if agent_data_dir:
+        return agent_data_dir / "mem0_data" / "chroma_db"
 
     # Final fallback to home directory
     return Path.home() / ".agent" / "mem0_data" / "chroma_db"
@@ -314,7 +368,8 @@ def create_memory_instance(config: AgentSettings) -> Any:
     """Create mem0 Memory instance with proper configuration.
 
     Uses Memory.from_config for both local (Chroma) and cloud (mem0.ai) modes,
-    ensuring consistent API across both deployment options.
+    ensuring consistent API across both deployment options. Instances are cached
+    per process by config fingerprint, so identical configs share one instance.
 
     Args:
         config: Agent configuration with mem0 and LLM settings
@@ -341,59 +396,58 @@ def create_memory_instance(config: AgentSettings) -> Any:
     # Determine if using cloud or local mode
     is_cloud_mode = bool(config.mem0_api_key and config.mem0_org_id)
 
+    # Only the vector store differs between modes
+    vector_store: dict[str, Any]
     if is_cloud_mode:
         # Cloud mode - use mem0.ai service
         logger.info("Initializing mem0 in cloud mode (mem0.ai)")
-
-        # Extract LLM config
-        llm_config = extract_llm_config(config)
-
-        # Create embedder config (reuse LLM provider credentials)
-        embedder_config = _create_embedder_config(llm_config)
-
-        mem0_config = {
-            "llm": llm_config,
-            "embedder": embedder_config,
-            "vector_store": {
-                "provider": "mem0",
-                "config": {
-                    "api_key": config.mem0_api_key,
-                    "org_id": config.mem0_org_id,
-                },
+        vector_store = {
+            "provider": "mem0",
+            "config": {
+                "api_key": config.mem0_api_key,
+                "org_id": config.mem0_org_id,
             },
         }
     else:
         # Local mode - use Chroma file-based storage
         storage_path = get_storage_path(config)
-        logger.info(f"Initializing mem0 in local mode: {storage_path}")
-
-        # Ensure storage directory exists
-        storage_path.mkdir(parents=True, exist_ok=True)
+        logger.info("Initializing mem0 in local mode: %s", storage_path)
+        vector_store = {
+            "provider": "chroma",
+            "config": {
+                "path": str(storage_path),
+                "collection_name": "agent_memories",
+            },
+        }
 
-        # Extract LLM config
-        llm_config = extract_llm_config(config)
+    # Extract LLM config
+    llm_config = extract_llm_config(config)
 
+    mem0_config = {
+        "llm": llm_config,
         # Create embedder config (reuse LLM provider credentials)
-        # For embeddings, we use the same provider and credentials as the LLM
-        embedder_config = _create_embedder_config(llm_config)
-
-        mem0_config = {
-            "llm": llm_config,
-            "embedder": embedder_config,
-            "vector_store": {
-                "provider": "chroma",
-                "config": {
-                    "path": str(storage_path),
-                    "collection_name": "agent_memories",
-                },
-            },
-        }
+        "embedder": _create_embedder_config(llm_config),
+        "vector_store": vector_store,
+    }
+
+    fingerprint = _config_fingerprint(mem0_config)
+    cached = _memory_cache.get(fingerprint)
+    if cached is not None:
+        logger.debug("Reusing cached mem0 Memory instance")
+        return cached
+
+    if not is_cloud_mode:
+        # Ensure storage directory exists
+        storage_path.mkdir(parents=True, exist_ok=True)
 
     try:
         memory = Memory.from_config(mem0_config)
         logger.debug(
-            f"mem0 Memory instance created successfully ({'cloud' if is_cloud_mode else 'local'} mode)"
+            "mem0 Memory instance created successfully (%s mode)",
+            "cloud" if is_cloud_mode else "local",
         )
-        return memory
     except Exception as e:
         raise ValueError(f"Failed to initialize mem0 Memory: {e}")
+
+    _memory_cache[fingerprint] = memory
+    return memory
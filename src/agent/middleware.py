@@ -31,6 +31,7 @@ from agent_framework import (
 
 from agent.config.manager import load_config
 from agent.config.schema import AgentSettings
+from agent.prompt_prefix import PromptPrefix
 
 if TYPE_CHECKING:
     from agent.trace_logger import TraceLogger
@@ -167,44 +168,11 @@ async def agent_run_logging_middleware(
                 if hasattr(context, "agent"):
                     agent = context.agent
 
-                    # Get system instructions and tools from chat_options
-                    if hasattr(agent, "chat_options"):
-                        chat_options = agent.chat_options
-
-                        # Get instructions
-                        if hasattr(chat_options, "instructions") and chat_options.instructions:
-                            system_instructions = chat_options.instructions
-
-                        # Get tools
-                        if hasattr(chat_options, "tools") and chat_options.tools:
-                            tools = chat_options.tools
-                            tools_data = []
-                            for tool in tools:
-                                tool_dict = (
-                                    tool.to_dict()
-                                    if hasattr(tool, "to_dict")
-                                    else {"name": str(tool)}
-                                )
-                                tool_json = json.dumps(tool_dict, default=str)
-                                tools_data.append(
-                                    {
-                                        "name": tool_dict.get("name", "unknown"),
-                                        "description": (
-                                            tool_dict.get("description", "")[:100]
-                                            if tool_dict.get("description")
-                                            else ""
-                                        ),
-                                        "estimated_tokens": len(tool_json) // 4,
-                                    }
-                                )
-
-                            tools_summary = {
-                                "count": len(tools),
-                                "tools": tools_data,
-                                "total_estimated_tokens": sum(
-                                    t["estimated_tokens"] for t in tools_data
-                                ),
-                            }
+                    # System instructions and tools summary are serialized once per agent
+                    prefix = PromptPrefix.for_agent(agent)
+                    system_instructions = prefix.instructions or None
+                    if prefix.tools_summary["count"]:
+                        tools_summary = prefix.tools_summary
 
             # Log request using TraceLogger
             trace_logger.log_request(
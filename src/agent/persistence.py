@@ -6,13 +6,15 @@ enabling users to maintain conversation history across sessions.
 Adapted from butler-agent for agent-template architecture.
 """
 
-import json
 import logging
+import os
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from agent.utils.serialization import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,8 +110,8 @@ class ThreadPersistence:
         """Load conversation metadata index."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file) as f:
-                    self.metadata = json.load(f)
+                with open(self.metadata_file, "rb") as f:
+                    self.metadata = json_loads(f.read())
             except Exception as e:
                 logger.warning(f"Failed to load metadata, starting fresh: {e}")
                 self.metadata = {"conversations": {}}
@@ -119,10 +121,17 @@ class ThreadPersistence:
             self._save_metadata()
 
     def _save_metadata(self) -> None:
-        """Save conversation metadata index."""
+        """Save conversation metadata index.
+
+        The index is rewritten on every save and delete, so it is written compactly
+        to a temporary file and swapped in atomically; an interrupted write never
+        leaves a truncated index behind.
+        """
+        tmp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
         try:
-            with open(self.metadata_file, "w") as f:
-                json.dump(self.metadata, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(json_dumps(self.metadata))
+            os.replace(tmp_file, self.metadata_file)
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
             raise
@@ -338,8 +347,8 @@ class ThreadPersistence:
 
         # Save to file
         file_path = self.storage_dir / f"{safe_name}.json"
-        with open(file_path, "w") as f:
-            json.dump(conversation_data, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(json_dumps(conversation_data, indent=True))
 
         # Update metadata
         self.metadata["conversations"][safe_name] = {
@@ -387,8 +396,8 @@ class ThreadPersistence:
 
         logger.info(f"Loading conversation '{safe_name}'...")
 
-        with open(file_path) as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json_loads(f.read())
 
         thread_data = data["thread"]
 
@@ -465,18 +474,28 @@ class ThreadPersistence:
                 )
                 return thread, context_summary
 
-    def list_sessions(self) -> list[dict]:
-        """List all saved conversation sessions.
+    def list_sessions(self, limit: int | None = None) -> list[dict]:
+        """List saved conversation sessions, newest first.
+
+        Served from the in-memory index; no session files are read.
+
+        Args:
+            limit: Maximum number of sessions to return (all if None)
 
         Returns:
-            List of session metadata dicts
+            List of session metadata dicts sorted by created_at, most recent first
 
         Example:
-            >>> sessions = persistence.list_sessions()
+            >>> sessions = persistence.list_sessions(limit=10)
             >>> all("name" in s for s in sessions)
             True
         """
-        return list(self.metadata.get("conversations", {}).values())
+        sessions = sorted(
+            self.metadata.get("conversations", {}).values(),
+            key=lambda s: s.get("created_at", ""),
+            reverse=True,
+        )
+        return sessions if limit is None else sessions[:limit]
 
     def delete_session(self, name: str) -> None:
         """Delete a conversation session.
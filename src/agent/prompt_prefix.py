@@ -0,0 +1,141 @@
+"""Cached serialization of the static prompt prefix.
+
+The system instructions and tool schemas are identical for every request an
+agent makes. PromptPrefix serializes them at most once per agent, on first use,
+and keeps the derived values (prefix id, tool summary for trace logs, token
+count) so per-request code such as the trace logging middleware does not
+re-serialize every tool schema on each turn.
+"""
+
+import json
+import weakref
+from functools import cached_property
+from typing import Any
+
+from agent_framework import AIFunction
+
+from agent.hashing import cache_key
+
+# Prefix token counts by prefix id, shared by agents with identical prefixes
+_token_counts: dict[str, int] = {}
+
+# Prefixes by framework agent; entries disappear with the agent
+_prefixes: "weakref.WeakKeyDictionary[Any, PromptPrefix]" = weakref.WeakKeyDictionary()
+
+
+def _tool_schema(tool: Any) -> dict[str, Any]:
+    """Return the provider-facing schema of a tool (without invocation counters)."""
+    if isinstance(tool, AIFunction):
+        return tool.to_json_schema_spec()
+    if hasattr(tool, "to_dict"):
+        return dict(tool.to_dict())
+    return {"name": str(tool)}
+
+
+class PromptPrefix:
+    """System instructions and tool schemas serialized once, on first use.
+
+    Attributes:
+        instructions: Agent system instructions
+        serialized: Compact JSON of instructions and tool schemas (tools in sorted order)
+        prefix_id: Stable hex digest of serialized
+        tools_summary: Tool count, names, descriptions and estimated tokens
+
+    Example:
+        >>> prefix = PromptPrefix.for_agent(chat_agent)
+        >>> prefix.prefix_id
+        '3f2a...'
+        >>> prefix.token_count
+        1342
+    """
+
+    def __init__(self, instructions: str, tools: list[Any]):
+        """Initialize the prefix; serialization happens on first use.
+
+        Args:
+            instructions: Agent system instructions
+            tools: Framework tools (AIFunction or objects with to_dict)
+        """
+        self.instructions = instructions
+        self._tools = tools
+
+    @cached_property
+    def _schemas(self) -> list[dict[str, Any]]:
+        """Provider-facing tool schemas."""
+        return [_tool_schema(tool) for tool in self._tools]
+
+    @cached_property
+    def serialized(self) -> str:
+        """Compact JSON of instructions and tool schemas (tools in sorted order)."""
+        return json.dumps(
+            {
+                "system": self.instructions,
+                "tools": sorted(
+                    self._schemas, key=lambda s: json.dumps(s, sort_keys=True, default=str)
+                ),
+            },
+            separators=(",", ":"),
+            sort_keys=True,
+            default=str,
+        )
+
+    @cached_property
+    def prefix_id(self) -> str:
+        """Stable hex digest of serialized."""
+        return cache_key(self.serialized).hex()
+
+    @cached_property
+    def tools_summary(self) -> dict[str, Any]:
+        """Tool count, names, descriptions and estimated tokens."""
+        tools_data = []
+        for schema in self._schemas:
+            spec = schema.get("function", schema)
+            description = spec.get("description") or ""
+            tools_data.append(
+                {
+                    "name": spec.get("name", "unknown"),
+                    "description": description[:100],
+                    "estimated_tokens": len(json.dumps(schema, default=str)) // 4,
+                }
+            )
+        return {
+            "count": len(self._tools),
+            "tools": tools_data,
+            "total_estimated_tokens": sum(t["estimated_tokens"] for t in tools_data),
+        }
+
+    @cached_property
+    def token_count(self) -> int:
+        """Token count of the serialized prefix, computed once per prefix id."""
+        count = _token_counts.get(self.prefix_id)
+        if count is None:
+            from agent.utils.tokens import count_tokens
+
+            count = _token_counts[self.prefix_id] = count_tokens(self.serialized)
+        return count
+
+    @classmethod
+    def for_agent(cls, agent: Any) -> "PromptPrefix":
+        """Get the prefix of a framework agent, serializing it on first use.
+
+        Args:
+            agent: Framework agent (ChatAgent) with chat_options
+
+        Returns:
+            Cached PromptPrefix for the agent
+        """
+        try:
+            return _prefixes[agent]
+        except (KeyError, TypeError):
+            pass
+
+        chat_options = getattr(agent, "chat_options", None)
+        prefix = cls(
+            getattr(chat_options, "instructions", None) or "",
+            list(getattr(chat_options, "tools", None) or []),
+        )
+        try:
+            _prefixes[agent] = prefix
+        except TypeError:
+            pass  # Agent cannot be weakly referenced; caller keeps its own reference
+        return prefix
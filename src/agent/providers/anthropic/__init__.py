@@ -0,0 +1,10 @@
+"""
+Anthropic provider implementation.
+
+This module provides an Anthropic chat client that marks the stable request
+prefix (tools and system instructions) for Anthropic prompt caching.
+"""
+
+from .chat_client import CACHED_INSTRUCTIONS_OPTION, CachingAnthropicClient
+
+__all__ = ["CACHED_INSTRUCTIONS_OPTION", "CachingAnthropicClient"]
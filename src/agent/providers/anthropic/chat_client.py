@@ -0,0 +1,101 @@
+"""
+Anthropic chat client with prompt caching.
+
+This module provides CachingAnthropicClient, which extends the framework's
+AnthropicClient to add `cache_control` breakpoints to each request so Anthropic
+can reuse the processed tool schemas and system instructions across calls
+instead of re-reading them on every turn.
+"""
+
+import logging
+from collections.abc import MutableSequence
+from typing import Any
+
+from agent_framework import ChatMessage, ChatOptions
+from agent_framework.anthropic import AnthropicClient
+
+logger = logging.getLogger(__name__)
+
+# Chat option carrying the agent's base instructions. Context providers (memory,
+# skills) append per-turn text to the system prompt; knowing where the stable part
+# ends lets the cache breakpoint sit before that dynamic suffix. The option is
+# consumed here and never sent to the API.
+CACHED_INSTRUCTIONS_OPTION = "cached_instructions"
+
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _system_blocks(system: str, cached_instructions: str | None) -> list[dict[str, Any]]:
+    """Split system prompt into text blocks with a cache breakpoint on the stable prefix.
+
+    Args:
+        system: Full system prompt sent with the request
+        cached_instructions: Agent base instructions (stable prefix), if known
+
+    Returns:
+        Anthropic system content blocks
+    """
+    if cached_instructions and system.startswith(cached_instructions):
+        suffix = system[len(cached_instructions) :]
+        if suffix.strip():
+            return [
+                {
+                    "type": "text",
+                    "text": cached_instructions,
+                    "cache_control": EPHEMERAL_CACHE_CONTROL,
+                },
+                {"type": "text", "text": suffix},
+            ]
+
+    return [{"type": "text", "text": system, "cache_control": EPHEMERAL_CACHE_CONTROL}]
+
+
+class CachingAnthropicClient(AnthropicClient):
+    """Anthropic chat client that enables prompt caching.
+
+    Adds two cache breakpoints to every request: one after the last tool schema
+    and one after the agent's base system instructions. Anthropic caches the
+    request prefix up to each breakpoint, so repeated turns only pay full input
+    cost for the conversation itself.
+
+    Example:
+        >>> client = CachingAnthropicClient(model_id="claude-haiku-4-5-20251001")
+        >>> agent = client.create_agent(
+        ...     instructions=instructions,
+        ...     additional_chat_options={CACHED_INSTRUCTIONS_OPTION: instructions},
+        ... )
+    """
+
+    def _create_run_options(
+        self,
+        messages: MutableSequence[ChatMessage],
+        chat_options: ChatOptions,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Create run options with cache_control breakpoints.
+
+        Args:
+            messages: The list of chat messages
+            chat_options: The chat options
+            kwargs: Additional keyword arguments
+
+        Returns:
+            Run options for the Anthropic messages API
+        """
+        run_options: dict[str, Any] = super()._create_run_options(messages, chat_options, **kwargs)
+        cached_instructions = run_options.pop(CACHED_INSTRUCTIONS_OPTION, None)
+
+        tools = run_options.get("tools")
+        if tools:
+            # Tools come first in the cached prefix; a breakpoint here keeps them
+            # cached even when the system prompt suffix changes.
+            run_options["tools"] = [
+                *tools[:-1],
+                {**tools[-1], "cache_control": EPHEMERAL_CACHE_CONTROL},
+            ]
+
+        system = run_options.get("system")
+        if isinstance(system, str) and system:
+            run_options["system"] = _system_blocks(system, cached_instructions)
+
+        return run_options
@@ -13,6 +13,8 @@ Example:
     >>> skill_toolsets, script_tools, skill_instructions = loader.load_enabled_skills()
 """
 
+from typing import TYPE_CHECKING, Any
+
 from agent.skills.errors import (
     SkillDependencyError,
     SkillError,
@@ -20,9 +22,11 @@ from agent.skills.errors import (
     SkillNotFoundError,
     SkillSecurityError,
 )
-from agent.skills.loader import SkillLoader
-from agent.skills.manager import SkillManager
-from agent.skills.registry import SkillRegistry
+
+if TYPE_CHECKING:
+    from agent.skills.loader import SkillLoader
+    from agent.skills.manager import SkillManager
+    from agent.skills.registry import SkillRegistry
 
 __all__ = [
     "SkillError",
@@ -34,3 +38,24 @@ __all__ = [
     "SkillManager",
     "SkillRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import loader, manager and registry.
+
+    They pull in GitPython and the toolset machinery; deferring them keeps
+    skill CLI commands that only edit config (enable/disable) cheap to import.
+    """
+    if name == "SkillLoader":
+        from agent.skills.loader import SkillLoader
+
+        return SkillLoader
+    if name == "SkillManager":
+        from agent.skills.manager import SkillManager
+
+        return SkillManager
+    if name == "SkillRegistry":
+        from agent.skills.registry import SkillRegistry
+
+        return SkillRegistry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
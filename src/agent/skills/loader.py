@@ -6,6 +6,9 @@ and dynamic toolset importing.
 
 import importlib.util
 import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +23,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Skills are loaded in parallel: each one reads its manifest, scans its scripts
+# directory and imports toolset modules, which is mostly file I/O.
+MAX_SKILL_LOAD_WORKERS = 8
+
+
+def _scan_threads() -> int:
+    """Threads used to check skill directories for SKILL.md (AGENT_SKILL_SCAN_THREADS)."""
+    try:
+        return max(1, int(os.getenv("AGENT_SKILL_SCAN_THREADS", "8")))
+    except ValueError:
+        return 8
+
+
+def _has_skill_md(directory: str) -> bool:
+    """Check whether a directory contains a SKILL.md file (one stat call)."""
+    return os.path.isfile(os.path.join(directory, "SKILL.md"))
+
 
 class SkillLoader:
     """Load and manage skills for the agent.
@@ -53,19 +73,39 @@ class SkillLoader:
         Returns:
             List of skill directory paths containing SKILL.md
         """
-        if not directory.exists():
-            return []
+        return list(self.iter_skill_directory(directory))
 
-        skill_dirs = []
-        for item in directory.iterdir():
-            if not item.is_dir():
-                continue
+    def iter_skill_directory(self, directory: Path) -> Iterator[Path]:
+        """Yield skill directories (containing SKILL.md) as they are found.
+
+        Lets callers such as `agent skill show` render each skill while the
+        directory is still being walked.
 
-            skill_md = item / "SKILL.md"
-            if skill_md.exists() and skill_md.is_file():
-                skill_dirs.append(item)
+        Args:
+            directory: Directory to scan for skills
 
-        return skill_dirs
+        Yields:
+            Skill directory paths containing SKILL.md
+        """
+        try:
+            with os.scandir(directory) as entries:
+                # d_type from the directory listing avoids a stat per entry
+                candidates = [entry.path for entry in entries if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        threads = min(_scan_threads(), len(candidates))
+        if threads <= 1:
+            yield from (Path(path) for path in candidates if _has_skill_md(path))
+            return
+
+        # Overlap the SKILL.md stat calls (slow on a cold inode cache); results
+        # are still yielded in directory order as they complete
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="skill-scan") as executor:
+            found = executor.map(_has_skill_md, candidates)
+            for path, is_skill in zip(candidates, found, strict=True):
+                if is_skill:
+                    yield Path(path)
 
     def discover_scripts(self, skill_path: Path, manifest: SkillManifest) -> list[dict[str, Any]]:
         """Discover scripts in skill's scripts/ directory.
@@ -235,6 +275,35 @@ class SkillLoader:
 
         return manifest, toolsets, scripts
 
+    def _load_skills(
+        self, skill_dirs: list[Path]
+    ) -> list[tuple[SkillManifest, list[AgentToolset], list[dict]] | Exception]:
+        """Load several skills concurrently.
+
+        Args:
+            skill_dirs: Skill directories to load
+
+        Returns:
+            load_skill() result or the raised exception for each directory, in order
+        """
+
+        def load(
+            skill_dir: Path,
+        ) -> tuple[SkillManifest, list[AgentToolset], list[dict]] | Exception:
+            try:
+                return self.load_skill(skill_dir)
+            except Exception as e:
+                return e
+
+        if len(skill_dirs) <= 1:
+            return [load(skill_dir) for skill_dir in skill_dirs]
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_SKILL_LOAD_WORKERS, len(skill_dirs)),
+            thread_name_prefix="skill-loader",
+        ) as executor:
+            return list(executor.map(load, skill_dirs))
+
     def load_enabled_skills(self) -> tuple[list[AgentToolset], Any, "SkillDocumentationIndex"]:
         """Load all enabled skills based on configuration.
 
@@ -313,9 +382,12 @@ class SkillLoader:
 
         skill_docs = SkillDocumentationIndex()
 
-        for skill_dir in bundled_skill_dirs + plugin_skill_dirs:
+        skill_dirs = bundled_skill_dirs + plugin_skill_dirs
+        for skill_dir, loaded in zip(skill_dirs, self._load_skills(skill_dirs), strict=True):
             try:
-                manifest, toolsets, scripts = self.load_skill(skill_dir)
+                if isinstance(loaded, Exception):
+                    raise loaded
+                manifest, toolsets, scripts = loaded
                 canonical_name = normalize_skill_name(manifest.name)
 
                 # Three-state logic for bundled skills (plugins always enabled if in config)
@@ -5,12 +5,14 @@ path validation, and trust management.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
-from git import Repo
-
 from agent.skills.errors import SkillManifestError, SkillSecurityError
 
+# Valid skill names: alphanumeric + hyphens/underscores, 1-64 chars
+_SKILL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+
 
 def sanitize_skill_name(name: str) -> str:
     """Validate skill name for security.
@@ -49,7 +51,7 @@ def sanitize_skill_name(name: str) -> str:
         raise SkillSecurityError(f"Invalid skill name: '{name}' (spaces not allowed)")
 
     # Must be alphanumeric + hyphens/underscores, 1-64 chars
-    if not re.match(r"^[a-zA-Z0-9_-]{1,64}$", name):
+    if not _SKILL_NAME_PATTERN.match(name):
         raise SkillSecurityError(
             f"Invalid skill name: '{name}' "
             "(must be alphanumeric with hyphens/underscores, 1-64 chars)"
@@ -58,6 +60,7 @@ def sanitize_skill_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=2048)
 def normalize_skill_name(name: str) -> str:
     """Normalize skill name to canonical form.
 
@@ -159,6 +162,8 @@ def pin_commit_sha(repo_path: Path) -> str:
         >>> len(sha)  # doctest: +SKIP
         40
     """
+    from git import Repo
+
     try:
         repo = Repo(repo_path)
         if repo.head.is_detached:
@@ -0,0 +1,155 @@
+"""Shared HTTP connection pool for provider SDK clients.
+
+OpenAI-compatible and Anthropic SDK clients each create their own httpx client by
+default, so every chat client opens fresh TCP+TLS connections. This module keeps a
+single client per process that those SDK clients share, letting repeated requests
+(and rebuilt Agent instances) reuse warm sockets.
+
+Pooled connections belong to the event loop that opened them, so the shared
+client keeps a separate keep-alive pool per running loop. Library callers that
+use several asyncio.run() calls get a fresh pool in each loop instead of
+connections bound to a closed one.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool tuned for a single interactive user: a handful of concurrent
+# requests, with idle connections kept warm between prompts.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=300,
+)
+
+# Matches the provider SDK defaults (long reads for slow generations)
+HTTP_POOL_TIMEOUT = httpx.Timeout(timeout=600.0, connect=5.0)
+
+# Remaining-request headers reported by providers (OpenAI, Anthropic)
+RATE_LIMIT_REMAINING_HEADERS = (
+    "x-ratelimit-remaining-requests",
+    "anthropic-ratelimit-requests-remaining",
+)
+
+_shared_client: httpx.AsyncClient | None = None
+_rate_limit_remaining: int | None = None
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package required for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Async transport that keeps one connection pool per running event loop.
+
+    Pools of loops that have been garbage collected are dropped with them.
+    """
+
+    def __init__(self, **transport_options: Any):
+        """Initialize transport.
+
+        Args:
+            **transport_options: Options for each httpx.AsyncHTTPTransport pool
+        """
+        self._options = transport_options
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+        ] = weakref.WeakKeyDictionary()
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        """Return the pool for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = httpx.AsyncHTTPTransport(**self._options)
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request through the running loop's pool."""
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the running loop's pool (pools of other loops cannot be awaited here)."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+        self._pools.clear()
+
+
+async def _record_rate_limit(response: httpx.Response) -> None:
+    """Remember the provider's remaining request budget from response headers."""
+    global _rate_limit_remaining
+
+    for header in RATE_LIMIT_REMAINING_HEADERS:
+        value = response.headers.get(header)
+        if value is not None and value.isdigit():
+            _rate_limit_remaining = int(value)
+            return
+
+
+def get_rate_limit_remaining() -> int | None:
+    """Get the most recently reported remaining request budget.
+
+    Returns:
+        Remaining requests in the provider's current rate-limit window, or None if
+        no response through the shared client has reported it yet
+    """
+    return _rate_limit_remaining
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client used by provider SDKs.
+
+    A new client is created on first use, or if the previous one was closed
+    (for example when a chat client was closed on exit). Connections are pooled
+    per running event loop, so the client is safe to use across asyncio.run()
+    calls.
+
+    Returns:
+        Shared httpx.AsyncClient with keep-alive connection pooling
+
+    Example:
+        >>> from openai import AsyncOpenAI
+        >>> client = AsyncOpenAI(api_key="sk-...", http_client=get_shared_http_client())
+    """
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        http2 = _http2_available()
+        _shared_client = httpx.AsyncClient(
+            transport=_LoopLocalTransport(limits=HTTP_POOL_LIMITS, http2=http2),
+            timeout=HTTP_POOL_TIMEOUT,
+            follow_redirects=True,
+            event_hooks={"response": [_record_rate_limit]},
+        )
+        logger.debug(f"Created shared HTTP connection pool (http2={http2})")
+
+    return _shared_client
+
+
+def clear_shared_http_client() -> None:
+    """Forget the shared HTTP client without closing it.
+
+    Later calls to get_shared_http_client() build a new client. Use
+    close_shared_http_client() from async code to also release connections.
+    """
+    global _shared_client, _rate_limit_remaining
+
+    _rate_limit_remaining = None
+    _shared_client = None
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client and release the running loop's pooled connections."""
+    client = _shared_client
+    clear_shared_http_client()
+    if client is not None and not client.is_closed:
+        await client.aclose()
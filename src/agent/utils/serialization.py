@@ -0,0 +1,49 @@
+"""JSON (de)serialization helpers for session and settings files.
+
+Uses orjson when the optional `fast` extra is installed (pip install
+agent-base[fast]) and falls back to the standard library otherwise. Files are
+plain JSON either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation (default: compact)
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return bytes(orjson.dumps(data, option=option))
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
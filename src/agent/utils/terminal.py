@@ -4,10 +4,17 @@ This module provides terminal control functions for the CLI interface.
 Adapted from butler-agent for agent-template.
 """
 
+import atexit
 import logging
 import os
+import selectors
+import shlex
+import signal
 import subprocess
 import sys
+import threading
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -100,3 +107,190 @@ def execute_shell_command(
         error_msg = f"Command execution failed: {str(e)}"
         logger.error(f"Shell command error: {error_msg}")
         return (1, "", error_msg)
+
+
+class PersistentShell:
+    """Long-lived bash process that runs commands without a fork/exec per command.
+
+    Each command is sent to the same bash child followed by a sentinel line that
+    reports the exit status, so rapid `!ls`/`!pwd` chains skip shell startup.
+    Because the shell is shared, state persists across commands: `cd` changes the
+    working directory and `export` changes the environment of later commands.
+
+    Commands run with stdin redirected from /dev/null (they cannot read from the
+    terminal). If a command times out, is interrupted, or exits the shell, the
+    process is killed and a fresh one is started for the next command.
+
+    Example:
+        >>> shell = PersistentShell()
+        >>> shell.run("cd /tmp")
+        (0, '', '')
+        >>> shell.run("pwd")
+        (0, '/tmp\\n', '')
+        >>> shell.close()
+    """
+
+    def __init__(self, cwd: str | None = None):
+        """Initialize persistent shell (the bash process starts on first use).
+
+        Args:
+            cwd: Initial working directory (default: current directory)
+        """
+        self.cwd = cwd
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: int = 30) -> tuple[int, str, str]:
+        """Run a command in the persistent shell.
+
+        Args:
+            command: Shell command to execute
+            timeout: Command timeout in seconds (default: 30)
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr), as execute_shell_command
+
+        Raises:
+            OSError: If the bash process cannot be started (e.g. bash is not installed)
+        """
+        logger.debug(f"Executing shell command (persistent): {command}")
+        with self._lock:
+            process = self._start()
+            try:
+                return self._run(process, command, timeout)
+            except OSError as e:
+                self._kill()
+                error_msg = f"Command execution failed: {str(e)}"
+                logger.error(f"Shell command error: {error_msg}")
+                return (1, "", error_msg)
+            except BaseException:
+                # Interrupted (e.g. Ctrl-C): the command would keep running and
+                # its output and sentinels would leak into the next result
+                self._kill()
+                raise
+
+    def close(self) -> None:
+        """Terminate the bash process, if running."""
+        with self._lock:
+            self._kill()
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        """Return the running bash process, starting one if needed."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["bash", "--noprofile", "--norc"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                cwd=self.cwd,
+                start_new_session=True,
+            )
+        return self._process
+
+    def _kill(self) -> None:
+        """Kill the bash process group and forget the process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                process.kill()
+        process.wait()
+        for pipe in (process.stdin, process.stdout, process.stderr):
+            if pipe is not None:
+                pipe.close()
+
+    def _run(
+        self, process: subprocess.Popen[bytes], command: str, timeout: int
+    ) -> tuple[int, str, str]:
+        """Send one command to the bash process and read output up to the sentinels."""
+        assert process.stdin and process.stdout and process.stderr
+
+        # eval keeps cd/export in this shell and turns syntax errors (e.g. an
+        # unbalanced quote) into a failed command instead of a stuck protocol
+        sentinel = f"__END_{uuid.uuid4().hex}__".encode()
+        token = sentinel.decode()
+        script = (
+            f"eval {shlex.quote(command)} </dev/null\n"
+            f"printf '%s%d\\n' {token} $? ; printf '%s\\n' {token} >&2\n"
+        )
+        process.stdin.write(script.encode("utf-8"))
+
+        out_fd, err_fd = process.stdout.fileno(), process.stderr.fileno()
+        buffers = {out_fd: bytearray(), err_fd: bytearray()}
+        pending = set(buffers)
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            for fd in buffers:
+                selector.register(fd, selectors.EVENT_READ)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill()
+                    logger.warning(f"Shell command timeout: {command}")
+                    return (TIMEOUT_EXIT_CODE, "", f"Command timed out after {timeout}s")
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        # Command exited the shell; report its status and restart later
+                        exit_code = process.wait()
+                        self._kill()
+                        return (exit_code, _decode(buffers[out_fd]), _decode(buffers[err_fd]))
+                    buffers[key.fd] += chunk
+                    if sentinel in buffers[key.fd]:
+                        selector.unregister(key.fd)
+                        pending.discard(key.fd)
+
+        stdout, _, status = bytes(buffers[out_fd]).partition(sentinel)
+        stderr = bytes(buffers[err_fd]).partition(sentinel)[0]
+        exit_code = int(status.strip() or 1)
+        logger.debug(f"Command completed with exit code {exit_code}")
+        return (exit_code, _decode(stdout), _decode(stderr))
+
+
+def _decode(data: bytes | bytearray) -> str:
+    """Decode command output, replacing invalid UTF-8."""
+    return bytes(data).decode("utf-8", errors="replace")
+
+
+_shared_shell: PersistentShell | None = None
+_shared_shell_lock = threading.Lock()
+
+
+def run_shell_command(command: str, timeout: int = 30) -> tuple[int, str, str]:
+    """Execute shell command in the shared persistent shell.
+
+    Uses a single PersistentShell for the process, so working directory and
+    environment changes carry over between commands. On Windows, or when bash
+    is not available, falls back to execute_shell_command.
+
+    Args:
+        command: Shell command to execute
+        timeout: Command timeout in seconds (default: 30)
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+
+    Example:
+        >>> run_shell_command("cd src")
+        (0, '', '')
+        >>> exit_code, stdout, stderr = run_shell_command("ls")  # lists src/
+    """
+    global _shared_shell
+
+    if os.name == "nt":
+        return execute_shell_command(command, timeout=timeout)
+
+    with _shared_shell_lock:
+        if _shared_shell is None:
+            _shared_shell = PersistentShell()
+            atexit.register(_shared_shell.close)
+
+    try:
+        return _shared_shell.run(command, timeout=timeout)
+    except OSError as e:
+        logger.debug(f"Persistent shell unavailable, using subprocess: {e}")
+        return execute_shell_command(command, timeout=timeout)
@@ -8,7 +8,12 @@ discovered by pytest through this conftest.py file.
 """
 
 # Import all fixtures from organized modules
-from tests.fixtures.agent import agent_instance, mock_chat_client  # noqa: F401
+from tests.fixtures.agent import (  # noqa: F401
+    agent_instance,
+    mock_chat_client,
+    reset_chat_client_cache,
+    reset_shared_http_client,
+)
 from tests.fixtures.config import (  # noqa: F401
     custom_prompt_file,
     custom_prompt_settings,
@@ -20,12 +25,14 @@ from tests.fixtures.config import (  # noqa: F401
     mock_local_settings,
     mock_openai_settings,
     mock_settings,
+    reset_config_cache,
 )
 from tests.fixtures.memory import (  # noqa: F401
     memory_config,
     memory_manager,
     memory_persistence,
     memory_store,
+    reset_memory_cache,
     sample_messages,
 )
 
@@ -2,10 +2,27 @@
 
 import pytest
 
-from agent.agent import Agent
+from agent.agent import Agent, clear_chat_client_cache
+from agent.utils.http import clear_shared_http_client
 from tests.mocks.mock_client import MockChatClient
 
 
+@pytest.fixture(autouse=True)
+def reset_chat_client_cache():
+    """Isolate the process-level chat client cache between tests."""
+    clear_chat_client_cache()
+    yield
+    clear_chat_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_http_client():
+    """Isolate the process-level HTTP client and rate-limit budget between tests."""
+    clear_shared_http_client()
+    yield
+    clear_shared_http_client()
+
+
 @pytest.fixture
 def mock_chat_client():
     """Create mock chat client."""
@@ -2,9 +2,18 @@
 
 import pytest
 
+from agent.config import clear_config_cache
 from agent.config.schema import AgentSettings
 
 
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Isolate the process-level configuration cache between tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
 @pytest.fixture
 def mock_openai_settings():
     """Create mock OpenAI configuration."""
@@ -4,9 +4,18 @@ import pytest
 
 from agent.config.schema import AgentSettings
 from agent.memory import InMemoryStore, create_memory_manager
+from agent.memory.mem0_utils import clear_memory_cache
 from agent.memory.persistence import MemoryPersistence
 
 
+@pytest.fixture(autouse=True)
+def reset_memory_cache():
+    """Isolate the process-level mem0 Memory cache between tests."""
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
 @pytest.fixture
 def memory_config():
     """Create config with memory enabled."""
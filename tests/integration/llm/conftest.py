@@ -12,6 +12,27 @@ import requests
 
 from agent.agent import Agent
 from agent.config.schema import AgentSettings
+from tests.mocks.cassette import CassetteAgent
+from tests.mocks.mock_client import MockChatClient
+
+# Gemini model for live runs: higher free-tier limits (15 RPM) than newer models
+GEMINI_TEST_MODEL = "gemini-2.0-flash"
+
+# Seconds between live Gemini requests on the free tier (GEMINI_TIER=paid disables)
+GEMINI_FREE_TIER_INTERVAL = 4.0
+
+
+def use_mock_provider() -> bool | None:
+    """Read USE_MOCK_PROVIDER.
+
+    Returns:
+        True to replay cassettes only, False to call the real API and record
+        cassettes, None (unset) to replay where recorded and run live otherwise
+    """
+    value = os.getenv("USE_MOCK_PROVIDER")
+    if value is None:
+        return None
+    return value.lower() not in ("0", "false", "no")
 
 
 @pytest.fixture
@@ -120,29 +141,57 @@ def foundry_agent():
     return Agent(settings=config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gemini_agent():
-    """Create agent with real Gemini client.
+    """Create Gemini agent that replays recorded cassettes where available.
+
+    Session-scoped so live runs create the Gemini client once; tests using it
+    must run on the session event loop (asyncio loop_scope="session").
 
-    Automatically skips if GEMINI_API_KEY is not set.
+    USE_MOCK_PROVIDER selects the mode:
+    - unset: prompts with a cassette in tests/fixtures/llm_mocks/ are replayed,
+      others call the real API (skipped if GEMINI_API_KEY is not set)
+    - true: replay only; prompts without a cassette are skipped
+    - 0/false: always call the real API and record cassettes (skipped if
+      GEMINI_API_KEY is not set)
+
+    Replayed responses are canned text, so they don't exercise tool calling.
+    Live requests are spaced GEMINI_FREE_TIER_INTERVAL seconds apart unless
+    GEMINI_TIER=paid.
 
     Example:
         @pytest.mark.llm
         @pytest.mark.requires_gemini
+        @pytest.mark.asyncio(loop_scope="session")
         async def test_something(gemini_agent):
             response = await gemini_agent.run("test")
     """
-    if not os.getenv("GEMINI_API_KEY"):
-        pytest.skip("GEMINI_API_KEY not set - skipping real LLM test")
-
-    from agent.config import DEFAULT_GEMINI_MODEL
-
     config = AgentSettings()
     config.providers.enabled = ["gemini"]
-    config.providers.gemini.api_key = os.getenv("GEMINI_API_KEY")
-    config.providers.gemini.model = os.getenv("GEMINI_MODEL", DEFAULT_GEMINI_MODEL)
+    config.providers.gemini.model = os.getenv("GEMINI_MODEL", GEMINI_TEST_MODEL)
 
-    return Agent(settings=config)
+    mock = use_mock_provider()
+    api_key = os.getenv("GEMINI_API_KEY")
+
+    if mock or (mock is None and not api_key):
+        config.providers.gemini.api_key = "replay"
+        agent = Agent(settings=config, chat_client=MockChatClient())
+        agent.agent = CassetteAgent()
+        return agent
+
+    if not api_key:
+        pytest.skip("GEMINI_API_KEY not set - skipping real LLM test")
+
+    config.providers.gemini.api_key = api_key
+    agent = Agent(settings=config)
+    paid = os.getenv("GEMINI_TIER", "").lower() == "paid"
+    agent.agent = CassetteAgent(
+        agent.agent,
+        min_interval=0.0 if paid else GEMINI_FREE_TIER_INTERVAL,
+        replay=mock is None,
+        record=mock is False,
+    )
+    return agent
 
 
 @pytest.fixture
@@ -205,10 +254,19 @@ def pytest_configure(config):
 
 
 def pytest_collection_modifyitems(config, items):
-    """Mark all tests in this directory with @pytest.mark.llm."""
+    """Mark all tests in this directory with @pytest.mark.llm.
+
+    Also skips the Gemini tests at collection time when they would call the
+    real API (USE_MOCK_PROVIDER=0) without GEMINI_API_KEY, so no fixtures run.
+    """
     llm_path_marker = "integration/llm"
+    skip_gemini = None
+    if use_mock_provider() is False and not os.getenv("GEMINI_API_KEY"):
+        skip_gemini = pytest.mark.skip(reason="GEMINI_API_KEY not set - skipping real LLM test")
 
     for item in items:
         if llm_path_marker in str(item.fspath):
             item.add_marker(pytest.mark.llm)
             item.add_marker(pytest.mark.slow)
+            if skip_gemini and "test_gemini_integration" in str(item.fspath):
+                item.add_marker(skip_gemini)
@@ -1,41 +1,106 @@
-"""Real Gemini integration tests.
+"""Gemini integration tests.
 
-⚠️ WARNING: These tests make real API calls and cost money!
+Prompts with a cassette in tests/fixtures/llm_mocks/ are replayed without API
+calls; the others call the real API when GEMINI_API_KEY is set and are skipped
+otherwise. Replayed responses are canned text: they only check the assertions
+against recorded output and do not exercise tool schemas or tool calls.
 
-Cost: ~$0.001 per test run (with gemini-2.0-flash-exp, free tier available)
+⚠️ WARNING: Live runs make real API calls and cost money!
+
+Cost: ~$0.001 per live run (with gemini-2.0-flash, free tier available)
 
 How to run:
-    # Set API key
+    # Replay recorded responses, live for the rest
     export GEMINI_API_KEY=your-key
-
-    # Run these tests
     pytest -m "llm and requires_gemini"
 
+    # Replay only (no API calls)
+    USE_MOCK_PROVIDER=1 pytest -m "llm and requires_gemini"
+
+    # Call the real API for every test and record cassettes
+    USE_MOCK_PROVIDER=0 pytest -m "llm and requires_gemini"
+
     # Or run all LLM tests
     pytest -m llm
 
 Note: Gemini offers a free tier with 15 requests/minute, 1500/day
+
+gemini_agent is session-scoped, so tests run on the session event loop and
+share one client. The non-streaming prompts are sent together once per run
+(gemini_results) and each test checks its own response; tool invocation tests
+stream and stop as soon as the expected text appears.
 """
 
+import asyncio
+import re
+
 import pytest
+import pytest_asyncio
+
+# Phrases an LLM uses to report a tool error ("doesn't support", "only accepts", ...)
+_ERROR_RE = re.compile(
+    r"not supported|does not support|doesn't support|only accepts|only supports"
+    r"|unsupported|not available|unable|cannot|error",
+    re.IGNORECASE,
+)
+
+# Prompts for the non-streaming tests, sent together by gemini_results
+PROMPTS = {
+    "basic": "Say the word 'test' and nothing else",
+    "math": "What is 2+2? Answer with just the number.",
+    "tool_error": "Use greet_user to greet someone in German (language code 'de')",
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def gemini_results(gemini_agent):
+    """Run all PROMPTS concurrently and return responses (or errors) by name."""
+    responses = await gemini_agent.run_many(list(PROMPTS.values()), return_exceptions=True)
+    return dict(zip(PROMPTS, responses, strict=True))
+
+
+def _response(gemini_results, name):
+    """Return the response for a prompt, re-raising its error (including skips)."""
+    response = gemini_results[name]
+    if isinstance(response, BaseException):
+        raise response
+    return response
+
+
+# Upper bound for a streamed response to contain the expected text
+STREAM_MATCH_TIMEOUT = 30.0
+
+
+async def _first_match(agent, prompt, needles):
+    """Stream a response until any needle appears, returning the text so far."""
+
+    async def collect():
+        text = ""
+        async for chunk in agent.run_stream(prompt):
+            text += chunk
+            if any(needle in text for needle in needles):
+                break
+        return text
+
+    return await asyncio.wait_for(collect(), timeout=STREAM_MATCH_TIMEOUT)
 
 
 @pytest.mark.llm
 @pytest.mark.requires_gemini
 @pytest.mark.slow
+@pytest.mark.xdist_group("gemini_rate_limit")
 class TestGeminiBasicFunctionality:
     """Test basic Gemini functionality with real API.
 
     These tests verify the agent works correctly with Google's Gemini API.
     """
 
-    @pytest.mark.asyncio
-    async def test_basic_prompt_response(self, gemini_agent):
+    def test_basic_prompt_response(self, gemini_results):
         """Test basic prompt with real Gemini API.
 
         Cost: ~$0.0001 (free tier available)
         """
-        response = await gemini_agent.run("Say the word 'test' and nothing else")
+        response = _response(gemini_results, "basic")
 
         assert response is not None, "Should return response"
         assert isinstance(response, str), "Response should be string"
@@ -43,44 +108,51 @@ class TestGeminiBasicFunctionality:
         # Relaxed assertion - LLM might not follow exactly
         assert "test" in response.lower(), "Response should contain 'test'"
 
-    @pytest.mark.asyncio
-    async def test_simple_math(self, gemini_agent):
+    def test_simple_math(self, gemini_results):
         """Test simple reasoning with Gemini.
 
         Cost: ~$0.0001
         """
-        response = await gemini_agent.run("What is 2+2? Answer with just the number.")
+        response = _response(gemini_results, "math")
 
         assert response is not None
         # Should contain "4" somewhere in response
         assert "4" in response, "Response should contain '4'"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_streaming_response(self, gemini_agent):
         """Test streaming with Gemini.
 
         Cost: ~$0.0001
         """
-        chunks = []
+        count = 0
+        total_len = 0
         async for chunk in gemini_agent.run_stream("Say hello"):
-            chunks.append(chunk)
+            count += 1
+            total_len += len(chunk)
+            if count >= 2:
+                # Chunked delivery works; don't wait for the rest of the generation
+                break
 
-        assert len(chunks) > 0, "Should receive chunks"
-        full_response = "".join(chunks)
-        assert len(full_response) > 0, "Combined response should not be empty"
+        assert count > 0, "Should receive chunks"
+        assert total_len > 0, "Streamed response should not be empty"
 
 
 @pytest.mark.llm
 @pytest.mark.requires_gemini
 @pytest.mark.slow
+@pytest.mark.xdist_group("gemini_rate_limit")
 class TestGeminiToolInvocation:
     """Test tool invocation with real Gemini API.
 
     These tests verify Gemini correctly calls our tools.
     This is CRITICAL - it ensures tool schemas are correct.
+
+    Only live runs check this: a replayed cassette is canned text, so it
+    only checks the expected names/greetings appear in recorded output.
     """
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_tool_invocation_hello_world(self, gemini_agent):
         """Test that Gemini correctly invokes hello_world tool.
 
@@ -92,22 +164,26 @@ class TestGeminiToolInvocation:
 
         Cost: ~$0.0005
         """
-        response = await gemini_agent.run(
-            "Use the hello_world tool to greet Alice. Return only the greeting."
+        response = await _first_match(
+            gemini_agent,
+            "Use the hello_world tool to greet Alice. Return only the greeting.",
+            ("Alice",),
         )
 
         # Verify response contains expected content
         assert "Alice" in response, "Response should mention Alice"
         assert len(response) > 0, "Should have response"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_tool_invocation_with_language(self, gemini_agent):
         """Test greet_user tool with language parameter.
 
         Cost: ~$0.0005
         """
-        response = await gemini_agent.run(
-            "Use greet_user to greet Bob in Spanish (language code 'es')"
+        response = await _first_match(
+            gemini_agent,
+            "Use greet_user to greet Bob in Spanish (language code 'es')",
+            ("Bob", "Hola", "hola"),
         )
 
         # Should contain Spanish greeting or mention Bob
@@ -117,11 +193,15 @@ class TestGeminiToolInvocation:
 @pytest.mark.llm
 @pytest.mark.requires_gemini
 @pytest.mark.slow
+@pytest.mark.xdist_group("gemini_rate_limit")
 class TestGeminiErrorHandling:
-    """Test error handling with real Gemini API."""
+    """Test error handling with real Gemini API.
 
-    @pytest.mark.asyncio
-    async def test_tool_error_communication(self, gemini_agent):
+    Only live runs call the tool; a replayed cassette only checks the
+    recorded response still reads as an error report.
+    """
+
+    def test_tool_error_communication(self, gemini_results):
         """Test that LLM communicates tool errors to user.
 
         When a tool returns an error, the LLM should:
@@ -131,29 +211,10 @@ class TestGeminiErrorHandling:
 
         Cost: ~$0.0005
         """
-        response = await gemini_agent.run(
-            "Use greet_user to greet someone in German (language code 'de')"
-        )
+        response = _response(gemini_results, "tool_error")
 
         # LLM should communicate the error
-        # It might say "doesn't support", "not supported", "only accepts", etc.
-        response_lower = response.lower()
-        error_indicators = [
-            "not supported",
-            "error",
-            "cannot",
-            "unable",
-            "not available",
-            "doesn't support",
-            "does not support",
-            "only accepts",
-            "only supports",
-            "unsupported",
-        ]
-
-        assert any(
-            indicator in response_lower for indicator in error_indicators
-        ), f"Should communicate tool error. Response: {response}"
+        assert _ERROR_RE.search(response), f"Should communicate tool error. Response: {response}"
 
 
 # NOTE: Multi-turn conversation context tests removed
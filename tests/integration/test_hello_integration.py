@@ -51,10 +51,8 @@ async def test_agent_run_stream_integration():
     async for chunk in agent.run_stream("Test"):
         chunks.append(chunk)
 
-    # Should get "Hello" and "World" as separate chunks
-    assert len(chunks) == 2
-    assert "Hello" in "".join(chunks)
-    assert "World" in "".join(chunks)
+    # Words streamed back-to-back are delivered as one batch
+    assert "".join(chunks) == "Hello World "
 
 
 @pytest.mark.asyncio
@@ -1,5 +1,6 @@
 """Mock implementations for testing."""
 
+from tests.mocks.cassette import CassetteAgent
 from tests.mocks.mock_client import MockAgent, MockChatClient
 
-__all__ = ["MockAgent", "MockChatClient"]
+__all__ = ["CassetteAgent", "MockAgent", "MockChatClient"]
@@ -0,0 +1,156 @@
+"""Record/replay agent for LLM integration tests.
+
+Responses are stored as JSON cassettes named by the SHA-256 of the prompt,
+so tests can be replayed from disk without API calls once recorded.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+CASSETTE_DIR = Path(__file__).parent.parent / "fixtures" / "llm_mocks"
+
+
+def cassette_path(prompt: str, cassette_dir: Path = CASSETTE_DIR) -> Path:
+    """Return the cassette file for a prompt.
+
+    Args:
+        prompt: User prompt
+        cassette_dir: Directory holding cassettes
+
+    Returns:
+        Path to <sha256(prompt)>.json
+    """
+    return cassette_dir / f"{hashlib.sha256(prompt.encode()).hexdigest()}.json"
+
+
+class CassetteAgent:
+    """Framework agent stand-in that replays, forwards or records responses.
+
+    A prompt with a cassette is answered from it (when replay is on). Otherwise
+    the call goes to the real agent, and its response text is saved when
+    record is on. Without a real agent the test is skipped.
+
+    Replayed responses are canned text: no tools run, so replay only checks
+    the assertions against recorded output, not tool schemas.
+    """
+
+    # Start of the last recorded request, shared so pacing spans tests
+    _last_request = 0.0
+
+    def __init__(
+        self,
+        agent: Any | None = None,
+        cassette_dir: Path = CASSETTE_DIR,
+        min_interval: float = 0.0,
+        replay: bool = True,
+        record: bool = False,
+    ):
+        """Initialize cassette agent.
+
+        Args:
+            agent: Real framework agent for prompts not answered from a
+                cassette (None to replay only)
+            cassette_dir: Directory holding cassettes
+            min_interval: Minimum seconds between real requests, to stay
+                under provider rate limits
+            replay: Answer prompts from existing cassettes
+            record: Save responses from the real agent as cassettes
+        """
+        self.agent = agent
+        self.cassette_dir = cassette_dir
+        self.min_interval = min_interval
+        self.replay = replay
+        self.record = record
+
+    async def _pace(self) -> None:
+        """Wait until min_interval has passed since the last real request."""
+        # Reserve the next slot before sleeping so concurrent requests queue up
+        now = time.monotonic()
+        start = max(now, CassetteAgent._last_request + self.min_interval)
+        CassetteAgent._last_request = start
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _load(self, prompt: str, field: str) -> Any | None:
+        """Load a recorded field for a prompt (None if not recorded or replay is off).
+
+        Skips the test when there is no recording and no real agent to call.
+        """
+        if self.replay:
+            path = cassette_path(prompt, self.cassette_dir)
+            if path.exists():
+                recorded = json.loads(path.read_text(encoding="utf-8"))
+                if field in recorded:
+                    return recorded[field]
+        if self.agent is None:
+            pytest.skip(
+                f"No recorded {field} for prompt - set GEMINI_API_KEY to run live, "
+                "or USE_MOCK_PROVIDER=0 to record"
+            )
+        return None
+
+    def _save(self, prompt: str, field: str, value: Any) -> None:
+        """Save a recorded field for a prompt, keeping other fields."""
+        path = cassette_path(prompt, self.cassette_dir)
+        recorded = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        recorded.update({"prompt": prompt, field: value})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(recorded, indent=2) + "\n", encoding="utf-8")
+
+    async def run(self, prompt: str, **kwargs: Any) -> str:
+        """Return the recorded response, or call the real agent.
+
+        Args:
+            prompt: User prompt
+            **kwargs: Forwarded to the real agent when recording
+
+        Returns:
+            Response text
+        """
+        recorded = self._load(prompt, "response")
+        if recorded is not None:
+            return str(recorded)
+
+        await self._pace()
+        result = await self.agent.run(prompt, **kwargs)
+        response = result if isinstance(result, str) else str(getattr(result, "text", result))
+        if self.record:
+            self._save(prompt, "response", response)
+        return response
+
+    async def run_stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+        """Stream the recorded chunks, or stream from the real agent.
+
+        Args:
+            prompt: User prompt
+            **kwargs: Forwarded to the real agent when recording
+
+        Yields:
+            Response chunks
+        """
+        recorded = self._load(prompt, "chunks")
+        if recorded is not None:
+            for chunk in recorded:
+                yield chunk
+            return
+
+        await self._pace()
+        chunks: list[str] = []
+        try:
+            async for update in self.agent.run_stream(prompt, **kwargs):
+                chunk = (
+                    update if isinstance(update, str) else str(getattr(update, "text", "") or "")
+                )
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            # Save what was received even if the consumer stopped early
+            if self.record and chunks:
+                self._save(prompt, "chunks", chunks)
@@ -0,0 +1,218 @@
+"""Unit tests for batch prompt execution."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from agent.agent import Agent
+from agent.cli import app
+from agent.cli.batch import BatchItem, _poll_until, load_batch_prompts, run_batch_prompts
+from tests.mocks import MockChatClient
+
+
+@pytest.fixture
+def batch_agent(mock_openai_settings):
+    """Agent with a mock chat client that echoes a fixed response."""
+    return Agent(settings=mock_openai_settings, chat_client=MockChatClient(response="Done"))
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestLoadBatchPrompts:
+    """Tests for load_batch_prompts."""
+
+    def test_loads_strings_and_objects(self, tmp_path):
+        """Test plain strings and objects with ids are both accepted."""
+        path = tmp_path / "prompts.jsonl"
+        path.write_text(
+            '"Say hello"\n\n' + json.dumps({"id": "bye", "prompt": "Say goodbye"}) + "\n"
+        )
+
+        items = load_batch_prompts(path)
+
+        assert [(i.custom_id, i.prompt) for i in items] == [
+            ("prompt-1", "Say hello"),
+            ("bye", "Say goodbye"),
+        ]
+
+    def test_plain_text_file_one_prompt_per_line(self, tmp_path):
+        """Test non-JSON files treat each non-empty line as a prompt."""
+        path = tmp_path / "prompts.txt"
+        path.write_text("Say hello\n\nSay goodbye\n")
+
+        items = load_batch_prompts(path)
+
+        assert [(i.custom_id, i.prompt) for i in items] == [
+            ("prompt-1", "Say hello"),
+            ("prompt-3", "Say goodbye"),
+        ]
+
+    def test_invalid_line_raises(self, tmp_path):
+        """Test invalid JSON reports the offending line."""
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('"ok"\nnot json\n')
+
+        with pytest.raises(ValueError, match=":2: invalid JSON"):
+            load_batch_prompts(path)
+
+    def test_duplicate_id_raises(self, tmp_path):
+        """Test repeated ids are rejected (results are matched by id)."""
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('{"id": "a", "prompt": "x"}\n{"id": "a", "prompt": "y"}\n')
+
+        with pytest.raises(ValueError, match="duplicate id"):
+            load_batch_prompts(path)
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestRunBatchPrompts:
+    """Tests for run_batch_prompts."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fallback(self, batch_agent):
+        """Test prompts run through Agent.run when the Batch API is disabled."""
+        items = [BatchItem("a", "one"), BatchItem("b", "two")]
+
+        await run_batch_prompts(batch_agent, items, use_batch_api=False)
+
+        assert [i.response for i in items] == ["Done", "Done"]
+        assert all(i.error is None for i in items)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, batch_agent):
+        """Test no more than max_concurrency prompts are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_run(prompt, thread=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return prompt
+
+        batch_agent.agent.run = slow_run
+        items = [BatchItem(str(n), f"p{n}") for n in range(6)]
+
+        await run_batch_prompts(batch_agent, items, use_batch_api=False, max_concurrency=2)
+
+        assert peak == 2
+        assert [i.response for i in items] == [f"p{n}" for n in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_batch_api_fails(self, batch_agent):
+        """Test a Batch API error falls back to concurrent Agent.run calls."""
+        failing = AsyncMock(side_effect=RuntimeError("batch disabled"))
+        items = [BatchItem("a", "one")]
+
+        with patch.dict("agent.cli.batch._PROVIDER_BATCH_RUNNERS", {"openai": failing}):
+            await run_batch_prompts(batch_agent, items, use_batch_api=True)
+
+        failing.assert_awaited_once()
+        assert items[0].response == "Done"
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_results_marked_as_errors(self, batch_agent):
+        """Test items the Batch API did not return are reported as errors."""
+
+        async def partial(agent, items, timeout):
+            items[0].response = "ok"
+
+        items = [BatchItem("a", "one"), BatchItem("b", "two")]
+
+        with patch.dict("agent.cli.batch._PROVIDER_BATCH_RUNNERS", {"openai": partial}):
+            await run_batch_prompts(batch_agent, items, use_batch_api=True)
+
+        assert items[0].response == "ok"
+        assert items[1].error == "No result returned by batch"
+
+    @pytest.mark.asyncio
+    async def test_poll_until_backs_off(self):
+        """Test polling sleeps with exponential backoff until done."""
+        statuses = iter(["in_progress", "in_progress", "completed"])
+        fetch = AsyncMock(side_effect=lambda: next(statuses))
+
+        with patch("agent.cli.batch.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await _poll_until(fetch, lambda s: s == "completed", "test", str)
+
+        assert result == "completed"
+        assert [call.args[0] for call in sleep.await_args_list] == [2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_poll_until_gives_up_after_timeout(self):
+        """Test polling raises TimeoutError naming the batch once the timeout passes."""
+        fetch = AsyncMock(return_value="in_progress")
+        clock = iter([0.0, 1.0, 3.0, 7.0])
+
+        with (
+            patch("agent.cli.batch.time.monotonic", side_effect=lambda: next(clock)),
+            patch("agent.cli.batch.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            with pytest.raises(TimeoutError, match="batch_1 still in_progress after 5s"):
+                await _poll_until(fetch, lambda s: False, "batch_1", str, timeout=5)
+
+        # Backs off 2s, then only the 2s left before the deadline
+        assert [call.args[0] for call in sleep.await_args_list] == [2.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_batch_api_is_opt_in(self, batch_agent):
+        """Test prompts run concurrently unless the Batch API is requested."""
+        runner = AsyncMock()
+        items = [BatchItem("a", "one")]
+
+        with patch.dict("agent.cli.batch._PROVIDER_BATCH_RUNNERS", {"openai": runner}):
+            await run_batch_prompts(batch_agent, items)
+
+        runner.assert_not_awaited()
+        assert items[0].response == "Done"
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_marks_items_without_rerunning(self, batch_agent):
+        """Test a timed-out batch is reported as errors, not re-run through the agent."""
+        runner = AsyncMock(side_effect=TimeoutError("OpenAI batch b1 still in_progress"))
+        items = [BatchItem("a", "one")]
+
+        with patch.dict("agent.cli.batch._PROVIDER_BATCH_RUNNERS", {"openai": runner}):
+            await run_batch_prompts(batch_agent, items, use_batch_api=True, batch_timeout=1)
+
+        runner.assert_awaited_once_with(batch_agent, items, 1)
+        assert items[0].response is None
+        assert items[0].error == "OpenAI batch b1 still in_progress"
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestBatchPromptFlag:
+    """Tests for selecting batch mode with -p @file."""
+
+    def test_existing_file_runs_batch(self, tmp_path):
+        """Test -p @path runs the file as a batch when it exists."""
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('"Say hello"\n')
+
+        with (
+            patch("agent.cli.batch.run_batch_file", new=AsyncMock()) as run_batch,
+            patch("agent.cli.execution.run_single_prompt", new=AsyncMock()) as run_single,
+        ):
+            result = CliRunner().invoke(app, ["-p", f"@{path}"])
+
+        assert result.exit_code == 0
+        assert run_batch.await_args.args[0] == path
+        run_single.assert_not_awaited()
+
+    def test_literal_at_prompt_runs_single_prompt(self):
+        """Test a prompt starting with @ that names no file is sent as a prompt."""
+        with (
+            patch("agent.cli.batch.run_batch_file", new=AsyncMock()) as run_batch,
+            patch("agent.cli.execution.run_single_prompt", new=AsyncMock()) as run_single,
+        ):
+            result = CliRunner().invoke(app, ["-p", "@alice what is 2+2"])
+
+        assert result.exit_code == 0
+        assert run_single.await_args.args[0] == "@alice what is 2+2"
+        run_batch.assert_not_awaited()
@@ -0,0 +1,43 @@
+"""Unit tests for agent.cli.display module."""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from agent.cache import ResponseCache
+from agent.cli.display import stream_quiet_mode
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestStreamQuietMode:
+    """Tests for stream_quiet_mode function."""
+
+    @pytest.mark.asyncio
+    async def test_streams_raw_text(self, agent_instance):
+        """Test streamed chunks are written verbatim, without Rich markup parsing."""
+        agent_instance.agent.response = "[bold]not markup[/bold]"
+        output = io.StringIO()
+
+        response = await stream_quiet_mode(
+            agent_instance, "test", None, Console(file=output, force_terminal=False)
+        )
+
+        assert response == "[bold]not markup[/bold] "
+        assert output.getvalue() == "[bold]not markup[/bold] \n"
+
+    @pytest.mark.asyncio
+    async def test_uses_run_when_response_cache_enabled(self, agent_instance):
+        """Test cached agents go through run() so the cache is consulted."""
+        agent_instance.agent.response = "Cached answer"
+        agent_instance.response_cache = ResponseCache()
+        output = io.StringIO()
+
+        response = await stream_quiet_mode(
+            agent_instance, "test", None, Console(file=output, force_terminal=False)
+        )
+
+        assert response == "Cached answer"
+        assert output.getvalue() == "Cached answer\n"
+        assert len(agent_instance.response_cache) == 1
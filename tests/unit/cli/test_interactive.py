@@ -0,0 +1,53 @@
+"""Unit tests for agent.cli.interactive helpers."""
+
+import pytest
+
+from agent.cli.interactive import _ensure_history_size_limit
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestEnsureHistorySizeLimit:
+    """Tests for _ensure_history_size_limit function."""
+
+    def test_missing_file_is_ignored(self, tmp_path):
+        """Test a missing history file is not created or reported."""
+        history_file = tmp_path / ".agent_history"
+
+        _ensure_history_size_limit(history_file, max_lines=10)
+
+        assert not history_file.exists()
+
+    def test_file_under_limit_unchanged(self, tmp_path):
+        """Test files with at most max_lines lines are left as-is."""
+        history_file = tmp_path / ".agent_history"
+        history_file.write_text("a\nb\nc\n")
+
+        _ensure_history_size_limit(history_file, max_lines=3)
+
+        assert history_file.read_text() == "a\nb\nc\n"
+
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    def test_keeps_last_lines(self, tmp_path, trailing_newline):
+        """Test rotation keeps exactly the last max_lines lines."""
+        history_file = tmp_path / ".agent_history"
+        content = "\n".join(f"line {n}" for n in range(100))
+        history_file.write_text(content + ("\n" if trailing_newline else ""))
+
+        # Small block size exercises the multi-block backward scan
+        _ensure_history_size_limit(history_file, max_lines=5, block_size=16)
+
+        lines = history_file.read_text().splitlines()
+        assert lines == [f"line {n}" for n in range(95, 100)]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_matches_readlines_semantics(self, tmp_path):
+        """Test result matches keeping readlines()[-max_lines:]."""
+        history_file = tmp_path / ".agent_history"
+        content = "\n# 2025-01-01\n+hello\n\n# 2025-01-02\n+multi\n+line\n"
+        history_file.write_text(content)
+        expected = "".join(content.splitlines(keepends=True)[-4:])
+
+        _ensure_history_size_limit(history_file, max_lines=4, block_size=8)
+
+        assert history_file.read_text() == expected
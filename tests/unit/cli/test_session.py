@@ -0,0 +1,99 @@
+"""Unit tests for agent.cli.session module."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent.cli.session import (
+    Conversation,
+    _format_time_ago,
+    _response_text,
+    track_conversation,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestFormatTimeAgo:
+    """Tests for _format_time_ago function."""
+
+    NOW = datetime(2025, 1, 10, 12, 0, 0)
+
+    @pytest.mark.parametrize(
+        "delta,expected",
+        [
+            (timedelta(days=3, hours=2), "3d ago"),
+            (timedelta(hours=5, minutes=10), "5h ago"),
+            (timedelta(minutes=42), "42m ago"),
+        ],
+    )
+    def test_relative_times(self, delta, expected):
+        """Test days, hours and minutes formatting."""
+        created = (self.NOW - delta).isoformat()
+        assert _format_time_ago(created, self.NOW) == expected
+
+    @pytest.mark.parametrize("created", ["", "not-a-date", "2025-01-10T11:00:00+00:00"])
+    def test_unparseable_or_incomparable(self, created):
+        """Test invalid and timezone-aware timestamps report unknown."""
+        assert _format_time_ago(created, self.NOW) == "unknown"
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestConversation:
+    """Tests for Conversation class and track_conversation."""
+
+    def test_response_text_dispatch(self):
+        """Test text extraction for str, typed .text and instance-only .text responses."""
+
+        class Typed:
+            text = "typed"
+
+        class InstanceOnly:
+            def __init__(self, text=None):
+                if text is not None:
+                    self.text = text
+
+            def __str__(self):
+                return "as str"
+
+        assert _response_text("plain") == "plain"
+        assert _response_text(Typed()) == "typed"
+        assert _response_text(Typed()) == "typed"  # cached extractor
+        assert _response_text(InstanceOnly("instance")) == "instance"
+        assert _response_text(InstanceOnly()) == "as str"
+
+    def test_track_conversation_round_trip(self):
+        """Test tracked turns convert to persisted message dicts in order."""
+
+        class Response:
+            text = "Hi there"
+
+        conversation = Conversation()
+        track_conversation(conversation, "Hello", "Hello back")
+        track_conversation(conversation, "Again", Response())
+
+        assert len(conversation) == 4
+        assert conversation.to_messages() == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hello back"},
+            {"role": "user", "content": "Again"},
+            {"role": "assistant", "content": "Hi there"},
+        ]
+
+    def test_empty_and_clear(self):
+        """Test empty conversations are falsy and clear() empties both arrays."""
+        conversation = Conversation()
+        assert not conversation
+
+        conversation.append("user", "Hello")
+        assert conversation
+
+        conversation.clear()
+        assert not conversation
+        assert conversation.to_messages() == []
+
+    def test_unknown_role_rejected(self):
+        """Test roles outside user/assistant raise ValueError."""
+        with pytest.raises(ValueError):
+            Conversation().append("system", "nope")
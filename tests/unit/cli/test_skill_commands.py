@@ -0,0 +1,191 @@
+"""Tests for CLI skill commands."""
+
+import os
+from importlib import resources
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from agent.cli.skill_commands import _get_repo_paths, enable_skill, install_skill, show_skills
+from agent.config.schema import AgentSettings, PluginSkillSource
+from agent.skills.manifest import SkillRegistryEntry
+
+
+def _entry(name: str) -> SkillRegistryEntry:
+    """Registry entry for a skill installed under /skills."""
+    return SkillRegistryEntry(
+        name=name,
+        name_canonical=name.lower().replace("_", "-"),
+        git_url="https://github.com/example/skills.git",
+        installed_path=Path("/skills") / name,
+        trusted=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def bundled_skill_tree(tmp_path_factory):
+    """Bundled skills directory with alpha and beta skills (read-only, shared)."""
+    root = tmp_path_factory.mktemp("bundled")
+    for name in ("alpha", "beta"):
+        (root / name).mkdir()
+        (root / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: test\n---\nInstructions\n"
+        )
+    return root
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestInstallSkill:
+    """Tests for install_skill config merging."""
+
+    def _install(self, settings, entries):
+        manager = MagicMock()
+        manager.install.return_value = entries
+        with (
+            patch("agent.cli.skill_commands.console"),
+            patch("agent.config.manager.load_config", return_value=settings),
+            patch("agent.config.manager.save_config") as save,
+            patch("agent.skills.manager.SkillManager", return_value=manager),
+        ):
+            install_skill("https://github.com/example/skills.git", branch="dev")
+        return save
+
+    def test_monorepo_merges_existing_and_new_plugins(self):
+        """Test existing plugins are updated in place and new ones appended once."""
+        settings = AgentSettings()
+        existing = PluginSkillSource(
+            name="Skill_A", git_url="https://old.example/a.git", enabled=False
+        )
+        settings.skills.plugins = [existing]
+
+        save = self._install(settings, [_entry("skill-a"), _entry("skill-b"), _entry("skill_b")])
+
+        assert [p.name for p in settings.skills.plugins] == ["Skill_A", "skill-b"]
+        assert existing.enabled is True
+        assert existing.branch == "dev"
+        assert existing.git_url == "https://github.com/example/skills.git"
+        assert settings.skills.plugins[1].installed_path == str(Path("/skills") / "skill_b")
+        save.assert_called_once_with(settings, None)
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestEnableSkill:
+    """Tests for enable_skill config writes."""
+
+    def test_already_enabled_plugin_does_not_save(self):
+        """Test enabling an enabled plugin leaves the config file untouched."""
+        settings = AgentSettings()
+        settings.skills.plugins = [
+            PluginSkillSource(name="skill-a", git_url="https://example.com/a.git", enabled=True)
+        ]
+
+        with (
+            patch("agent.cli.skill_commands.console"),
+            patch("agent.config.manager.load_config", return_value=settings),
+            patch("agent.config.manager.save_config") as save,
+        ):
+            enable_skill("skill-a")
+
+        save.assert_not_called()
+
+    def test_disabled_plugin_is_saved_once(self):
+        """Test enabling a disabled plugin writes the config once."""
+        settings = AgentSettings()
+        plugin = PluginSkillSource(name="skill-a", git_url="https://example.com/a.git")
+        plugin.enabled = False
+        settings.skills.plugins = [plugin]
+
+        with (
+            patch("agent.cli.skill_commands.console"),
+            patch("agent.config.manager.load_config", return_value=settings),
+            patch("agent.config.manager.save_config") as save,
+        ):
+            enable_skill("skill-a")
+
+        assert plugin.enabled is True
+        save.assert_called_once_with(settings, None)
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestShowSkills:
+    """Tests for show_skills output."""
+
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch):
+        """Capture console output and stub load_config for every test."""
+        self.output = StringIO()
+        self.load_config = MagicMock()
+        monkeypatch.setattr(
+            "agent.cli.skill_commands.console", Console(file=self.output, width=200)
+        )
+        monkeypatch.setattr("agent.cli.skill_commands.load_config", self.load_config)
+
+    def _show(self, settings):
+        self.load_config.return_value = settings
+        show_skills()
+        return self.output.getvalue()
+
+    def test_lists_bundled_skills_with_state(self, bundled_skill_tree):
+        """Test each bundled skill is printed with its enabled state."""
+        settings = AgentSettings()
+        settings.skills.bundled_dir = str(bundled_skill_tree)
+        settings.skills.disabled_bundled = ["beta"]
+
+        output = self._show(settings)
+
+        assert output.startswith("\nBundled:\n")
+        assert "◉ alpha" in output
+        assert "○ beta" in output
+        assert f"({bundled_skill_tree.name}{os.sep}alpha)" in output
+        assert "Plugins: None installed" in output
+
+    def test_no_bundled_skills(self, tmp_path):
+        """Test an empty bundled directory is reported on the header line."""
+        settings = AgentSettings()
+        settings.skills.bundled_dir = str(tmp_path)
+        settings.skills.plugins = [
+            PluginSkillSource(name="skill-a", git_url="https://example.com/a.git")
+        ]
+
+        with patch("agent.skills.registry.SkillRegistry"):
+            output = self._show(settings)
+
+        assert "Bundled: None found" in output
+        assert "skill-a" in output
+
+    def test_no_skills_at_all(self, tmp_path):
+        """Test a single message is printed when there is nothing to list."""
+        settings = AgentSettings()
+        settings.skills.bundled_dir = str(tmp_path / "missing")
+
+        output = self._show(settings)
+
+        assert "No skills found" in output
+        assert "Bundled" not in output
+        assert "Plugins" not in output
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestGetRepoPaths:
+    """Tests for bundled skills path detection."""
+
+    def test_paths_are_resolved_once(self):
+        """Test the package lookup runs once and later calls reuse the result."""
+        _get_repo_paths.cache_clear()
+        try:
+            with patch("agent.cli.skill_commands.resources.files", wraps=resources.files) as files:
+                first = _get_repo_paths()
+                second = _get_repo_paths()
+        finally:
+            _get_repo_paths.cache_clear()
+
+        assert first == second
+        assert first[1].endswith("_bundled_skills")
+        files.assert_called_once_with("agent")
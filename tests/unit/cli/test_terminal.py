@@ -0,0 +1,100 @@
+"""Unit tests for terminal utilities."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from agent.utils import terminal
+from agent.utils.terminal import TIMEOUT_EXIT_CODE, PersistentShell, run_shell_command
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="PersistentShell requires bash")
+
+
+@pytest.fixture
+def shell(tmp_path):
+    """Persistent shell started in a temporary directory."""
+    shell = PersistentShell(cwd=str(tmp_path))
+    yield shell
+    shell.close()
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestPersistentShell:
+    """Tests for PersistentShell."""
+
+    def test_captures_output_and_exit_code(self, shell):
+        """Test stdout, stderr and exit code are returned separately."""
+        assert shell.run("echo out; echo err >&2; exit_code=3; (exit $exit_code)") == (
+            3,
+            "out\n",
+            "err\n",
+        )
+
+    def test_output_without_trailing_newline(self, shell):
+        """Test the sentinel is stripped when output does not end in a newline."""
+        assert shell.run("printf abc") == (0, "abc", "")
+
+    def test_state_persists_between_commands(self, shell, tmp_path):
+        """Test cd and export carry over to later commands."""
+        (tmp_path / "sub").mkdir()
+
+        shell.run("cd sub && export GREETING=hi")
+
+        assert shell.run('pwd; echo "$GREETING"') == (0, f"{tmp_path / 'sub'}\nhi\n", "")
+
+    def test_syntax_error_does_not_break_shell(self, shell):
+        """Test an unbalanced quote fails the command but not the shell."""
+        exit_code, _, stderr = shell.run('echo "unbalanced')
+
+        assert exit_code != 0
+        assert stderr
+        assert shell.run("echo ok") == (0, "ok\n", "")
+
+    def test_timeout_restarts_shell(self, shell):
+        """Test a timed out command is killed and the next command still runs."""
+        assert shell.run("sleep 5", timeout=1) == (
+            TIMEOUT_EXIT_CODE,
+            "",
+            "Command timed out after 1s",
+        )
+        assert shell.run("echo ok") == (0, "ok\n", "")
+
+    def test_exit_restarts_shell(self, shell):
+        """Test `exit` reports its status and a fresh shell handles the next command."""
+        assert shell.run("exit 4") == (4, "", "")
+        assert shell.run("echo ok") == (0, "ok\n", "")
+
+    def test_interrupt_restarts_shell(self, shell):
+        """Test an interrupted command is killed and does not leak into the next one."""
+        with patch("agent.utils.terminal.selectors.DefaultSelector.select") as select:
+            select.side_effect = KeyboardInterrupt
+            with pytest.raises(KeyboardInterrupt):
+                shell.run("sleep 2; echo leaked")
+
+        assert shell.run("echo ok", timeout=1) == (0, "ok\n", "")
+
+    def test_start_failure_raises(self, tmp_path):
+        """Test run() raises OSError when bash cannot be started."""
+        shell = PersistentShell(cwd=str(tmp_path / "missing"))
+
+        with pytest.raises(OSError):
+            shell.run("echo ok")
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestRunShellCommand:
+    """Tests for run_shell_command."""
+
+    def test_falls_back_when_shell_unavailable(self, monkeypatch, tmp_path):
+        """Test commands run through a subprocess when the persistent shell cannot start."""
+        monkeypatch.setattr(terminal, "_shared_shell", PersistentShell(cwd=str(tmp_path / "x")))
+
+        with patch.object(
+            terminal, "execute_shell_command", return_value=(0, "ok\n", "")
+        ) as fallback:
+            assert run_shell_command("echo ok") == (0, "ok\n", "")
+
+        fallback.assert_called_once_with("echo ok", timeout=30)
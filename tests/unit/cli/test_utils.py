@@ -1,12 +1,13 @@
 """Unit tests for agent.cli.utils module."""
 
+import io
 import os
 from unittest.mock import patch
 
 import pytest
 from rich.console import Console
 
-from agent.cli.utils import get_console
+from agent.cli.utils import CoalescingWriter, get_console
 
 
 @pytest.mark.unit
@@ -130,3 +131,40 @@ class TestGetConsole:
                 del os.environ["PYTHONIOENCODING"]
             if original_env:
                 os.environ["PYTHONIOENCODING"] = original_env
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+class TestCoalescingWriter:
+    """Tests for CoalescingWriter class."""
+
+    def test_small_chunks_are_buffered(self):
+        """Test chunks below the size threshold are held until flush."""
+        stream = io.StringIO()
+        writer = CoalescingWriter(stream, flush_interval=60, flush_size=64)
+
+        writer.write("Hello ")
+        writer.write("world")
+        assert stream.getvalue() == ""
+
+        writer.flush()
+        assert stream.getvalue() == "Hello world"
+
+    def test_size_threshold_writes_out(self):
+        """Test buffered text is written once the size threshold is reached."""
+        stream = io.StringIO()
+        writer = CoalescingWriter(stream, flush_interval=60, flush_size=8)
+
+        writer.write("abcd")
+        writer.write("efgh")
+
+        assert stream.getvalue() == "abcdefgh"
+
+    def test_interval_threshold_writes_out(self):
+        """Test buffered text is written once the flush interval has passed."""
+        stream = io.StringIO()
+        writer = CoalescingWriter(stream, flush_interval=0, flush_size=1024)
+
+        writer.write("a")
+
+        assert stream.getvalue() == "a"
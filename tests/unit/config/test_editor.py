@@ -0,0 +1,112 @@
+"""Unit tests for editor integration."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent.config.editor import EditorError, _find_common_editor, detect_editor, open_in_editor
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Existing configuration file to open."""
+    path = tmp_path / "settings.json"
+    path.write_text("{}")
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestOpenInEditor:
+    """Test open_in_editor function."""
+
+    def test_vscode_without_wait_does_not_block(self, config_file):
+        """Test VSCode is launched in the background when wait=False."""
+        with (
+            patch("agent.config.editor.detect_editor", return_value="code"),
+            patch("agent.config.editor.subprocess.Popen") as mock_popen,
+            patch("agent.config.editor.subprocess.run") as mock_run,
+        ):
+            assert open_in_editor(config_file, wait=False) is True
+
+        mock_run.assert_not_called()
+        assert mock_popen.call_args.args[0] == ["code", str(config_file)]
+
+    def test_vscode_with_wait_passes_wait_flag(self, config_file):
+        """Test VSCode runs with --wait in the foreground when wait=True."""
+        with (
+            patch("agent.config.editor.detect_editor", return_value="code"),
+            patch(
+                "agent.config.editor.subprocess.run", return_value=MagicMock(returncode=0)
+            ) as mock_run,
+        ):
+            assert open_in_editor(config_file) is True
+
+        mock_run.assert_called_once_with(["code", "--wait", str(config_file)], check=True)
+
+    def test_terminal_editor_always_runs_in_foreground(self, config_file):
+        """Test terminal editors are waited on even when wait=False."""
+        with (
+            patch("agent.config.editor.detect_editor", return_value="vim"),
+            patch("agent.config.editor.subprocess.Popen") as mock_popen,
+            patch(
+                "agent.config.editor.subprocess.run", return_value=MagicMock(returncode=0)
+            ) as mock_run,
+        ):
+            assert open_in_editor(config_file, wait=False) is True
+
+        mock_popen.assert_not_called()
+        mock_run.assert_called_once_with(["vim", str(config_file)], check=True)
+
+    def test_editor_failure_raises_editor_error(self, config_file):
+        """Test a failing editor is reported as EditorError."""
+        with (
+            patch("agent.config.editor.detect_editor", return_value="vim"),
+            patch(
+                "agent.config.editor.subprocess.run",
+                side_effect=subprocess.CalledProcessError(1, "vim"),
+            ),
+        ):
+            with pytest.raises(EditorError, match="Failed to open editor 'vim'"):
+                open_in_editor(config_file)
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestDetectEditor:
+    """Test detect_editor function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_editor_cache(self, monkeypatch):
+        """Start each test with no EDITOR/VISUAL and an empty PATH scan cache."""
+        monkeypatch.delenv("EDITOR", raising=False)
+        monkeypatch.delenv("VISUAL", raising=False)
+        _find_common_editor.cache_clear()
+        yield
+        _find_common_editor.cache_clear()
+
+    def test_editor_env_skips_path_scan(self, monkeypatch):
+        """Test EDITOR is returned without searching PATH."""
+        monkeypatch.setenv("EDITOR", "emacs")
+
+        with patch("agent.config.editor.shutil.which") as mock_which:
+            assert detect_editor() == "emacs"
+
+        mock_which.assert_not_called()
+
+    def test_path_scan_is_cached(self, monkeypatch):
+        """Test PATH is searched once until PATH changes."""
+        monkeypatch.setenv("PATH", "/usr/bin")
+
+        with patch(
+            "agent.config.editor.shutil.which",
+            side_effect=lambda name, path=None: name == "nano",
+        ) as mock_which:
+            assert detect_editor() == "nano"
+            assert detect_editor() == "nano"
+            assert mock_which.call_count == 3  # code, vim, nano
+
+            monkeypatch.setenv("PATH", "/opt/bin")
+            assert detect_editor() == "nano"
+            assert mock_which.call_count == 6
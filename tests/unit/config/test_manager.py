@@ -3,13 +3,15 @@
 import json
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from agent.config.manager import (
     ConfigurationError,
+    _load_dotenv_cached,
     deep_merge,
+    edit_config,
     get_config_path,
     load_config,
     merge_with_env,
@@ -71,6 +73,19 @@ class TestLoadConfig:
             load_config(config_path)
         assert "Invalid JSON" in str(exc_info.value)
 
+    def test_load_uses_orjson_when_installed(self, tmp_path, monkeypatch):
+        """Test the raw file bytes are parsed with orjson when it is available."""
+        config_path = tmp_path / "settings.json"
+        config_path.write_text('{"providers": {"enabled": ["openai"]}}')
+        fast_json = MagicMock()
+        fast_json.loads.side_effect = json.loads
+        monkeypatch.setattr("agent.utils.serialization.orjson", fast_json)
+
+        settings = load_config(config_path)
+
+        fast_json.loads.assert_called_once_with(config_path.read_bytes())
+        assert settings.providers.enabled == ["openai"]
+
     def test_load_invalid_schema_raises_error(self, tmp_path):
         """Test loading JSON with invalid schema raises ConfigurationError."""
         config_path = tmp_path / "invalid_schema.json"
@@ -88,6 +103,45 @@ class TestLoadConfig:
             load_config(config_path)
         assert "validation failed" in str(exc_info.value).lower()
 
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the validated settings."""
+        config_path = tmp_path / "settings.json"
+        save_config(AgentSettings(providers={"enabled": ["openai"]}), config_path)
+
+        first = load_config(config_path)
+        with patch("agent.config.manager.json_loads") as mock_load:
+            second = load_config(config_path)
+
+        mock_load.assert_not_called()
+        assert second.providers.enabled == ["openai"]
+        # Each caller gets its own copy to mutate
+        assert second is not first
+        second.providers.enabled.append("anthropic")
+        assert load_config(config_path).providers.enabled == ["openai"]
+
+    def test_relative_and_absolute_paths_share_cache(self, tmp_path, monkeypatch):
+        """Test the same file loaded through a relative path reuses the cached settings."""
+        config_path = tmp_path / "settings.json"
+        save_config(AgentSettings(providers={"enabled": ["openai"]}), config_path)
+        load_config(config_path)
+        monkeypatch.chdir(tmp_path)
+
+        with patch("agent.config.manager.json_loads") as mock_load:
+            settings = load_config(Path("settings.json"))
+
+        mock_load.assert_not_called()
+        assert settings.providers.enabled == ["openai"]
+
+    def test_save_config_invalidates_cache(self, tmp_path):
+        """Test a saved configuration is visible to the next load."""
+        config_path = tmp_path / "settings.json"
+        save_config(AgentSettings(providers={"enabled": ["openai"]}), config_path)
+        load_config(config_path)
+
+        save_config(AgentSettings(providers={"enabled": ["anthropic"]}), config_path)
+
+        assert load_config(config_path).providers.enabled == ["anthropic"]
+
 
 class TestSaveConfig:
     """Test save_config function."""
@@ -146,6 +200,41 @@ class TestSaveConfig:
         assert loaded.telemetry.enabled is True
 
 
+class TestEditConfig:
+    """Test edit_config context manager."""
+
+    def test_saves_changed_settings(self, tmp_path):
+        """Test modifications made inside the block are written on exit."""
+        config_path = tmp_path / "settings.json"
+
+        with edit_config(config_path) as settings:
+            settings.providers.enabled = ["anthropic"]
+
+        assert load_config(config_path).providers.enabled == ["anthropic"]
+
+    def test_unchanged_settings_are_not_saved(self, tmp_path):
+        """Test a block that changes nothing does not rewrite the file."""
+        config_path = tmp_path / "settings.json"
+        save_config(AgentSettings(providers={"enabled": ["openai"]}), config_path)
+
+        with patch("agent.config.manager.save_config") as mock_save:
+            with edit_config(config_path) as settings:
+                settings.providers.enabled = ["openai"]
+
+        mock_save.assert_not_called()
+
+    def test_exception_discards_changes(self, tmp_path):
+        """Test nothing is saved when the block raises."""
+        config_path = tmp_path / "settings.json"
+
+        with pytest.raises(RuntimeError):
+            with edit_config(config_path) as settings:
+                settings.providers.enabled = ["anthropic"]
+                raise RuntimeError("boom")
+
+        assert not config_path.exists()
+
+
 class TestMergeWithEnv:
     """Test merge_with_env function."""
 
@@ -232,6 +321,64 @@ class TestMergeWithEnv:
         assert overrides["memory"]["mem0"]["org_id"] == "org-123"
         assert overrides["memory"]["mem0"]["user_id"] == "user-456"
 
+    def test_agent_model_applies_to_selected_provider(self):
+        """Test AGENT_MODEL overrides the LLM_PROVIDER model, after LOCAL_MODEL."""
+        settings = AgentSettings()
+        env_vars = {
+            "LLM_PROVIDER": "local",
+            "LOCAL_MODEL": "local-model",
+            "AGENT_MODEL": "agent-model",
+            "GEMINI_USE_VERTEXAI": "TRUE",
+            "MEMORY_HISTORY_LIMIT": "not-a-number",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            overrides = merge_with_env(settings)
+
+        assert overrides["providers"]["enabled"][0] == "local"
+        assert overrides["providers"]["local"]["model"] == "agent-model"
+        assert "openai" not in overrides["providers"]
+        assert overrides["providers"]["gemini"]["use_vertexai"] is True
+        assert overrides["memory"]["history_limit"] == 20
+
+    def test_agent_model_ignored_for_providers_without_override(self):
+        """Test AGENT_MODEL is not applied to providers like azure."""
+        settings = AgentSettings()
+        with patch.dict(os.environ, {"LLM_PROVIDER": "azure", "AGENT_MODEL": "x"}, clear=True):
+            overrides = merge_with_env(settings)
+
+        assert "azure" not in overrides["providers"]
+
+
+class TestLoadDotenvCached:
+    """Test _load_dotenv_cached function."""
+
+    def test_unchanged_env_file_is_loaded_once(self, tmp_path):
+        """Test the .env file is parsed again only after it changes."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("AGENT_TEST_DOTENV=1\n")
+
+        with (
+            patch("dotenv.find_dotenv", return_value=str(env_file)),
+            patch("dotenv.load_dotenv") as mock_load,
+        ):
+            _load_dotenv_cached()
+            _load_dotenv_cached()
+            assert mock_load.call_count == 1
+
+            os.utime(env_file, ns=(0, 0))
+            _load_dotenv_cached()
+            assert mock_load.call_count == 2
+
+    def test_missing_env_file_skips_load(self):
+        """Test nothing is loaded when no .env file is found."""
+        with (
+            patch("dotenv.find_dotenv", return_value=""),
+            patch("dotenv.load_dotenv") as mock_load,
+        ):
+            _load_dotenv_cached()
+
+        mock_load.assert_not_called()
+
 
 class TestValidateConfig:
     """Test validate_config function."""
@@ -0,0 +1,105 @@
+"""Unit tests for provider setup implementations."""
+
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from agent.config.providers import PROVIDER_REGISTRY
+
+
+@pytest.fixture
+def console():
+    """Console writing to a buffer."""
+    return Console(file=StringIO(), width=120)
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestPromptUserUsesDetected:
+    """prompt_user reuses detect_credentials() results instead of re-reading the environment."""
+
+    def test_azure_detected_config_skips_prompts(self, console):
+        """Test detected Azure endpoint and deployment are used as-is."""
+        detected = {"endpoint": "https://example.openai.azure.com", "deployment": "gpt-4o"}
+
+        with patch.dict(os.environ, {}, clear=True), patch("rich.prompt.Prompt.ask") as ask:
+            result = PROVIDER_REGISTRY["azure"].prompt_user(console, detected)
+
+        ask.assert_not_called()
+        assert result == {**detected, "enabled": True}
+        assert "Found Azure OpenAI config in environment" in console.file.getvalue()
+
+    @pytest.mark.parametrize("provider", ["openai", "anthropic"])
+    def test_detected_api_key_is_reported_and_used(self, console, provider):
+        """Test a detected API key is shown as found and not prompted for."""
+        detected = {"api_key": "sk-test", "model": "model-x"}
+
+        with patch.dict(os.environ, {}, clear=True), patch("rich.prompt.Prompt.ask") as ask:
+            result = PROVIDER_REGISTRY[provider].prompt_user(console, detected)
+
+        ask.assert_not_called()
+        assert result == {"api_key": "sk-test", "model": "model-x", "enabled": True}
+        assert "_API_KEY in environment" in console.file.getvalue()
+
+    def test_foundry_detected_config_skips_prompts(self, console):
+        """Test detected Foundry endpoint and deployment are used as-is."""
+        detected = {"project_endpoint": "https://example.ai.azure.com", "model_deployment": "gpt"}
+
+        with patch.dict(os.environ, {}, clear=True), patch("rich.prompt.Prompt.ask") as ask:
+            result = PROVIDER_REGISTRY["foundry"].prompt_user(console, detected)
+
+        ask.assert_not_called()
+        assert result == {**detected, "enabled": True}
+
+    def test_gemini_detected_vertex_config_is_used(self, console):
+        """Test detected Vertex AI settings skip the API-key/Vertex questions."""
+        detected = {"use_vertexai": True, "project_id": "my-project", "location": "europe-west4"}
+
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("rich.prompt.Prompt.ask", return_value="gemini-pro") as ask,
+            patch("rich.prompt.Confirm.ask") as confirm,
+        ):
+            result = PROVIDER_REGISTRY["gemini"].prompt_user(console, detected)
+
+        confirm.assert_not_called()
+        ask.assert_called_once()  # Model only
+        assert result == {**detected, "model": "gemini-pro", "enabled": True}
+
+    def test_github_detected_token_skips_gh_cli_check(self, console):
+        """Test a detected GITHUB_TOKEN is used without probing the gh CLI."""
+        detected = {"token": "ghp_test", "model": "gpt-4o-mini"}
+
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("rich.prompt.Confirm.ask", return_value=False),
+            patch("agent.config.providers.github.shutil.which") as which,
+        ):
+            result = PROVIDER_REGISTRY["github"].prompt_user(console, detected)
+
+        which.assert_not_called()
+        assert result["token"] == "ghp_test"
+        assert "Found GITHUB_TOKEN in environment" in console.file.getvalue()
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestConfigure:
+    """configure() is shared by all providers through ProviderSetupBase."""
+
+    @pytest.mark.parametrize("provider", sorted(PROVIDER_REGISTRY))
+    def test_configure_prompts_with_detected_credentials(self, console, provider):
+        """Test configure passes detect_credentials() output to prompt_user()."""
+        setup = PROVIDER_REGISTRY[provider]
+        detected = {"api_key": "sk-test"}
+
+        with (
+            patch.object(type(setup), "detect_credentials", return_value=detected),
+            patch.object(type(setup), "prompt_user", return_value={"enabled": True}) as prompt,
+        ):
+            assert setup.configure(console) == {"enabled": True}
+
+        prompt.assert_called_once_with(console, detected)
@@ -15,7 +15,7 @@ from unittest.mock import patch
 import pytest
 
 from agent.config import load_config
-from agent.config.schema import AgentSettings
+from agent.config.schema import AgentSettings, PluginSkillSource, SkillsConfig
 
 
 @pytest.mark.unit
@@ -136,6 +136,33 @@ class TestSkillsConfiguration:
         assert isinstance(settings.skills.user_dir, str)
 
 
+@pytest.mark.unit
+@pytest.mark.config
+class TestPluginsByCanonical:
+    """Test SkillsConfig.plugins_by_canonical index."""
+
+    def test_indexes_by_canonical_name(self):
+        """Test plugins are keyed by normalized name and the first duplicate wins."""
+        first = PluginSkillSource(name="My_Skill", git_url="https://example.com/a.git")
+        duplicate = PluginSkillSource(name="my-skill", git_url="https://example.com/b.git")
+        other = PluginSkillSource(name="other", git_url="https://example.com/c.git")
+        skills = SkillsConfig(plugins=[first, duplicate, other])
+
+        index = skills.plugins_by_canonical()
+
+        assert index == {"my-skill": first, "other": other}
+
+    def test_reflects_list_mutation(self):
+        """Test plugins appended after a previous call are indexed."""
+        skills = SkillsConfig()
+        assert skills.plugins_by_canonical() == {}
+
+        plugin = PluginSkillSource(name="new-skill", git_url="https://example.com/a.git")
+        skills.plugins.append(plugin)
+
+        assert skills.plugins_by_canonical() == {"new-skill": plugin}
+
+
 @pytest.mark.unit
 @pytest.mark.config
 class TestSkillsConfigIntegration:
@@ -1,5 +1,8 @@
 """Unit tests for agent.agent module."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from agent.agent import Agent
@@ -82,9 +85,80 @@ class TestAgent:
         async for chunk in agent_instance.run_stream("Say hello"):
             chunks.append(chunk)
 
-        # MockAgent splits response by words
-        assert len(chunks) == 3  # "Hello", "from", "mock!"
-        assert "".join(chunks) == "Hello from mock! "
+        # MockAgent yields all words at once, so they arrive as one batch
+        assert chunks == ["Hello from mock! "]
+
+    @pytest.mark.asyncio
+    async def test_agent_run_stream_yields_chunks_as_they_arrive(self, agent_instance):
+        """Test chunks are not held back waiting for a full batch."""
+
+        async def slow_stream(prompt, **kwargs):
+            for word in ("Hello ", "there"):
+                await asyncio.sleep(0.01)
+                yield word
+
+        agent_instance.agent.run_stream = slow_stream
+
+        chunks = [chunk async for chunk in agent_instance.run_stream("Say hello")]
+
+        assert chunks == ["Hello ", "there"]
+
+    @pytest.mark.asyncio
+    async def test_agent_run_stream_batches_fast_chunks(self, agent_instance):
+        """Test buffered chunks are joined into batches of at most STREAM_MAX_BATCH."""
+        from agent.agent import STREAM_MAX_BATCH
+
+        async def fast_stream(prompt, **kwargs):
+            for _ in range(STREAM_MAX_BATCH + 1):
+                yield "x"
+
+        agent_instance.agent.run_stream = fast_stream
+
+        chunks = [chunk async for chunk in agent_instance.run_stream("Say hello")]
+
+        assert chunks == ["x" * STREAM_MAX_BATCH, "x"]
+
+    @pytest.mark.asyncio
+    async def test_agent_run_stream_propagates_errors(self, agent_instance):
+        """Test an error in the underlying stream reaches the consumer."""
+
+        async def failing_stream(prompt, **kwargs):
+            yield "partial"
+            raise RuntimeError("stream broke")
+
+        agent_instance.agent.run_stream = failing_stream
+
+        chunks = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for chunk in agent_instance.run_stream("Say hello"):
+                chunks.append(chunk)
+
+        assert chunks == ["partial"]
+
+    @pytest.mark.asyncio
+    async def test_agent_run_stream_early_break_cleans_up(self, agent_instance):
+        """Test stopping early closes the upstream stream and leaves no pending tasks."""
+        closed = False
+
+        async def long_stream(prompt, **kwargs):
+            nonlocal closed
+            try:
+                for _ in range(1000):
+                    yield "x"
+            finally:
+                closed = True
+
+        agent_instance.agent.run_stream = long_stream
+
+        stream = agent_instance.run_stream("Say hello")
+        async for _ in stream:
+            # Let the producer fill the queue before stopping
+            await asyncio.sleep(0.01)
+            break
+        await stream.aclose()
+
+        assert closed
+        assert asyncio.all_tasks() == {asyncio.current_task()}
 
     def test_agent_config_defaults_to_from_env(self, mock_chat_client, mock_settings):
         """Test Agent loads config from env if not provided."""
@@ -107,6 +181,49 @@ class TestAgent:
         with pytest.raises(ValueError, match="Unknown provider: invalid_provider"):
             Agent(settings=config)
 
+    def test_chat_client_reused_for_identical_settings(self, mock_settings):
+        """Test Agents with identical provider settings share one chat client."""
+        first = Agent(settings=mock_settings)
+        second = Agent(settings=mock_settings.model_copy(deep=True))
+
+        assert first.chat_client is second.chat_client
+
+    def test_chat_client_rebuilt_when_settings_change(self, mock_settings):
+        """Test changing provider settings produces a new chat client."""
+        first = Agent(settings=mock_settings)
+
+        other_settings = mock_settings.model_copy(deep=True)
+        other_settings.providers.openai.model = "gpt-4o"
+        second = Agent(settings=other_settings)
+
+        assert first.chat_client is not second.chat_client
+
+    def test_clear_chat_client_cache(self, mock_settings):
+        """Test clearing the cache forces a new chat client."""
+        from agent.agent import clear_chat_client_cache
+
+        first = Agent(settings=mock_settings)
+        clear_chat_client_cache()
+        second = Agent(settings=mock_settings)
+
+        assert first.chat_client is not second.chat_client
+
+    def test_openai_client_uses_shared_http_pool(self, mock_openai_settings):
+        """Test OpenAI chat client is built on the shared HTTP connection pool."""
+        from agent.utils.http import get_shared_http_client
+
+        agent = Agent(settings=mock_openai_settings)
+
+        assert agent.chat_client.client._client is get_shared_http_client()
+
+    def test_anthropic_client_uses_shared_http_pool(self, mock_anthropic_settings):
+        """Test Anthropic chat client is built on the shared HTTP connection pool."""
+        from agent.utils.http import get_shared_http_client
+
+        agent = Agent(settings=mock_anthropic_settings)
+
+        assert agent.chat_client.anthropic_client._client is get_shared_http_client()
+
     def test_agent_has_agent_attribute(self, agent_instance):
         """Test Agent has agent attribute after initialization."""
         assert hasattr(agent_instance, "agent")
@@ -154,6 +271,64 @@ class TestAgent:
         assert result == "Response from object"
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_run_many_preserves_order_and_bounds_concurrency(self, agent_instance):
+        """Test run_many returns responses in prompt order with limited concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_run(prompt, thread=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return prompt.upper()
+
+        agent_instance.agent.run = mock_run
+
+        results = await agent_instance.run_many(["a", "b", "c", "d", "e"], max_concurrency=2)
+
+        assert results == ["A", "B", "C", "D", "E"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_many_shrinks_to_rate_limit_budget(self, agent_instance):
+        """Test run_many serializes requests when the provider reports a low budget."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_run(prompt, thread=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return prompt
+
+        agent_instance.agent.run = mock_run
+
+        with patch("agent.utils.http.get_rate_limit_remaining", return_value=1):
+            await agent_instance.run_many(["a", "b", "c"], max_concurrency=10)
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_run_many_return_exceptions(self, agent_instance):
+        """Test run_many can return failures in place instead of raising."""
+
+        async def mock_run(prompt, thread=None):
+            if prompt == "bad":
+                raise RuntimeError("boom")
+            return prompt
+
+        agent_instance.agent.run = mock_run
+
+        results = await agent_instance.run_many(["ok", "bad"], return_exceptions=True)
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+
 
 @pytest.mark.unit
 @pytest.mark.agent
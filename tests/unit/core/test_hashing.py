@@ -0,0 +1,33 @@
+"""Unit tests for cache key hashing."""
+
+import pytest
+
+from agent.hashing import CACHE_KEY_SIZE, SHA256_MIN_INPUT, cache_key
+
+
+@pytest.mark.unit
+@pytest.mark.agent
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_deterministic_fixed_size(self):
+        """Test identical inputs give the same fixed-size key."""
+        assert cache_key("hello", "system") == cache_key("hello", "system")
+        assert len(cache_key("hello")) == CACHE_KEY_SIZE
+
+    def test_part_boundaries_matter(self):
+        """Test parts are length-prefixed rather than concatenated."""
+        assert cache_key("ab", "c") != cache_key("a", "bc")
+
+    def test_key_namespaces_digest(self):
+        """Test the same parts under different keys do not collide."""
+        assert cache_key("hello", key="model-a") != cache_key("hello", key="model-b")
+        assert cache_key("hello", key="model-a") != cache_key("model-a", "hello")
+
+    def test_long_inputs(self):
+        """Test inputs above the SHA-256 threshold still produce distinct fixed-size keys."""
+        long_prompt = "x" * SHA256_MIN_INPUT
+
+        assert len(cache_key(long_prompt)) == CACHE_KEY_SIZE
+        assert cache_key(long_prompt) == cache_key(long_prompt)
+        assert cache_key(long_prompt) != cache_key(long_prompt + "y")
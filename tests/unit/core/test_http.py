@@ -0,0 +1,48 @@
+"""Unit tests for the shared HTTP client."""
+
+import asyncio
+
+import pytest
+
+from agent.utils.http import (
+    close_shared_http_client,
+    get_rate_limit_remaining,
+    get_shared_http_client,
+)
+
+
+async def _pool():
+    """Return the connection pool the shared client uses in the running loop."""
+    return get_shared_http_client()._transport._pool()
+
+
+@pytest.mark.unit
+@pytest.mark.agent
+class TestSharedHttpClient:
+    """Tests for get_shared_http_client."""
+
+    def test_client_shared(self):
+        """Test the same client is returned until it is closed."""
+        assert get_shared_http_client() is get_shared_http_client()
+
+    def test_pool_per_event_loop(self):
+        """Test each asyncio.run() loop gets its own connection pool."""
+
+        async def pools():
+            return await _pool(), await _pool()
+
+        first, again = asyncio.run(pools())
+        second, _ = asyncio.run(pools())
+
+        assert first is again
+        assert first is not second
+
+    def test_close_creates_new_client(self):
+        """Test closing drops the client and the recorded rate-limit budget."""
+        client = get_shared_http_client()
+
+        asyncio.run(close_shared_http_client())
+
+        assert client.is_closed
+        assert get_shared_http_client() is not client
+        assert get_rate_limit_remaining() is None
@@ -0,0 +1,81 @@
+"""Unit tests for prompt prefix serialization."""
+
+from unittest.mock import patch
+
+import pytest
+from agent_framework.openai import OpenAIChatClient
+
+from agent.prompt_prefix import PromptPrefix
+
+
+def hello(name: str) -> str:
+    """Say hello."""
+    return f"Hello, {name}!"
+
+
+def goodbye(name: str) -> str:
+    """Say goodbye."""
+    return f"Goodbye, {name}!"
+
+
+def _chat_agent(tools):
+    """Create a framework agent (no network calls are made)."""
+    client = OpenAIChatClient(api_key="test-key", model_id="gpt-5-mini")
+    return client.create_agent(instructions="You are helpful.", tools=tools)
+
+
+@pytest.mark.unit
+@pytest.mark.agent
+class TestPromptPrefix:
+    """Tests for PromptPrefix."""
+
+    def test_cached_per_agent(self):
+        """Test the prefix is serialized once per framework agent."""
+        chat_agent = _chat_agent([hello])
+
+        prefix = PromptPrefix.for_agent(chat_agent)
+
+        assert PromptPrefix.for_agent(chat_agent) is prefix
+        assert prefix.instructions == "You are helpful."
+        assert prefix.tools_summary["count"] == 1
+        assert prefix.tools_summary["tools"][0]["name"] == "hello"
+
+    def test_serialized_lazily(self):
+        """Test tool schemas are not serialized until a derived value is read."""
+        chat_agent = _chat_agent([hello])
+
+        with patch("agent.prompt_prefix._tool_schema", return_value={"name": "hello"}) as schema:
+            prefix = PromptPrefix.for_agent(chat_agent)
+            schema.assert_not_called()
+
+            assert prefix.prefix_id == prefix.prefix_id
+            schema.assert_called_once()
+
+    def test_prefix_id_ignores_tool_order(self):
+        """Test the prefix id depends on content, not tool order."""
+        first = PromptPrefix.for_agent(_chat_agent([hello, goodbye]))
+        second = PromptPrefix.for_agent(_chat_agent([goodbye, hello]))
+
+        assert first.prefix_id == second.prefix_id
+        assert first.prefix_id != PromptPrefix.for_agent(_chat_agent([hello])).prefix_id
+
+    def test_prefix_id_stable_after_tool_calls(self):
+        """Test invocation counters do not leak into the serialized prefix."""
+        chat_agent = _chat_agent([hello])
+        before = PromptPrefix("You are helpful.", chat_agent.chat_options.tools)
+        chat_agent.chat_options.tools[0].invocation_count += 1
+
+        after = PromptPrefix("You are helpful.", chat_agent.chat_options.tools)
+
+        assert before.serialized == after.serialized
+
+    def test_token_count_computed_once(self):
+        """Test prefixes with the same id share one token count."""
+        with patch("agent.utils.tokens.count_tokens", return_value=42) as count_tokens:
+            first = PromptPrefix("Unique instructions for token test", [])
+            second = PromptPrefix("Unique instructions for token test", [])
+
+            assert first.token_count == 42
+            assert second.token_count == 42
+
+        count_tokens.assert_called_once()
@@ -0,0 +1,146 @@
+"""Unit tests for agent.cache module."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from agent_framework import AgentRunResponse, ChatMessage, FunctionCallContent
+
+from agent.agent import Agent
+from agent.cache import ResponseCache, response_cache_key
+from tests.mocks import MockChatClient
+
+
+@pytest.mark.unit
+@pytest.mark.agent
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_key_depends_on_all_parts(self):
+        """Test key changes when prompt, system prompt or model changes."""
+        base = response_cache_key("hello", "system", "openai/gpt-5-mini")
+
+        assert base == response_cache_key("hello", "system", "openai/gpt-5-mini")
+        assert base != response_cache_key("hello!", "system", "openai/gpt-5-mini")
+        assert base != response_cache_key("hello", "other", "openai/gpt-5-mini")
+        assert base != response_cache_key("hello", "system", "openai/gpt-4o")
+        assert response_cache_key("ab", "c", "m") != response_cache_key("a", "bc", "m")
+
+    def test_get_set(self):
+        """Test stored responses are returned on exact match."""
+        cache = ResponseCache()
+        key = response_cache_key("hello", "system", "model")
+
+        assert cache.get(key) is None
+        cache.set(key, "Hi!")
+        assert cache.get(key) == "Hi!"
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full."""
+        cache = ResponseCache(max_entries=2)
+        a, b, c = (response_cache_key(p, "", "m") for p in ("a", "b", "c"))
+
+        cache.set(a, "A")
+        cache.set(b, "B")
+        cache.get(a)  # a is now most recently used
+        cache.set(c, "C")
+
+        assert cache.get(a) == "A"
+        assert cache.get(b) is None
+        assert cache.get(c) == "C"
+        assert len(cache) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test SQLite-backed entries are visible to a new cache instance."""
+        path = tmp_path / "response_cache.sqlite"
+        key = response_cache_key("hello", "system", "model")
+
+        first = ResponseCache(path)
+        first.set(key, "Hi!")
+        first.close()
+
+        second = ResponseCache(path)
+        assert second.get(key) == "Hi!"
+
+        second.clear()
+        assert second.get(key) is None
+        second.close()
+
+
+@pytest.mark.unit
+@pytest.mark.agent
+class TestAgentResponseCache:
+    """Tests for response caching in Agent.run."""
+
+    @pytest.fixture
+    def cached_agent(self, mock_settings):
+        """Agent with an in-memory response cache and a counting mock run."""
+        agent = Agent(settings=mock_settings, chat_client=MockChatClient(response="Cached"))
+        agent.response_cache = ResponseCache()
+        agent.agent.run = AsyncMock(return_value="Cached")
+        return agent
+
+    def test_cache_disabled_by_default(self, agent_instance):
+        """Test response cache is off unless enabled in settings."""
+        assert agent_instance.response_cache is None
+
+    def test_cache_enabled_from_settings(self, mock_settings, tmp_path):
+        """Test enabling the setting creates a persistent cache in the data dir."""
+        mock_settings.agent.data_dir = str(tmp_path)
+        mock_settings.agent.response_cache_enabled = True
+        mock_settings.memory.enabled = False
+
+        agent = Agent(settings=mock_settings, chat_client=MockChatClient())
+
+        assert agent.response_cache is not None
+        assert agent.response_cache.path == tmp_path / "response_cache.sqlite"
+        agent.close()
+        assert agent.response_cache._db is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_served_from_cache(self, cached_agent):
+        """Test identical stateless prompts only reach the LLM once."""
+        assert await cached_agent.run("hello") == "Cached"
+        assert await cached_agent.run("hello") == "Cached"
+
+        assert cached_agent.agent.run.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_threaded_runs_bypass_cache(self, cached_agent):
+        """Test runs with a thread always call the LLM."""
+        thread = object()
+        await cached_agent.run("hello", thread=thread)
+        await cached_agent.run("hello", thread=thread)
+
+        assert cached_agent.agent.run.await_count == 2
+        assert len(cached_agent.response_cache) == 0
+
+    def test_cache_disabled_with_memory(self, mock_settings, tmp_path):
+        """Test memory turns the cache off (memory adds stored context to each run)."""
+        mock_settings.agent.data_dir = str(tmp_path)
+        mock_settings.agent.response_cache_enabled = True
+        mock_settings.memory.enabled = True
+
+        agent = Agent(settings=mock_settings, chat_client=MockChatClient())
+
+        assert agent.response_cache is None
+
+    @pytest.mark.asyncio
+    async def test_tool_responses_not_stored(self, cached_agent):
+        """Test responses that called tools are not reused."""
+        cached_agent.agent.run = AsyncMock(
+            return_value=AgentRunResponse(
+                messages=[
+                    ChatMessage(
+                        role="assistant",
+                        contents=[FunctionCallContent(call_id="1", name="hello", arguments={})],
+                    ),
+                    ChatMessage(role="assistant", text="Hello, Alice!"),
+                ]
+            )
+        )
+
+        assert await cached_agent.run("hello") == "Hello, Alice!"
+        await cached_agent.run("hello")
+
+        assert cached_agent.agent.run.await_count == 2
+        assert len(cached_agent.response_cache) == 0
@@ -7,7 +7,12 @@ from unittest.mock import Mock, patch
 import pytest
 
 from agent.config.schema import AgentSettings
-from agent.memory.mem0_utils import create_memory_instance, extract_llm_config, get_storage_path
+from agent.memory.mem0_utils import (
+    create_memory_instance,
+    extract_llm_config,
+    get_embedding_model,
+    get_storage_path,
+)
 
 
 def _create_openai_config(model="gpt-5-mini", api_key="sk-test"):
@@ -114,6 +119,19 @@ class TestMem0Utils:
         assert llm_config["config"]["model"] == "gemini-pro"
         assert llm_config["config"]["api_key"] == "test-gemini-key"
 
+    def test_extract_llm_config_github(self):
+        """Test GitHub Models maps to mem0's OpenAI provider with an org-scoped base URL."""
+        config = AgentSettings()
+        config.providers.enabled = ["github"]
+        config.providers.github.token = "ghp_test"
+        config.providers.github.org = "my-org"
+
+        llm_config = extract_llm_config(config)
+
+        assert llm_config["provider"] == "openai"
+        assert llm_config["config"]["api_key"] == "ghp_test"
+        assert llm_config["config"]["openai_base_url"].endswith("/orgs/my-org/inference")
+
     def test_extract_llm_config_unknown_provider_raises_error(self):
         """Test unknown provider raises ValueError with strict validation."""
         config = AgentSettings()
@@ -123,6 +141,20 @@ class TestMem0Utils:
         with pytest.raises(ValueError, match="mem0 does not support 'unknown' provider"):
             extract_llm_config(config)
 
+    @pytest.mark.parametrize(
+        "provider,expected",
+        [
+            ("openai", "text-embedding-3-small"),
+            ("anthropic", "voyage-2"),
+            ("azure_openai", "text-embedding-3-small"),
+            ("gemini", "text-embedding-004"),
+            ("other", "text-embedding-3-small"),
+        ],
+    )
+    def test_get_embedding_model(self, provider, expected):
+        """Test embedding model selection per mem0 provider, with a default."""
+        assert get_embedding_model({"provider": provider, "config": {}}) == expected
+
     def test_get_storage_path_custom(self):
         """Test get_storage_path uses custom path if provided."""
         config = _create_openai_config()
@@ -191,6 +223,23 @@ class TestMem0Utils:
             assert call_args["vector_store"]["config"]["api_key"] == "mem0-key"
             assert call_args["vector_store"]["config"]["org_id"] == "org-123"
 
+    def test_create_memory_instance_reuses_instance_for_same_config(self):
+        """Test identical configs share one Memory instance and different ones don't."""
+        config = _create_openai_config()
+        config.agent.data_dir = "/tmp/data"
+
+        with patch("mem0.Memory") as mock_memory_class:
+            mock_memory_class.from_config.side_effect = lambda _: Mock()
+
+            first = create_memory_instance(config)
+            second = create_memory_instance(config)
+            config.providers.openai.api_key = "sk-other"
+            third = create_memory_instance(config)
+
+        assert first is second
+        assert third is not first
+        assert mock_memory_class.from_config.call_count == 2
+
     def test_create_memory_instance_missing_import_raises(self):
         """Test create_memory_instance raises clear error when mem0 not installed."""
         config = _create_openai_config()
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from agent.persistence import ThreadPersistence, _sanitize_conversation_name
+from agent.utils.serialization import json_dumps, json_loads
 
 
 @pytest.mark.unit
@@ -57,6 +58,27 @@ class TestSanitizeConversationName:
             _sanitize_conversation_name("CON")  # case insensitive
 
 
+@pytest.mark.unit
+@pytest.mark.persistence
+class TestJsonHelpers:
+    """Tests for the JSON (de)serialization helpers."""
+
+    def test_round_trip(self):
+        """Test data survives a dump/load round trip in both layouts."""
+        data = {"name": "café", "messages": [{"role": "user", "content": "hi"}], "n": 3}
+
+        assert json_loads(json_dumps(data)) == data
+        assert json_loads(json_dumps(data, indent=True)) == data
+
+    def test_json_fallback(self, monkeypatch):
+        """Test the standard library is used when orjson is not installed."""
+        monkeypatch.setattr("agent.utils.serialization.orjson", None)
+
+        assert json_dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        assert json_dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+        assert json_loads(b'{"a":1}') == {"a": 1}
+
+
 @pytest.mark.unit
 @pytest.mark.persistence
 class TestThreadPersistence:
@@ -116,6 +138,16 @@ class TestThreadPersistence:
         assert persistence.metadata == {"conversations": {}}
         assert "Failed to load metadata" in caplog.text
 
+    def test_save_metadata_replaces_index_atomically(self, persistence):
+        """Test _save_metadata leaves no temporary file and writes valid JSON."""
+        persistence.metadata["conversations"]["s1"] = {"name": "s1"}
+
+        persistence._save_metadata()
+
+        with open(persistence.metadata_file) as f:
+            assert json.load(f) == persistence.metadata
+        assert list(persistence.metadata_file.parent.glob("*.tmp")) == []
+
     def test_save_metadata_handles_write_error(self, persistence, monkeypatch):
         """Test _save_metadata handles write errors."""
         import builtins
@@ -303,6 +335,17 @@ class TestThreadPersistence:
         assert any(s["name"] == "session1" for s in sessions)
         assert any(s["name"] == "session2" for s in sessions)
 
+    def test_list_sessions_newest_first_with_limit(self, persistence):
+        """Test list_sessions sorts by created_at descending and applies limit."""
+        persistence.metadata["conversations"] = {
+            "old": {"name": "old", "created_at": "2025-01-01T10:00:00"},
+            "new": {"name": "new", "created_at": "2025-01-03T10:00:00"},
+            "mid": {"name": "mid", "created_at": "2025-01-02T10:00:00"},
+        }
+
+        assert [s["name"] for s in persistence.list_sessions()] == ["new", "mid", "old"]
+        assert [s["name"] for s in persistence.list_sessions(limit=2)] == ["new", "mid"]
+
     def test_list_sessions_empty(self, persistence):
         """Test list_sessions returns empty list when no sessions."""
         sessions = persistence.list_sessions()
@@ -0,0 +1,97 @@
+"""Unit tests for Anthropic chat client prompt caching."""
+
+import pytest
+from agent_framework import ChatMessage, ChatOptions, Role
+
+from agent.agent import Agent
+from agent.providers.anthropic import CACHED_INSTRUCTIONS_OPTION, CachingAnthropicClient
+
+INSTRUCTIONS = "You are a helpful assistant."
+
+
+def hello(name: str) -> str:
+    """Say hello."""
+    return f"Hello, {name}!"
+
+
+def goodbye(name: str) -> str:
+    """Say goodbye."""
+    return f"Goodbye, {name}!"
+
+
+@pytest.fixture
+def client():
+    """Caching Anthropic client with a dummy key (no network calls are made)."""
+    return CachingAnthropicClient(model_id="claude-haiku-4-5-20251001", api_key="test-key")
+
+
+def _run_options(client, system: str, **options):
+    """Build run options for a single user turn with the given system prompt."""
+    messages = [
+        ChatMessage(role=Role.SYSTEM, text=system),
+        ChatMessage(role=Role.USER, text="Hi"),
+    ]
+    return client._create_run_options(messages, ChatOptions(**options))
+
+
+@pytest.mark.unit
+@pytest.mark.providers
+class TestCachingAnthropicClient:
+    """Test cache_control breakpoints added to Anthropic requests."""
+
+    def test_system_prompt_marked_cacheable(self, client):
+        """Test the system prompt is sent as a cacheable text block."""
+        run_options = _run_options(client, INSTRUCTIONS)
+
+        assert run_options["system"] == [
+            {"type": "text", "text": INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_dynamic_suffix_split_from_cached_instructions(self, client):
+        """Test per-turn context appended to instructions is kept out of the cached block."""
+        run_options = _run_options(
+            client,
+            f"{INSTRUCTIONS}\nRelevant memories: none",
+            additional_properties={CACHED_INSTRUCTIONS_OPTION: INSTRUCTIONS},
+        )
+
+        assert run_options["system"] == [
+            {"type": "text", "text": INSTRUCTIONS, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "\nRelevant memories: none"},
+        ]
+        assert CACHED_INSTRUCTIONS_OPTION not in run_options
+
+    def test_last_tool_marked_cacheable(self, client):
+        """Test only the last tool schema carries the cache breakpoint."""
+        run_options = _run_options(client, INSTRUCTIONS, tools=[hello, goodbye])
+
+        tools = run_options["tools"]
+        assert "cache_control" not in tools[0]
+        assert tools[-1]["cache_control"] == {"type": "ephemeral"}
+
+
+@pytest.mark.unit
+@pytest.mark.providers
+class TestAgentPromptCacheOptions:
+    """Test Agent passes prompt cache options to the chat client."""
+
+    def test_anthropic_agent_uses_caching_client(self, mock_anthropic_settings):
+        """Test Anthropic agents get the caching client and their instructions as prefix."""
+        agent = Agent(settings=mock_anthropic_settings)
+
+        assert isinstance(agent.chat_client, CachingAnthropicClient)
+        assert agent._prompt_cache_options(INSTRUCTIONS) == {
+            CACHED_INSTRUCTIONS_OPTION: INSTRUCTIONS
+        }
+
+    def test_openai_prompt_cache_key_is_stable(self, mock_openai_settings, mock_chat_client):
+        """Test OpenAI agents send the same prompt_cache_key for the same instructions."""
+        agent = Agent(settings=mock_openai_settings, chat_client=mock_chat_client)
+
+        first = agent._prompt_cache_options(INSTRUCTIONS)
+        second = agent._prompt_cache_options(INSTRUCTIONS)
+
+        assert first is not None
+        assert first == second
+        assert first["prompt_cache_key"].startswith("agent-")
+        assert agent._prompt_cache_options("Other instructions") != first
@@ -1,5 +1,7 @@
 """Unit tests for skill loader."""
 
+import os
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -315,7 +317,6 @@ class TestSecurityChecks:
 
     def test_skip_symlinks_in_auto_discover(self, mock_settings, tmp_path):
         """Should skip symbolic links during auto-discovery."""
-        import os
 
         loader = SkillLoader(mock_settings)
 
@@ -358,6 +359,35 @@ class TestSecurityChecks:
         assert len(result) == 1
         assert skill1 in result
 
+    @pytest.mark.parametrize("threads", ["1", "4", "invalid"])
+    def test_scan_matches_directory_listing(self, mock_settings, tmp_path, monkeypatch, threads):
+        """Should find the same skills in listing order for any scan thread count."""
+        monkeypatch.setenv("AGENT_SKILL_SCAN_THREADS", threads)
+        loader = SkillLoader(mock_settings)
+        for n in range(10):
+            skill = tmp_path / f"skill{n}"
+            skill.mkdir()
+            if n % 3:
+                (skill / "SKILL.md").write_text("---\nname: skill\ndescription: test\n---\n")
+        (tmp_path / "skill0" / "SKILL.md").mkdir()  # Directory named SKILL.md is not a manifest
+
+        expected = [
+            Path(entry.path)
+            for entry in os.scandir(tmp_path)
+            if (Path(entry.path) / "SKILL.md").is_file()
+        ]
+
+        assert loader.scan_skill_directory(tmp_path) == expected
+        assert len(expected) == 6
+
+    def test_scan_file_path_returns_empty(self, mock_settings, tmp_path):
+        """Should return empty list when the path is a file, not a directory."""
+        loader = SkillLoader(mock_settings)
+        path = tmp_path / "skills.txt"
+        path.write_text("not a directory")
+
+        assert loader.scan_skill_directory(path) == []
+
 
 class TestToolsetImporting:
     """Test toolset importing functionality."""
@@ -621,6 +651,30 @@ class TestLoadEnabledSkills:
         # Should load good-skill despite bad-skill failing
         assert script_wrapper is None
 
+    def test_many_skills_loaded_in_directory_order(self, mock_settings, tmp_path):
+        """Should keep discovery order when skills are loaded concurrently."""
+        bundled_dir = tmp_path / "bundled"
+        bundled_dir.mkdir()
+
+        names = [f"skill{n}" for n in range(12)]
+        for name in names:
+            skill = bundled_dir / name
+            skill.mkdir()
+            (skill / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {name}\n---\n")
+        (bundled_dir / "broken").mkdir()
+        (bundled_dir / "broken" / "SKILL.md").write_text("invalid yaml {]")
+
+        mock_settings.skills.disabled_bundled = []
+        mock_settings.skills.bundled_dir = str(bundled_dir)
+
+        loader = SkillLoader(mock_settings)
+        expected = [
+            path.name for path in loader.scan_skill_directory(bundled_dir) if path.name != "broken"
+        ]
+        _, _, skill_docs = loader.load_enabled_skills()
+
+        assert [m["name"] for m in skill_docs.get_all_metadata()] == expected
+
     def test_skill_name_matching_case_insensitive(self, mock_settings, tmp_path):
         """Should match skill names case-insensitively when checking disabled list."""
         bundled_dir = tmp_path / "bundled"
@@ -130,6 +130,12 @@ class TestNormalizeSkillName:
         with pytest.raises(SkillSecurityError):
             normalize_skill_name("skill with spaces")
 
+    def test_invalid_names_raise_on_every_call(self):
+        """Should not cache validation failures."""
+        for _ in range(2):
+            with pytest.raises(SkillSecurityError):
+                normalize_skill_name("../invalid")
+
 
 class TestNormalizeScriptName:
     """Test normalize_script_name function."""
@@ -175,7 +181,7 @@ class TestConfirmUntrustedInstall:
 class TestPinCommitSha:
     """Test pin_commit_sha function."""
 
-    @patch("agent.skills.security.Repo")
+    @patch("git.Repo")
     def test_get_sha_from_branch(self, mock_repo_class):
         """Should get commit SHA from branch HEAD."""
         # Mock repository
@@ -190,7 +196,7 @@ class TestPinCommitSha:
         assert sha == "abc123def456"
         mock_repo_class.assert_called_once_with(repo_path)
 
-    @patch("agent.skills.security.Repo")
+    @patch("git.Repo")
     def test_get_sha_from_detached_head(self, mock_repo_class):
         """Should get commit SHA from detached HEAD."""
         # Mock detached HEAD
@@ -204,7 +210,7 @@ class TestPinCommitSha:
 
         assert sha == "detached123"
 
-    @patch("agent.skills.security.Repo")
+    @patch("git.Repo")
     def test_invalid_repo_raises_error(self, mock_repo_class):
         """Should raise SkillSecurityError for invalid repo."""
         mock_repo_class.side_effect = Exception("Not a git repository")
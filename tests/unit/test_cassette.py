@@ -0,0 +1,125 @@
+"""Unit tests for the record/replay agent used by LLM integration tests."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tests.mocks.cassette import CassetteAgent, cassette_path
+
+
+class _RealAgent:
+    """Stand-in for a framework agent that answers every prompt the same way."""
+
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+        self.calls = 0
+
+    async def run(self, prompt: str) -> str:
+        self.calls += 1
+        return "".join(self.chunks)
+
+    async def run_stream(self, prompt: str):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _write(cassette_dir, prompt, **fields):
+    """Write a cassette for a prompt."""
+    path = cassette_path(prompt, cassette_dir)
+    path.write_text(json.dumps({"prompt": prompt, **fields}), encoding="utf-8")
+
+
+async def _collect(stream, limit=None):
+    """Collect chunks from a stream, closing it after limit chunks."""
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        if limit is not None and len(chunks) >= limit:
+            break
+    await stream.aclose()
+    return chunks
+
+
+@pytest.mark.unit
+class TestCassetteAgent:
+    """Tests for CassetteAgent."""
+
+    def test_cassette_path_named_by_prompt_hash(self, tmp_path):
+        """Test cassettes are named by the SHA-256 of the prompt."""
+        path = cassette_path("Say hello", tmp_path)
+
+        assert path.parent == tmp_path
+        assert path == cassette_path("Say hello", tmp_path)
+        assert path != cassette_path("Say goodbye", tmp_path)
+        assert len(path.stem) == 64
+
+    @pytest.mark.asyncio
+    async def test_replays_run_and_stream(self, tmp_path):
+        """Test recorded responses and chunks are returned without a real agent."""
+        _write(tmp_path, "Say hello", response="Hello!", chunks=["Hel", "lo!"])
+        agent = CassetteAgent(cassette_dir=tmp_path)
+
+        assert await agent.run("Say hello") == "Hello!"
+        assert await _collect(agent.run_stream("Say hello")) == ["Hel", "lo!"]
+
+    @pytest.mark.asyncio
+    async def test_skips_when_not_recorded(self, tmp_path):
+        """Test a prompt without a cassette is skipped when there is no real agent."""
+        agent = CassetteAgent(cassette_dir=tmp_path)
+
+        with pytest.raises(pytest.skip.Exception):
+            await agent.run("Say hello")
+        with pytest.raises(pytest.skip.Exception):
+            await _collect(agent.run_stream("Say hello"))
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        """Test recorded responses are replayed later without calling the real agent."""
+        real = _RealAgent(["Hel", "lo!"])
+        recorder = CassetteAgent(real, cassette_dir=tmp_path, replay=False, record=True)
+
+        assert await recorder.run("Say hello") == "Hello!"
+        assert await _collect(recorder.run_stream("Say hello")) == ["Hel", "lo!"]
+
+        player = CassetteAgent(cassette_dir=tmp_path)
+        assert await player.run("Say hello") == "Hello!"
+        assert await _collect(player.run_stream("Say hello")) == ["Hel", "lo!"]
+        assert real.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_live_fallback_does_not_record(self, tmp_path):
+        """Test prompts without a cassette call the real agent without writing one."""
+        real = _RealAgent(["Hello!"])
+        agent = CassetteAgent(real, cassette_dir=tmp_path)
+
+        assert await agent.run("Say hello") == "Hello!"
+        assert real.calls == 1
+        assert not cassette_path("Say hello", tmp_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_partial_stream_recorded(self, tmp_path):
+        """Test chunks received before the consumer stops are still saved."""
+        agent = CassetteAgent(_RealAgent(["a", "b", "c"]), cassette_dir=tmp_path, record=True)
+
+        assert await _collect(agent.run_stream("Say hello"), limit=2) == ["a", "b"]
+
+        recorded = json.loads(cassette_path("Say hello", tmp_path).read_text(encoding="utf-8"))
+        assert recorded["chunks"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_pace_reserves_slots(self, tmp_path, monkeypatch):
+        """Test concurrent real requests are spaced min_interval apart."""
+        monkeypatch.setattr(CassetteAgent, "_last_request", 0.0)
+        agent = CassetteAgent(_RealAgent(["Hi"]), cassette_dir=tmp_path, min_interval=5.0)
+
+        with (
+            patch("tests.mocks.cassette.time.monotonic", return_value=100.0),
+            patch("tests.mocks.cassette.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            await agent._pace()
+            await agent._pace()
+            await agent._pace()
+
+        assert [call.args[0] for call in sleep.await_args_list] == [5.0, 10.0]